@@ -13,19 +13,50 @@
 # that they have been altered from the originals.
 
 """Assemble function for converting a list of circuits into a qobj"""
+from collections import namedtuple
+from types import SimpleNamespace
+
+import numpy as np
+
+from qiskit.circuit import Gate, Instruction
+from qiskit.exceptions import QiskitError
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
-                         QasmQobjConfig)
+                         QasmQobjConfig, ColumnarQasmQobjExperiment)
+from qiskit.tools.parallel import parallel_map
+from qiskit.validation import validation_policy
+
+# The parts of an experiment that only depend on the registers of a circuit:
+# its validated header and config, the flat index of each bit keyed by
+# (register name, index), and for each classical register its mask and the
+# (flat index, index in register) of its bits, used to convert conditionals.
+_RegisterLayout = namedtuple('_RegisterLayout', ['header', 'config', 'qubit_indices',
+                                                 'clbit_indices', 'creg_bits'])
 
+# The assemble methods of the instructions whose qobj fields are read
+# directly from the instruction for columnar experiments.
+_DEFAULT_ASSEMBLE = (Instruction.assemble, Gate.assemble)
 
-def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
+
+def assemble_circuits(circuits, run_config, qobj_id, qobj_header, parameter_binds=None,
+                      columnar=False):
     """Assembles a list of circuits into a qobj which can be run on the backend.
 
+    The circuits are assembled with ``parallel_map``, and the experiments are
+    in the order of ``circuits`` whether or not they run in parallel.
+
     Args:
         circuits (list[QuantumCircuit]): circuit(s) to assemble
         qobj_id (int): identifier for the generated qobj
         qobj_header (QobjHeader): header to pass to the results
         run_config (RunConfig): configuration of the runtime environment
+        parameter_binds (list[dict{Parameter: Value}]): if given, each circuit
+            is assembled once and an experiment is generated for each bind,
+            with the parameter values substituted into the assembled
+            instructions.
+        columnar (bool): if True, the experiments are
+            ``ColumnarQasmQobjExperiment`` objects, and no
+            ``QasmQobjInstruction`` model is built or validated.
 
     Returns:
         QasmQobj: the Qobj to be run on the backends
@@ -34,100 +65,24 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
     if run_config:
         qobj_config = QasmQobjConfig(**run_config.to_dict())
 
+    # Circuits with the same registers share their layout. The cache is only
+    # shared when the circuits are assembled serially; each worker process
+    # gets its own copy.
+    assembled = parallel_map(_assemble_circuit, list(circuits), task_args=({}, columnar))
+
     # Pack everything into the Qobj
     experiments = []
     max_n_qubits = 0
     max_memory_slots = 0
-    for circuit in circuits:
-        # header stuff
-        n_qubits = 0
-        memory_slots = 0
-        qubit_labels = []
-        clbit_labels = []
-
-        qreg_sizes = []
-        creg_sizes = []
-        for qreg in circuit.qregs:
-            qreg_sizes.append([qreg.name, qreg.size])
-            for j in range(qreg.size):
-                qubit_labels.append([qreg.name, j])
-            n_qubits += qreg.size
-        for creg in circuit.cregs:
-            creg_sizes.append([creg.name, creg.size])
-            for j in range(creg.size):
-                clbit_labels.append([creg.name, j])
-            memory_slots += creg.size
-
-        # TODO: why do we need creq_sizes and qreg_sizes in header
-        # TODO: we need to rethink memory_slots as they are tied to classical bit
-        header = QobjExperimentHeader(qubit_labels=qubit_labels,
-                                      n_qubits=n_qubits,
-                                      qreg_sizes=qreg_sizes,
-                                      clbit_labels=clbit_labels,
-                                      memory_slots=memory_slots,
-                                      creg_sizes=creg_sizes,
-                                      name=circuit.name)
-        # TODO: why do we need n_qubits and memory_slots in both the header and the config
-        config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
-
-        # Convert conditionals from QASM-style (creg ?= int) to qobj-style
-        # (register_bit ?= 1), by assuming device has unlimited register slots
-        # (supported only for simulators). Map all measures to a register matching
-        # their clbit_index, create a new register slot for every conditional gate
-        # and add a bfunc to map the creg=val mask onto the gating register bit.
-
-        is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
-        max_conditional_idx = 0
-
-        instructions = []
-        for op_context in circuit.data:
-            instruction = op_context[0].assemble()
+    for experiment, parameter_locations in assembled:
+        if parameter_binds:
+            experiments.extend(_bind_experiment(experiment, parameter_locations,
+                                                parameter_binds))
+        else:
+            experiments.append(experiment)
 
-            # Add register attributes to the instruction
-            qargs = op_context[1]
-            cargs = op_context[2]
-            if qargs:
-                qubit_indices = [qubit_labels.index([qubit.register.name, qubit.index])
-                                 for qubit in qargs]
-                instruction.qubits = qubit_indices
-            if cargs:
-                clbit_indices = [clbit_labels.index([clbit.register.name, clbit.index])
-                                 for clbit in cargs]
-                instruction.memory = clbit_indices
-                # If the experiment has conditional instructions, assume every
-                # measurement result may be needed for a conditional gate.
-                if instruction.name == "measure" and is_conditional_experiment:
-                    instruction.register = clbit_indices
-
-            # To convert to a qobj-style conditional, insert a bfunc prior
-            # to the conditional instruction to map the creg ?= val condition
-            # onto a gating register bit.
-            if hasattr(instruction, '_control'):
-                ctrl_reg, ctrl_val = instruction._control
-                mask = 0
-                val = 0
-                for clbit in clbit_labels:
-                    if clbit[0] == ctrl_reg.name:
-                        mask |= (1 << clbit_labels.index(clbit))
-                        val |= (((ctrl_val >> clbit[1]) & 1) << clbit_labels.index(clbit))
-
-                conditional_reg_idx = memory_slots + max_conditional_idx
-                conversion_bfunc = QasmQobjInstruction(name='bfunc',
-                                                       mask="0x%X" % mask,
-                                                       relation='==',
-                                                       val="0x%X" % val,
-                                                       register=conditional_reg_idx)
-                instructions.append(conversion_bfunc)
-                instruction.conditional = conditional_reg_idx
-                max_conditional_idx += 1
-                # Delete control attribute now that we have replaced it with
-                # the conditional and bfuc
-                del instruction._control
-
-            instructions.append(instruction)
-
-        experiments.append(QasmQobjExperiment(instructions=instructions, header=header,
-                                              config=config))
+        n_qubits = experiment.config.n_qubits
+        memory_slots = experiment.config.memory_slots
         if n_qubits > max_n_qubits:
             max_n_qubits = n_qubits
         if memory_slots > max_memory_slots:
@@ -140,3 +95,277 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
                     config=qobj_config,
                     experiments=experiments,
                     header=qobj_header)
+
+
+def _register_layout(circuit, layout_cache=None):
+    """Return the _RegisterLayout of ``circuit``, from ``layout_cache`` if it has it.
+
+    Args:
+        circuit (QuantumCircuit): circuit to get the layout of.
+        layout_cache (dict): layouts keyed by the names and sizes of the
+            registers, updated with the layout of ``circuit``.
+
+    Returns:
+        _RegisterLayout: the layout of the registers of ``circuit``.
+    """
+    key = (tuple((qreg.name, qreg.size) for qreg in circuit.qregs),
+           tuple((creg.name, creg.size) for creg in circuit.cregs))
+    if layout_cache is not None and key in layout_cache:
+        return layout_cache[key]
+
+    qubit_labels = []
+    clbit_labels = []
+    qubit_indices = {}
+    clbit_indices = {}
+    creg_bits = {}
+    for name, size in key[0]:
+        for j in range(size):
+            qubit_indices[(name, j)] = len(qubit_labels)
+            qubit_labels.append([name, j])
+    for name, size in key[1]:
+        bits = []
+        for j in range(size):
+            bits.append((len(clbit_labels), j))
+            clbit_indices[(name, j)] = len(clbit_labels)
+            clbit_labels.append([name, j])
+        creg_bits[name] = (sum(1 << index for index, _ in bits), bits)
+    n_qubits = len(qubit_labels)
+    memory_slots = len(clbit_labels)
+
+    # TODO: why do we need creq_sizes and qreg_sizes in header
+    # TODO: we need to rethink memory_slots as they are tied to classical bit
+    header = QobjExperimentHeader(qubit_labels=qubit_labels,
+                                  n_qubits=n_qubits,
+                                  qreg_sizes=[[name, size] for name, size in key[0]],
+                                  clbit_labels=clbit_labels,
+                                  memory_slots=memory_slots,
+                                  creg_sizes=[[name, size] for name, size in key[1]])
+    # TODO: why do we need n_qubits and memory_slots in both the header and the config
+    config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
+
+    layout = _RegisterLayout(header, config, qubit_indices, clbit_indices, creg_bits)
+    if layout_cache is not None:
+        layout_cache[key] = layout
+    return layout
+
+
+def _assemble_circuit(circuit, layout_cache=None, columnar=False):
+    """Assemble a circuit into a qobj experiment.
+
+    Args:
+        circuit (QuantumCircuit): circuit to assemble.
+        layout_cache (dict): cache of register layouts shared by the
+            circuits of a batch, see ``_register_layout``.
+        columnar (bool): if True, assemble a ``ColumnarQasmQobjExperiment``.
+
+    Returns:
+        tuple(QasmQobjExperiment, list): the experiment, and the locations of
+            the unbound parameters in it as (instruction index, param index,
+            ParameterExpression) tuples.
+    """
+    layout = _register_layout(circuit, layout_cache)
+    qubit_indices = layout.qubit_indices
+    clbit_indices = layout.clbit_indices
+    memory_slots = layout.config.memory_slots
+
+    # The header and config of the layout were validated when it was built;
+    # the label lists are shared between the experiments using it.
+    header = _copy_model(layout.header)
+    header.name = circuit.name
+    config = _copy_model(layout.config)
+
+    # The parameter table of the circuit tells which instructions have
+    # unbound parameters: {id(instruction): [param_index, ...]}
+    parameter_table = circuit._parameter_table  # pylint: disable=protected-access
+    parameterized = {}
+    for parameter_locations in parameter_table.values():
+        for instr, param_index in parameter_locations:
+            parameterized.setdefault(id(instr), set()).add(param_index)
+    parameter_locations = []
+
+    # Convert conditionals from QASM-style (creg ?= int) to qobj-style
+    # (register_bit ?= 1), by assuming device has unlimited register slots
+    # (supported only for simulators). Map all measures to a register matching
+    # their clbit_index, create a new register slot for every conditional gate
+    # and add a bfunc to map the creg=val mask onto the gating register bit.
+
+    is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
+    max_conditional_idx = 0
+
+    if columnar:
+        experiment = ColumnarQasmQobjExperiment(header=header, config=config)
+        add_instruction = experiment.append_instruction
+    else:
+        instructions = []
+        add_instruction = instructions.append
+    num_instructions = 0
+
+    for op_context in circuit.data:
+        if columnar:
+            instruction = SimpleNamespace(**_instruction_fields(op_context[0]))
+        else:
+            instruction = op_context[0].assemble()
+
+        # Add register attributes to the instruction
+        qargs = op_context[1]
+        cargs = op_context[2]
+        if qargs:
+            instruction.qubits = [qubit_indices[(qubit.register.name, qubit.index)]
+                                  for qubit in qargs]
+        if cargs:
+            memory = [clbit_indices[(clbit.register.name, clbit.index)]
+                      for clbit in cargs]
+            instruction.memory = memory
+            # If the experiment has conditional instructions, assume every
+            # measurement result may be needed for a conditional gate.
+            if instruction.name == "measure" and is_conditional_experiment:
+                instruction.register = memory
+
+        # To convert to a qobj-style conditional, insert a bfunc prior
+        # to the conditional instruction to map the creg ?= val condition
+        # onto a gating register bit.
+        if hasattr(instruction, '_control'):
+            ctrl_reg, ctrl_val = instruction._control
+            mask, bits = layout.creg_bits.get(ctrl_reg.name, (0, ()))
+            val = 0
+            for index, j in bits:
+                val |= ((ctrl_val >> j) & 1) << index
+
+            conditional_reg_idx = memory_slots + max_conditional_idx
+            bfunc_fields = dict(name='bfunc',
+                                mask="0x%X" % mask,
+                                relation='==',
+                                val="0x%X" % val,
+                                register=conditional_reg_idx)
+            add_instruction(bfunc_fields if columnar else QasmQobjInstruction(**bfunc_fields))
+            num_instructions += 1
+            instruction.conditional = conditional_reg_idx
+            max_conditional_idx += 1
+            # Delete control attribute now that we have replaced it with
+            # the conditional and bfuc
+            del instruction._control
+
+        for param_index in sorted(parameterized.get(id(op_context[0]), ())):
+            parameter_locations.append((num_instructions, param_index,
+                                        op_context[0].params[param_index]))
+
+        add_instruction(instruction)
+        num_instructions += 1
+
+    if not columnar:
+        experiment = QasmQobjExperiment(instructions=instructions, header=header, config=config)
+    return experiment, parameter_locations
+
+
+def _instruction_fields(operation):
+    """Return the qobj fields of ``operation`` as a dict.
+
+    Instructions assembled by ``Instruction.assemble`` or ``Gate.assemble``
+    are read directly, without building a ``QasmQobjInstruction``.
+
+    Args:
+        operation (Instruction): instruction to read the fields of.
+
+    Returns:
+        dict: the qobj fields of the instruction, with its condition as
+            ``_control`` if it has one.
+    """
+    if type(operation).assemble not in _DEFAULT_ASSEMBLE:
+        return dict(operation.assemble().__dict__)
+    fields = {'name': operation.name}
+    if operation.params:
+        fields['params'] = operation._assemble_params()  # pylint: disable=protected-access
+    if isinstance(operation, Gate) and operation.label:
+        fields['label'] = operation.label
+    if operation.control:
+        fields['_control'] = operation.control
+    return fields
+
+
+def _bind_experiment(experiment, parameter_locations, parameter_binds):
+    """Return a copy of ``experiment`` for each bind in ``parameter_binds``.
+
+    Each parameter expression is evaluated once for all the binds, and the
+    values are substituted as floats. Only the instructions with parameters
+    are copied; the others are shared between the returned experiments.
+
+    Columnar experiments only copy their parameter pool for each bind.
+
+    Args:
+        experiment (QasmQobjExperiment or ColumnarQasmQobjExperiment): the
+            assembled experiment, with unbound parameters.
+        parameter_locations (list): the (instruction index, param index,
+            ParameterExpression) tuples returned by ``_assemble_circuit``.
+        parameter_binds (list[dict{Parameter: Value}]): the values to bind.
+
+    Returns:
+        list: an experiment of the type of ``experiment`` for each bind.
+
+    Raises:
+        QiskitError: if a value in parameter_binds is not a real number.
+    """
+    num_binds = len(parameter_binds)
+    parameter_values = {}
+    expression_values = {}
+    for _, _, expression in parameter_locations:
+        if id(expression) in expression_values:
+            continue
+        for parameter in expression.parameters:
+            if parameter not in parameter_values:
+                try:
+                    parameter_values[parameter] = np.array(
+                        [binds[parameter] for binds in parameter_binds], dtype=float)
+                except (TypeError, ValueError):
+                    raise QiskitError('Expression parameters must be real numbers: '
+                                      '{}'.format(parameter))
+        # pylint: disable=protected-access
+        expression_values[id(expression)] = expression._evaluate_array(
+            {parameter: parameter_values[parameter]
+             for parameter in expression.parameters}).tolist()
+
+    experiments = []
+    if isinstance(experiment, ColumnarQasmQobjExperiment):
+        pool_indices = [(experiment.param_index(instruction_index, param_index),
+                         expression_values[id(expression)])
+                        for instruction_index, param_index, expression in parameter_locations]
+        for bind_index in range(num_binds):
+            bound_experiment = experiment.copy_with_params(
+                {index: values[bind_index] for index, values in pool_indices})
+            bound_experiment.header = _copy_model(experiment.header)
+            bound_experiment.config = _copy_model(experiment.config)
+            experiments.append(bound_experiment)
+        return experiments
+
+    for bind_index in range(num_binds):
+        instructions = list(experiment.instructions)
+        for instruction_index, param_index, expression in parameter_locations:
+            instruction = instructions[instruction_index]
+            if instruction is experiment.instructions[instruction_index]:
+                instruction = _copy_model(instruction)
+                instruction.params = list(instruction.params)
+                instructions[instruction_index] = instruction
+            instruction.params[param_index] = expression_values[id(expression)][bind_index]
+        bound_experiment = _copy_model(experiment)
+        bound_experiment.instructions = instructions
+        bound_experiment.header = _copy_model(experiment.header)
+        bound_experiment.config = _copy_model(experiment.config)
+        experiments.append(bound_experiment)
+    return experiments
+
+
+def _copy_model(model):
+    """Return a shallow copy of a qobj model.
+
+    The copy is built with the constructor of the model, with validation
+    off: its fields are those of ``model``, which was validated when it was
+    built.
+
+    Args:
+        model (BaseModel): model to copy.
+
+    Returns:
+        BaseModel: a model of the same class, sharing the field values of
+            ``model``.
+    """
+    with validation_policy('off'):
+        return model.__class__(**model.__dict__)
@@ -182,14 +182,7 @@ class Instruction:
         instruction = QasmQobjInstruction(name=self.name)
         # Evaluate parameters
         if self.params:
-            params = [
-                x.evalf() if hasattr(x, 'evalf') else x for x in self.params
-            ]
-            params = [
-                sympy.matrix2numpy(x, dtype=complex) if isinstance(
-                    x, sympy.Matrix) else x for x in params
-            ]
-            instruction.params = params
+            instruction.params = self._assemble_params()
         # Add placeholder for qarg and carg params
         if self.num_qubits:
             instruction.qubits = list(range(self.num_qubits))
@@ -202,6 +195,16 @@ class Instruction:
             instruction._control = self.control
         return instruction
 
+    def _assemble_params(self):
+        """Return the parameters of the instruction evaluated for a qobj."""
+        params = [
+            x.evalf() if hasattr(x, 'evalf') else x for x in self.params
+        ]
+        return [
+            sympy.matrix2numpy(x, dtype=complex) if isinstance(
+                x, sympy.Matrix) else x for x in params
+        ]
+
     def mirror(self):
         """For a composite instruction, reverse the order of sub-gates.
 
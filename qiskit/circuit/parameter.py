@@ -15,6 +15,7 @@
 Parameter Class for variable parameters.
 """
 
+import operator
 from uuid import uuid4
 
 import sympy
@@ -55,6 +56,10 @@ class Parameter(ParameterExpression):
         """Substitute self with the corresponding parameter in parameter_map."""
         return parameter_map[self]
 
+    def _get_evaluator(self):
+        # Not cached, as the evaluator refers to self
+        return operator.itemgetter(self)
+
     @property
     def name(self):
         """Returns the name of the Parameter."""
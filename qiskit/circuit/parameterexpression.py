@@ -40,6 +40,15 @@ class ParameterExpression():
         """
         self._parameter_symbols = symbol_map
         self._symbol_expr = expr
+        # Function of a {Parameter: value} dict evaluating the expression
+        # numerically, compiled on first use. See _get_evaluator.
+        self._evaluator = None
+        # (operation, left, right) if the expression was built by
+        # _apply_operation, so its evaluator can be composed from the
+        # evaluators of its operands. Operands built by _apply_operation are
+        # replaced by their own operation, so the intermediate expressions
+        # are not kept alive; the others are kept as they are.
+        self._operation = None
 
     @property
     def parameters(self):
@@ -68,6 +77,20 @@ class ParameterExpression():
         self._raise_if_passed_unknown_parameters(parameter_values.keys())
         self._raise_if_passed_non_real_value(parameter_values)
 
+        if parameter_values.keys() == self._parameter_symbols.keys():
+            # Fully bound, so the value can be computed numerically.
+            try:
+                with numpy.errstate(divide='ignore', invalid='ignore'):
+                    value = self._get_evaluator()(parameter_values)
+            except ZeroDivisionError:
+                value = numpy.inf
+            if numpy.isinf(value):
+                raise ZeroDivisionError('Binding provided for expression '
+                                        'results in division by zero '
+                                        '(Expression: {}, Bindings: {}).'.format(
+                                            self, parameter_values))
+            return ParameterExpression({}, sympy.sympify(value))
+
         symbol_values = {self._parameter_symbols[parameter]: value
                          for parameter, value in parameter_values.items()}
         bound_symbol_expr = self._symbol_expr.subs(symbol_values)
@@ -89,6 +112,61 @@ class ParameterExpression():
 
         return ParameterExpression(free_parameter_symbols, bound_symbol_expr)
 
+    def _evaluate_array(self, parameter_values):
+        """Evaluates the expression for arrays of values of all its parameters.
+
+        Args:
+            parameter_values (dict): Mapping of every Parameter in self to a
+                                     1-d numpy array of values. All the arrays
+                                     have the same length.
+
+        Raises:
+            ZeroDivisionError:
+                - If the expression is infinite for some of the values.
+
+        Returns:
+            numpy.ndarray: the values of the expression, one per element of
+                the arrays.
+        """
+
+        arrays = [parameter_values[parameter] for parameter in self._parameter_symbols]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            values = self._get_evaluator()(parameter_values)
+        # Expressions which reduce to a constant evaluate to a scalar
+        values = numpy.real_if_close(numpy.broadcast_to(values, numpy.broadcast(*arrays).shape))
+        if numpy.isinf(values).any():
+            raise ZeroDivisionError('Binding provided for expression '
+                                    'results in division by zero '
+                                    '(Expression: {}).'.format(self))
+        return values
+
+    def _get_evaluator(self):
+        """Returns the cached numerical evaluator of the expression.
+
+        The evaluator is a function of a {Parameter: value} dict, where values
+        are numbers or numpy arrays. Expressions built by operations on other
+        expressions compose the evaluators of their operands; other
+        expressions are compiled with sympy.lambdify.
+
+        Returns:
+            function: the evaluator.
+        """
+
+        if self._evaluator is None:
+            if self._operation is not None:
+                evaluator = _compose_evaluator(self._operation)
+            else:
+                parameters = list(self._parameter_symbols)
+                function = sympy.lambdify([self._parameter_symbols[parameter]
+                                           for parameter in parameters],
+                                          self._symbol_expr, 'numpy')
+
+                def evaluator(parameter_values):
+                    return function(*[parameter_values[parameter]
+                                      for parameter in parameters])
+            self._evaluator = evaluator
+        return self._evaluator
+
     def subs(self, parameter_map):
         """Returns a new Expression with replacement Parameters.
 
@@ -191,10 +269,14 @@ class ParameterExpression():
 
         if reflected:
             expr = operation(other_expr, self_expr)
+            operands = (other, self)
         else:
             expr = operation(self_expr, other_expr)
+            operands = (self, other)
 
-        return ParameterExpression(parameter_symbols, expr)
+        result = ParameterExpression(parameter_symbols, expr)
+        result._operation = (operation,) + tuple(_operand_node(operand) for operand in operands)
+        return result
 
     def __add__(self, other):
         return self._apply_operation(operator.add, other)
@@ -240,3 +322,73 @@ class ParameterExpression():
 
     def __deepcopy__(self, memo=None):
         return self
+
+    def __getstate__(self):
+        # Compiled evaluators cannot be pickled, and the operands would make
+        # pickles of expressions grow with the history of their operations.
+        state = self.__dict__.copy()
+        state['_evaluator'] = None
+        state['_operation'] = None
+        return state
+
+
+def _operand_node(operand):
+    """Returns the node of an operand of _apply_operation in an operation tree.
+
+    Expressions built by _apply_operation are replaced by their operation;
+    other expressions and numbers are leaves of the tree.
+    """
+    if isinstance(operand, ParameterExpression) and operand._operation is not None:
+        return operand._operation  # pylint: disable=protected-access
+    return operand
+
+
+def _compose_evaluator(operation):
+    """Returns the evaluator of an (operation, left, right) tree.
+
+    The tree is flattened into a list of steps without recursion, so deep
+    trees, e.g. the sum of hundreds of Parameters, do not exceed the
+    recursion limit. Nodes shared in the tree are evaluated once.
+
+    Args:
+        operation (tuple): the _operation of a ParameterExpression.
+
+    Returns:
+        function: the evaluator of the tree, see
+            ParameterExpression._get_evaluator.
+    """
+    # Each step is (function, left, right): leaves call function with the
+    # parameter values, and operations with the values of the steps at
+    # indices left and right.
+    steps = []
+    step_indices = {}
+    stack = [operation]
+    while stack:
+        node = stack[-1]
+        if id(node) in step_indices:
+            stack.pop()
+            continue
+        if isinstance(node, tuple):
+            function, left, right = node
+            pending = [operand for operand in (right, left) if id(operand) not in step_indices]
+            if pending:
+                stack.extend(pending)
+                continue
+            steps.append((function, step_indices[id(left)], step_indices[id(right)]))
+        elif isinstance(node, ParameterExpression):
+            steps.append((node._get_evaluator(), None, None))  # pylint: disable=protected-access
+        else:
+            steps.append((lambda parameter_values, value=node: value, None, None))
+        step_indices[id(node)] = len(steps) - 1
+        stack.pop()
+
+    def evaluator(parameter_values):
+        values = []
+        for function, left, right in steps:
+            if left is None:
+                values.append(function(parameter_values))
+            else:
+                values.append(function(values[left], values[right]))
+        return values[-1]
+
+    return evaluator
@@ -28,6 +28,7 @@ class ParameterTable(MutableMapping):
            {var_object: [(instruction_object, parameter_index), ...]}
         """
         self._table = dict(*args, **kwargs)
+        self._names = {parameter.name for parameter in self._table}
 
     def __getitem__(self, key):
         return self._table[key]
@@ -45,9 +46,15 @@ class ParameterTable(MutableMapping):
             assert isinstance(instruction, Instruction)
             assert isinstance(param_index, int)
         self._table[parameter] = instr_params
+        self._names.add(parameter.name)
 
     def __delitem__(self, key):
         del self._table[key]
+        self._names.discard(key.name)
+
+    def get_names(self):
+        """Return the set of the names of the parameters in the table."""
+        return self._names
 
     def __iter__(self):
         return iter(self._table)
@@ -14,12 +14,13 @@
 
 """Quantum circuit object."""
 
-from copy import deepcopy
+from copy import copy, deepcopy
 import itertools
 import sys
 import multiprocessing as mp
 from warnings import warn
 from collections import OrderedDict
+import numpy
 from qiskit.circuit.instruction import Instruction
 from qiskit.qasm.qasm import Qasm
 from qiskit.exceptions import QiskitError
@@ -406,13 +407,11 @@ class QuantumCircuit:
         # track variable parameters in instruction
         for param_index, param in enumerate(instruction.params):
             if isinstance(param, ParameterExpression):
-                current_parameters = self.parameters
-
                 for parameter in param.parameters:
-                    if parameter in current_parameters:
+                    if parameter in self._parameter_table:
                         self._parameter_table[parameter].append((instruction, param_index))
                     else:
-                        if parameter.name in {p.name for p in current_parameters}:
+                        if parameter.name in self._parameter_table.get_names():
                             raise QiskitError(
                                 'Name conflict on adding parameter: {}'.format(parameter.name))
                         self._parameter_table[parameter] = [(instruction, param_index)]
@@ -871,13 +870,131 @@ class QuantumCircuit:
             raise QiskitError('Cannot bind parameters ({}) not present in the circuit.'.format(
                 [str(p) for p in value_dict.keys() - self.parameters]))
 
-        for parameter, value in unrolled_value_dict.items():
-            new_circuit._bind_parameter(parameter, value)
+        new_circuit._bind_parameters(unrolled_value_dict)
         # clear evaluated expressions
         for parameter in unrolled_value_dict:
             del new_circuit._parameter_table[parameter]
         return new_circuit
 
+    def bind_parameters_batch(self, value_dict):
+        """Assign arrays of values to parameters, yielding a new circuit per value.
+
+        Every expression is evaluated once for all the values before the first
+        circuit is yielded. The circuits are then built one at a time, and the
+        instructions which do not depend on the bound parameters are shared
+        between them and self. Params whose parameters are all bound are
+        floats; params which still depend on unbound parameters are
+        ParameterExpressions, as in bind_parameters.
+
+        Args:
+            value_dict (dict): {parameter: values, ...}, where values is a
+                sequence of N values for a Parameter, or of N sequences of
+                len(vector) values for a ParameterVector.
+
+        Raises:
+            QiskitError: If value_dict contains parameters not present in the
+                circuit, if values are not real numbers, or if parameters are
+                bound to different numbers of values.
+
+        Returns:
+            iterator(QuantumCircuit): the N circuits, the i-th with the i-th
+                values assigned.
+        """
+        value_arrays = self._unroll_param_array_dict(value_dict)
+
+        if value_arrays.keys() - self.parameters:
+            raise QiskitError('Cannot bind parameters ({}) not present in the circuit.'.format(
+                [str(p) for p in value_arrays.keys() - self.parameters]))
+
+        num_binds = len(next(iter(value_arrays.values()))) if value_arrays else 0
+
+        # {id(instruction): (instruction, {param_index: values})}
+        bound_instructions = {}
+        expression_values = {}
+        for parameter in value_arrays:
+            for instr, param_index in self._parameter_table[parameter]:
+                _, bound_params = bound_instructions.setdefault(id(instr), (instr, {}))
+                if param_index in bound_params:
+                    continue
+                expression = instr.params[param_index]
+                if id(expression) not in expression_values:
+                    expression_values[id(expression)] = _evaluate_batch(expression,
+                                                                        value_arrays,
+                                                                        num_binds)
+                bound_params[param_index] = expression_values[id(expression)]
+
+        return self._bound_circuits(num_binds, list(bound_instructions.values()),
+                                    self.parameters - value_arrays.keys())
+
+    def _bound_circuits(self, num_binds, bound_instructions, unbound_parameters):
+        """Yield the circuits of bind_parameters_batch.
+
+        Args:
+            num_binds (int): number of circuits.
+            bound_instructions (list): (instruction, {param_index: values})
+                pairs, with a value per circuit for each bound param.
+            unbound_parameters (set): parameters left in the circuits.
+
+        Yields:
+            QuantumCircuit: the bound circuits.
+        """
+        positions = {id(instr): position
+                     for position, (instr, _) in enumerate(bound_instructions)}
+        data_positions = [(index, positions[id(instr)])
+                          for index, (instr, _, _) in enumerate(self.data)
+                          if id(instr) in positions]
+        table_positions = {
+            parameter: [(positions.get(id(instr)), instr, param_index)
+                        for instr, param_index in self._parameter_table[parameter]]
+            for parameter in unbound_parameters}
+
+        for bind_index in range(num_binds):
+            new_instructions = []
+            for instr, bound_params in bound_instructions:
+                new_instr = copy(instr)
+                new_params = new_instr._params = list(instr.params)
+                for param_index, values in bound_params.items():
+                    new_params[param_index] = values[bind_index]
+                new_instructions.append(new_instr)
+
+            new_circuit = copy(self)
+            new_circuit.qregs = list(self.qregs)
+            new_circuit.cregs = list(self.cregs)
+            new_circuit.data = data = list(self.data)
+            for index, position in data_positions:
+                _, qargs, cargs = data[index]
+                data[index] = (new_instructions[position], qargs, cargs)
+            new_circuit._parameter_table = ParameterTable({
+                parameter: [(instr if position is None else new_instructions[position],
+                             param_index)
+                            for position, instr, param_index in locations]
+                for parameter, locations in table_positions.items()})
+            yield new_circuit
+
+    def _unroll_param_array_dict(self, value_dict):
+        value_arrays = {}
+        for (param, values) in value_dict.items():
+            try:
+                values = numpy.asarray(values, dtype=float)
+            except (TypeError, ValueError):
+                raise QiskitError('Values bound to {} must be real numbers.'.format(param))
+            if isinstance(param, ParameterVector):
+                if values.ndim != 2 or values.shape[1] != len(param):
+                    raise QiskitError('ParameterVector {} has length {}, which differs '
+                                      'from the shape {} of its values.'.format(
+                                          param, len(param), values.shape))
+                value_arrays.update(zip(param, values.T))
+            elif isinstance(param, ParameterExpression):
+                if values.ndim != 1:
+                    raise QiskitError('Values bound to {} must be a 1-d sequence.'.format(param))
+                value_arrays[param] = values
+            else:
+                raise QiskitError('Cannot bind parameters ({}) not present in the '
+                                  'circuit.'.format([str(param)]))
+        if len({len(values) for values in value_arrays.values()}) > 1:
+            raise QiskitError('All parameters must be bound to the same number of values.')
+        return value_arrays
+
     def _unroll_param_dict(self, value_dict):
         unrolled_value_dict = {}
         for (param, value) in value_dict.items():
@@ -891,10 +1008,22 @@ class QuantumCircuit:
                 unrolled_value_dict.update(zip(param, value))
         return unrolled_value_dict
 
-    def _bind_parameter(self, parameter, value):
-        """Assigns a parameter value to matching instructions in-place."""
-        for (instr, param_index) in self._parameter_table[parameter]:
-            instr.params[param_index] = instr.params[param_index].bind({parameter: value})
+    def _bind_parameters(self, value_dict):
+        """Assigns parameter values to matching instructions in-place.
+
+        Each expression is bound once, to the values of all its parameters
+        in value_dict.
+        """
+        bound_locations = set()
+        for parameter in value_dict:
+            for (instr, param_index) in self._parameter_table[parameter]:
+                if (id(instr), param_index) in bound_locations:
+                    continue
+                bound_locations.add((id(instr), param_index))
+                expression = instr.params[param_index]
+                instr.params[param_index] = expression.bind(
+                    {expr_param: value_dict[expr_param]
+                     for expr_param in expression.parameters if expr_param in value_dict})
 
     def _substitute_parameters(self, parameter_map):
         """For every {existing_parameter: replacement_parameter} pair in
@@ -908,6 +1037,23 @@ class QuantumCircuit:
             self._parameter_table[new_parameter] = self._parameter_table.pop(old_parameter)
 
 
+def _evaluate_batch(expression, value_arrays, num_binds):
+    """Return the values of expression for num_binds values of its parameters.
+
+    Expressions depending only on parameters in value_arrays are evaluated
+    for all the values at once, to floats. Other expressions are bound with
+    ParameterExpression.bind for each value.
+    """
+    bound_parameters = expression.parameters & value_arrays.keys()
+    if bound_parameters == expression.parameters:
+        # pylint: disable=protected-access
+        return expression._evaluate_array(
+            {parameter: value_arrays[parameter] for parameter in bound_parameters}).tolist()
+    return [expression.bind({parameter: value_arrays[parameter][bind_index]
+                             for parameter in bound_parameters})
+            for bind_index in range(num_binds)]
+
+
 def _circuit_from_qasm(qasm):
     # pylint: disable=cyclic-import
     from qiskit.converters import ast_to_dag
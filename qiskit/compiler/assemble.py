@@ -34,7 +34,7 @@ def assemble(experiments,
              qubit_lo_range=None, meas_lo_range=None,
              schedule_los=None, meas_level=2, meas_return='avg', meas_map=None,
              memory_slot_size=100, rep_time=None, parameter_binds=None,
-             **run_config):
+             columnar=False, **run_config):
     """Assemble a list of circuits or pulse schedules into a Qobj.
 
     This function serializes the payloads, which could be either circuits or schedules,
@@ -121,6 +121,12 @@ def assemble(experiments,
             length-n list, and there are m experiments, a total of m x n
             experiments will be run (one for each experiment/bind pair).
 
+        columnar (bool):
+            If True, circuits are assembled into ``ColumnarQasmQobjExperiment``
+            experiments, which store their instructions in arrays and are not
+            validated. Call their ``validate()`` method to validate them.
+            Default: False
+
         **run_config (dict):
             extra arguments used to configure the run (e.g. for Aer configurable
             backends). Refer to the backend documentation for details on these
@@ -142,11 +148,13 @@ def assemble(experiments,
     if all(isinstance(exp, QuantumCircuit) for exp in experiments):
         run_config = _parse_circuit_args(parameter_binds, **run_config_common_dict)
 
-        # If circuits are parameterized, bind parameters and remove from run_config
-        bound_experiments, run_config = _expand_parameters(circuits=experiments,
-                                                           run_config=run_config)
-        return assemble_circuits(circuits=bound_experiments, qobj_id=qobj_id,
-                                 qobj_header=qobj_header, run_config=run_config)
+        # If circuits are parameterized, check the binds and remove them from
+        # run_config; the parameters are bound into the assembled experiments
+        parameter_binds, run_config = _expand_parameters(circuits=experiments,
+                                                         run_config=run_config)
+        return assemble_circuits(circuits=experiments, qobj_id=qobj_id,
+                                 qobj_header=qobj_header, run_config=run_config,
+                                 parameter_binds=parameter_binds, columnar=columnar)
 
     elif all(isinstance(exp, ScheduleComponent) for exp in experiments):
         run_config = _parse_pulse_args(backend, qubit_lo_freq, meas_lo_freq,
@@ -293,23 +301,27 @@ def _parse_circuit_args(parameter_binds, **run_config):
 
 def _expand_parameters(circuits, run_config):
     """Verifies that there is a single common set of parameters shared between
-    all circuits and all parameter binds in the run_config. Returns an expanded
-    list of circuits (if parameterized) with all parameters bound, and a copy of
-    the run_config with parameter_binds cleared.
+    all circuits and all parameter binds in the run_config. Returns the
+    parameter binds with ParameterVectors unrolled, and a copy of the
+    run_config with parameter_binds cleared.
 
-    If neither the circuits nor the run_config specify parameters, the two are
-    returned unmodified.
+    If neither the circuits nor the run_config specify parameters, None and
+    the unmodified run_config are returned.
 
     Raises:
         QiskitError: if run_config parameters are not compatible with circuit parameters
 
     Returns:
-        Tuple(List[QuantumCircuit], RunConfig):
-          - List of input circuits expanded and with parameters bound
+        Tuple(List[dict], RunConfig):
+          - List of parameter binds, or None
           - RunConfig with parameter_binds removed
     """
 
     parameter_binds = run_config.parameter_binds
+    if parameter_binds:
+        # pylint: disable=protected-access
+        parameter_binds = [circuits[0]._unroll_param_dict(binds) for binds in parameter_binds]
+
     if parameter_binds or \
        any(circuit.parameters for circuit in circuits):
 
@@ -332,12 +344,9 @@ def _expand_parameters(circuits, run_config):
                  'Parameter binds: {} ' +
                  'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
 
-        circuits = [circuit.bind_parameters(binds)
-                    for circuit in circuits
-                    for binds in parameter_binds]
-
-        # All parameters have been expanded and bound, so remove from run_config
+        # All parameters have been expanded, so remove from run_config
         run_config = copy.deepcopy(run_config)
         run_config.parameter_binds = []
+        return parameter_binds, run_config
 
-    return circuits, run_config
+    return None, run_config
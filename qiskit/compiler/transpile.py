@@ -20,6 +20,7 @@ from qiskit.transpiler import Layout, CouplingMap
 from qiskit.tools.parallel import parallel_map
 from qiskit.transpiler.transpile_config import TranspileConfig
 from qiskit.transpiler.transpile_circuit import transpile_circuit
+from qiskit.compiler.transpile_cache import transpile_cache_key
 from qiskit.pulse import Schedule
 from qiskit.circuit.quantumregister import Qubit
 from qiskit import user_config
@@ -31,7 +32,7 @@ def transpile(circuits,
               basis_gates=None, coupling_map=None, backend_properties=None,
               initial_layout=None, seed_transpiler=None,
               optimization_level=None,
-              pass_manager=None, callback=None, output_name=None):
+              pass_manager=None, callback=None, output_name=None, cache=None):
     """Transpile one or more circuits, according to some desired transpilation targets.
 
     All arguments may be given as either singleton or list. In case of list,
@@ -163,6 +164,14 @@ def transpile(circuits,
             A list with strings to identify the output circuits. The length of
             `list[str]` should be exactly the length of `circuits` parameter.
 
+        cache (TranspileCache):
+            A cache of transpiled circuits, e.g. a ``MemoryTranspileCache`` or
+            ``DiskTranspileCache``. Circuits that were already transpiled with
+            the same options are taken from the cache instead of being
+            transpiled again, and newly transpiled circuits are added to it.
+            Circuits transpiled with a ``pass_manager`` or a ``callback`` are
+            not cached. If None, no cache is used.
+
     Returns:
         QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
 
@@ -196,8 +205,11 @@ def transpile(circuits,
                                       'in {} '.format(circuit.name) +
                                       'is greater than maximum ({}) '.format(max_qubits) +
                                       'in the coupling_map')
-    # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    if cache is None:
+        # Transpile circuits in parallel
+        circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    else:
+        circuits = _transpile_cached(circuits, transpile_configs, cache)
 
     if len(circuits) == 1:
         return circuits[0]
@@ -221,6 +233,57 @@ def _transpile_circuit(circuit_config_tuple):
     return transpile_circuit(circuit, transpile_config)
 
 
+def _transpile_cached(circuits, transpile_configs, cache):
+    """Transpile the circuits that are not in the cache and add them to it.
+
+    Args:
+        circuits (list[QuantumCircuit]): circuits to transpile
+        transpile_configs (list[TranspileConfig]): configuration of each circuit
+        cache (TranspileCache): cache of transpiled circuits
+
+    Returns:
+        list[QuantumCircuit]: transpiled circuits
+    """
+    memo = {}
+    keys = [transpile_cache_key(circuit, transpile_config, memo)
+            for circuit, transpile_config in zip(circuits, transpile_configs)]
+    out_circuits = []
+    missing = []
+    for index, (circuit, transpile_config, key) in enumerate(
+            zip(circuits, transpile_configs, keys)):
+        out_circuit = cache.get(key) if key is not None else None
+        if out_circuit is not None:
+            _use_parameters_of(out_circuit, circuit)
+            out_circuit.name = transpile_config.output_name
+        else:
+            missing.append(index)
+        out_circuits.append(out_circuit)
+
+    if not missing:
+        return out_circuits
+
+    # Transpile the missing circuits in parallel
+    transpiled = parallel_map(_transpile_circuit, [(circuits[index], transpile_configs[index])
+                                                   for index in missing])
+    for index, out_circuit in zip(missing, transpiled):
+        if keys[index] is not None:
+            cache.set(keys[index], out_circuit)
+        out_circuits[index] = out_circuit
+    return out_circuits
+
+
+def _use_parameters_of(out_circuit, circuit):
+    """Replace the parameters of a cached circuit by the same-named ones of ``circuit``."""
+    parameters = {parameter.name: parameter for parameter in circuit.parameters}
+    parameter_map = {}
+    for parameter in out_circuit.parameters:
+        new_parameter = parameters.get(parameter.name)
+        if new_parameter is not None and new_parameter != parameter:
+            parameter_map[parameter] = new_parameter
+    if parameter_map:
+        out_circuit._substitute_parameters(parameter_map)  # pylint: disable=protected-access
+
+
 def _parse_transpile_args(circuits, backend,
                           basis_gates, coupling_map, backend_properties,
                           initial_layout, seed_transpiler, optimization_level,
@@ -311,7 +374,8 @@ def _parse_coupling_map(coupling_map, backend, num_circuits):
         coupling_map = [coupling_map] * num_circuits
     elif isinstance(coupling_map, list) and all(isinstance(i, list) and len(i) == 2
                                                 for i in coupling_map):
-        coupling_map = [coupling_map] * num_circuits
+        # One CouplingMap shared by the circuits computes its distances once
+        coupling_map = [CouplingMap(coupling_map)] * num_circuits
     coupling_map = [CouplingMap(cm) if isinstance(cm, list) else cm for cm in coupling_map]
     return coupling_map
 
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Caches for the results of transpile().
+
+A transpiled circuit is stored under a key made of a structural hash of the
+input circuit and a hash of the TranspileConfig it was transpiled with, so
+that transpiling the same circuit with the same options again is a lookup.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import numpy as np
+
+from qiskit.circuit import ParameterExpression
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.version import __version__
+
+
+class TranspileCache(ABC):
+    """Base class for a cache of transpiled circuits.
+
+    Subclasses store pickled ``QuantumCircuit`` objects under string keys by
+    implementing ``_get_data``, ``_set_data`` and ``clear``.
+    """
+
+    def get(self, key):
+        """Return the circuit stored under ``key``, or None if there is none.
+
+        Args:
+            key (str): cache key, as returned by ``transpile_cache_key``.
+
+        Returns:
+            QuantumCircuit: a new copy of the stored circuit, or None.
+        """
+        data = self._get_data(key)
+        if data is None:
+            return None
+        return pickle.loads(data)
+
+    def set(self, key, circuit):
+        """Store a copy of ``circuit`` under ``key``.
+
+        Args:
+            key (str): cache key, as returned by ``transpile_cache_key``.
+            circuit (QuantumCircuit): transpiled circuit.
+        """
+        self._set_data(key, pickle.dumps(circuit, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @abstractmethod
+    def clear(self):
+        """Remove all the circuits from the cache."""
+        pass
+
+    @abstractmethod
+    def _get_data(self, key):
+        """Return the pickled circuit stored under ``key``, or None."""
+        pass
+
+    @abstractmethod
+    def _set_data(self, key, data):
+        """Store the pickled circuit ``data`` under ``key``."""
+        pass
+
+
+class MemoryTranspileCache(TranspileCache):
+    """A least recently used cache of transpiled circuits kept in memory.
+
+    The least recently used circuits are evicted when there are more than
+    ``max_entries`` of them or when their pickles take more than ``max_size``
+    bytes.
+    """
+
+    def __init__(self, max_entries=1024, max_size=256 * 1024 ** 2):
+        """Create an in-memory cache.
+
+        Args:
+            max_entries (int): maximum number of circuits.
+            max_size (int): maximum total size of the pickled circuits in bytes.
+
+        Raises:
+            TranspilerError: if max_entries or max_size is not positive.
+        """
+        if max_entries < 1:
+            raise TranspilerError('max_entries must be a positive integer.')
+        if max_size < 1:
+            raise TranspilerError('max_size must be a positive integer.')
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _get_data(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def _set_data(self, key, data):
+        with self._lock:
+            old_data = self._entries.pop(key, None)
+            if old_data is not None:
+                self._size -= len(old_data)
+            self._entries[key] = data
+            self._size += len(data)
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                _, old_data = self._entries.popitem(last=False)
+                self._size -= len(old_data)
+
+
+class DiskTranspileCache(TranspileCache):
+    """A cache of transpiled circuits kept as files in a directory.
+
+    When the files take more than ``max_size`` bytes, the least recently used
+    ones are deleted.
+
+    The files are pickles, and unpickling data can run arbitrary code, so the
+    directory must only be writable by users whose code you would run.
+    """
+
+    def __init__(self, directory, max_size=256 * 1024 ** 2):
+        """Create an on-disk cache.
+
+        Args:
+            directory (str): directory for the cache files. It is created if
+                it does not exist.
+            max_size (int): maximum total size of the cache files in bytes.
+
+        Raises:
+            TranspilerError: if max_size is not positive.
+        """
+        if max_size < 1:
+            raise TranspilerError('max_size must be a positive integer.')
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def clear(self):
+        for path, _, _ in self._files():
+            _remove(path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _get_data(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        # The modification time orders the files for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _set_data(self, key, data):
+        # Write to a temporary file first so readers never see partial files
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(tmp_fd, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _files(self):
+        """Return (path, size, mtime) of the cache files."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _evict(self):
+        files = self._files()
+        total_size = sum(size for _, size, _ in files)
+        if total_size <= self.max_size:
+            return
+        files.sort(key=lambda file: file[2])
+        for path, size, _ in files:
+            _remove(path)
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+
+
+def transpile_cache_key(circuit, transpile_config, memo=None):
+    """Return the cache key of transpiling ``circuit`` with ``transpile_config``.
+
+    Args:
+        circuit (QuantumCircuit): circuit to transpile.
+        transpile_config (TranspileConfig): configuration of the transpilation.
+        memo (dict): hashes of the options shared by several configs, passed
+            to ``transpile_config_hash``.
+
+    Returns:
+        str: the key, or None if the transpilation cannot be cached because it
+            uses a custom pass manager or a callback. The key includes the
+            Qiskit version, so circuits transpiled by other versions are
+            never reused.
+    """
+    if getattr(transpile_config, 'pass_manager', None) or \
+            getattr(transpile_config, 'callback', None):
+        return None
+    return hashlib.sha256((__version__ + circuit_structural_hash(circuit) +
+                           transpile_config_hash(transpile_config, memo)).encode()).hexdigest()
+
+
+def circuit_structural_hash(circuit):
+    """Return a hash of the registers and instructions of ``circuit``.
+
+    Circuits with the same registers and the same instructions, with the same
+    parameters, on the same bits have the same hash. The circuit name is not
+    part of the hash, and parameters are identified by their names.
+
+    Args:
+        circuit (QuantumCircuit): circuit to hash.
+
+    Returns:
+        str: hex digest of the hash.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(repr(([(qreg.name, qreg.size) for qreg in circuit.qregs],
+                        [(creg.name, creg.size) for creg in circuit.cregs])).encode())
+    _hash_instructions(hasher, circuit.data)
+    return hasher.hexdigest()
+
+
+def transpile_config_hash(transpile_config, memo=None):
+    """Return a hash of the options in ``transpile_config`` that affect its output.
+
+    Args:
+        transpile_config (TranspileConfig): configuration to hash.
+        memo (dict): if given, the serialized backend properties are stored
+            in it by object id, so configs sharing the same properties
+            serialize them once. The properties must not change while the
+            memo is in use.
+
+    Returns:
+        str: hex digest of the hash.
+    """
+    basis_gates = getattr(transpile_config, 'basis_gates', None)
+    coupling_map = getattr(transpile_config, 'coupling_map', None)
+    initial_layout = getattr(transpile_config, 'initial_layout', None)
+    backend_properties = getattr(transpile_config, 'backend_properties', None)
+    optimization_level = getattr(transpile_config, 'optimization_level', None)
+    if optimization_level is None:
+        optimization_level = 1
+
+    if initial_layout is not None:
+        initial_layout = sorted((physical, _bit_key(virtual)) for physical, virtual
+                                in initial_layout.get_physical_bits().items())
+    if backend_properties is not None:
+        memo = {} if memo is None else memo
+        key = id(backend_properties)
+        if key not in memo:
+            memo[key] = (backend_properties,
+                         json.dumps(backend_properties.to_dict(), sort_keys=True, default=str))
+        backend_properties = memo[key][1]
+    options = (sorted(basis_gates) if basis_gates is not None else None,
+               sorted(coupling_map.get_edges()) if coupling_map is not None else None,
+               initial_layout,
+               getattr(transpile_config, 'seed_transpiler', None),
+               optimization_level,
+               backend_properties)
+    return hashlib.sha256(repr(options).encode()).hexdigest()
+
+
+def _hash_instructions(hasher, data):
+    """Hash the instructions of a circuit and, recursively, their definitions.
+
+    The standard gates and the other instructions of ``qiskit.extensions``
+    define themselves from their parameters, which are hashed, so their
+    definitions are not. The definitions of all other instructions, e.g.
+    those made by ``QuantumCircuit.to_instruction()``, are always hashed.
+    """
+    for instruction, qargs, cargs in data:
+        condition = instruction.control
+        if condition is not None:
+            condition = (condition[0].name, condition[0].size, condition[1])
+        cls = type(instruction)
+        hasher.update(repr((cls.__module__, cls.__qualname__, instruction.name,
+                            instruction.num_qubits, instruction.num_clbits,
+                            [_param_key(param) for param in instruction.params],
+                            [_bit_key(qubit) for qubit in qargs],
+                            [_bit_key(clbit) for clbit in cargs],
+                            condition)).encode())
+        if not cls.__module__.startswith('qiskit.extensions.'):
+            definition = instruction.definition
+            if definition is not None:
+                hasher.update(b'definition')
+                _hash_instructions(hasher, definition)
+                hasher.update(b'end')
+
+
+def _param_key(param):
+    if isinstance(param, ParameterExpression):
+        return ('parameter', str(param))
+    if isinstance(param, np.ndarray):
+        return ('array', param.dtype.str, param.shape, param.tobytes())
+    return (type(param).__name__, repr(param))
+
+
+def _bit_key(bit):
+    return (bit.register.name, bit.register.size, bit.index)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
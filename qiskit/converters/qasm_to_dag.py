@@ -0,0 +1,666 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+OpenQASM to DAG (directed acyclic graph) converter.
+
+Reads an OpenQASM 2.0 program in a single pass, one statement at a time, and
+applies its operations to the DAG as they are read, without building an AST.
+"""
+
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+from operator import add, itemgetter, mul, neg, pos, sub, truediv
+
+import sympy
+
+from qiskit.circuit import QuantumRegister, ClassicalRegister, Gate
+from qiskit.circuit.measure import Measure
+from qiskit.circuit.reset import Reset
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.extensions.standard.barrier import Barrier
+from qiskit.extensions.standard.cxbase import CXBase
+from qiskit.extensions.standard.ubase import UBase
+from qiskit.qasm import QasmError
+from qiskit.qasm.qasmlexer import CORE_LIBS, CORE_LIBS_PATH
+from .ast_to_dag import AstInterpreter
+
+# Size of the pieces read from files
+_CHUNK_SIZE = 1024 ** 2
+
+_TOKEN_RE = re.compile(r'''
+    (?P<skip>[ \t\r]+|//[^\n]*)
+  | (?P<newline>\n)
+  | (?P<real>(([0-9]+|([0-9]+)?\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+)|(([0-9]+)?\.[0-9]+|[0-9]+\.))
+  | (?P<int>[0-9]+)
+  | (?P<id>[a-zA-Z][a-zA-Z0-9_]*)
+  | (?P<string>"[^"\n]*")
+  | (?P<op>->|==|[=()\[\]{};<>,.+\-/*^])
+  | (?P<error>.)
+''', re.VERBOSE)
+
+# Identifiers that are tokens of their own
+_KEYWORDS = {'barrier', 'creg', 'gate', 'if', 'include', 'measure', 'opaque', 'qreg',
+             'pi', 'reset', 'OPENQASM', 'U', 'CX'}
+
+_BINARY_OPERATORS = {'+': add, '-': sub, '*': mul, '/': truediv}
+_UNARY_OPERATORS = {'+': pos, '-': neg}
+_EXTERNAL_FUNCTIONS = {'sin': sympy.sin,
+                       'cos': sympy.cos,
+                       'tan': sympy.tan,
+                       'asin': sympy.asin,
+                       'acos': sympy.acos,
+                       'atan': sympy.atan,
+                       'exp': sympy.exp,
+                       'ln': sympy.log,
+                       'sqrt': sympy.sqrt}
+
+# Integers and reals are made symbolic like in the AST. The parser makes
+# reals with sympy.Number, which parses its string argument as an expression
+# and returns the same Float as sympy.Float.
+_INTEGER = lru_cache(maxsize=1024)(sympy.N)
+_REAL = lru_cache(maxsize=1024)(sympy.Float)
+
+
+def qasm_to_dag(source, filename=None):
+    """Build a ``DAGCircuit`` object from an OpenQASM 2.0 program.
+
+    The program is read and converted statement by statement, so only the
+    DAG and the gate definitions are kept in memory, not the program or its
+    AST. Calls to gates defined in the program are expanded into the
+    standard and opaque gates of their definitions.
+
+    Args:
+        source (file or str): a file object, in text or binary mode, or a
+            ``mmap`` of an OpenQASM file, or a string of OpenQASM code.
+        filename (str): name of the program in error messages. Defaults to
+            the ``name`` of the file object.
+
+    Return:
+        DAGCircuit: the DAG of the program.
+
+    Raises:
+        QasmError: if the program is not valid.
+    """
+    dag = DAGCircuit()
+    for item in QasmStreamReader(source, filename):
+        if isinstance(item, QuantumRegister):
+            dag.add_qreg(item)
+        elif isinstance(item, ClassicalRegister):
+            dag.add_creg(item)
+        else:
+            dag.apply_operation_back(*item)
+
+    return dag
+
+
+# Definition of a gate: its number of parameters and qubits, and the list of
+# (name, parameter expressions, qubit indices) of the basis operations, i.e.
+# U, CX, barrier, standard and opaque gates, it expands to
+_GateDefinition = namedtuple('_GateDefinition', ['num_params', 'num_qubits', 'expansion'])
+
+# Definitions of the included files that only define gates, by path and
+# modification time
+_INCLUDE_CACHE = {}
+
+
+class QasmStreamReader:
+    """Single-pass reader of OpenQASM 2.0 programs.
+
+    Iterating over the reader reads the program and yields, in order, the
+    ``QuantumRegister`` and ``ClassicalRegister`` objects it declares and
+    the ``(instruction, qargs, cargs, condition)`` tuples of its operations,
+    which are the arguments of ``DAGCircuit.apply_operation_back``.
+
+    Gate definitions are compiled into a table of their expansions into
+    basis operations once, when they are read. The definitions of included
+    files that only define gates, such as ``qelib1.inc``, are cached for the
+    process.
+    """
+
+    def __init__(self, source, filename=None):
+        """Create a reader.
+
+        Args:
+            source (file or str): a file object, in text or binary mode, or a
+                ``mmap`` of an OpenQASM file, or a string of OpenQASM code.
+            filename (str): name of the program in error messages. Defaults
+                to the ``name`` of the file object.
+        """
+        self.source = source
+        if filename is None:
+            filename = getattr(source, 'name', '')
+        self.filename = str(filename)
+        self._gates = {}
+        self._qubits = {}
+        self._clbits = {}
+        self._cregs = {}
+
+    def __iter__(self):
+        return self._read(self.source, self.filename)
+
+    def _read(self, source, filename):
+        for tokens in _read_statements(source, filename):
+            statement = _Statement(tokens, filename)
+            yield from self._statement(statement, statement.next()[0])
+
+    def _statement(self, statement, kind, condition=None):
+        if condition is None:
+            if kind == 'OPENQASM':
+                self._format(statement)
+                return
+            if kind == 'include':
+                yield from self._include(statement)
+                return
+            if kind in ('qreg', 'creg'):
+                yield self._register(statement, kind)
+                return
+            if kind in ('gate', 'opaque'):
+                self._gate(statement, kind == 'opaque')
+                return
+            if kind == 'if':
+                yield from self._if(statement)
+                return
+        if kind in ('U', 'CX', 'id'):
+            yield from self._call(statement, condition)
+        elif kind == 'measure':
+            yield from self._measure(statement, condition)
+        elif kind == 'reset':
+            qubits = self._bits(statement, self._qubits, 'qreg')
+            statement.end()
+            for qubit in qubits:
+                yield Reset(), [qubit], [], condition
+        elif kind == 'barrier':
+            qubits = []
+            while True:
+                qubits.extend(self._bits(statement, self._qubits, 'qreg'))
+                if not statement.accept(','):
+                    break
+            statement.end()
+            yield Barrier(len(qubits)), qubits, [], None
+        else:
+            raise statement.error("Invalid statement starting with '%s'"
+                                  % statement.tokens[statement.position - 1][1])
+
+    def _format(self, statement):
+        version = statement.expect('real')
+        if version != '2.0':
+            raise statement.error("Invalid version string. Expected '2.0'")
+        statement.end()
+
+    def _include(self, statement):
+        path = statement.expect('string')
+        statement.end()
+        if path in CORE_LIBS:
+            path = os.path.join(CORE_LIBS_PATH, path)
+        if not os.path.exists(path):
+            raise statement.error('Include file %s cannot be found' % path)
+
+        key = (os.path.abspath(path), os.path.getmtime(path))
+        definitions = _INCLUDE_CACHE.get(key)
+        if definitions is not None:
+            for name in definitions:
+                self._check_undeclared(statement, name)
+            self._gates.update(definitions)
+            return
+
+        # Only files read without previous definitions are cached, as their
+        # definitions don't depend on the program including them
+        cacheable = not self._gates
+        with open(path, 'r') as file:
+            for item in self._read(file, path):
+                cacheable = False
+                yield item
+        if cacheable:
+            _INCLUDE_CACHE[key] = dict(self._gates)
+
+    def _register(self, statement, kind):
+        name = statement.expect('id')
+        statement.expect('[')
+        size = statement.expect('int')
+        statement.expect(']')
+        statement.end()
+        if size == 0:
+            raise statement.error('%s size must be positive' % kind.upper())
+        self._check_undeclared(statement, name)
+        if kind == 'qreg':
+            register = QuantumRegister(size, name)
+            self._qubits[name] = list(register)
+        else:
+            register = ClassicalRegister(size, name)
+            self._clbits[name] = list(register)
+            self._cregs[name] = register
+        return register
+
+    def _gate(self, statement, opaque):
+        name = statement.expect('id')
+        params = []
+        if statement.accept('('):
+            if not statement.accept(')'):
+                params = _read_ids(statement)
+                statement.expect(')')
+        qubits = _read_ids(statement)
+        if len(set(params + qubits)) != len(params) + len(qubits):
+            raise statement.error("Duplicate argument names in gate '%s'" % name)
+
+        if opaque:
+            statement.end()
+        else:
+            body = self._gate_body(statement, dict(zip(params, range(len(params)))),
+                                   dict(zip(qubits, range(len(qubits)))))
+        # Calls to standard gates are not expanded, like in ast_to_dag
+        if opaque or name in AstInterpreter.standard_extension:
+            expansion = _self_expansion(name, len(params), len(qubits))
+        else:
+            expansion = _expand(body)
+        self._check_undeclared(statement, name)
+        self._gates[name] = _GateDefinition(len(params), len(qubits), expansion)
+
+    def _gate_body(self, statement, params, qubits):
+        """Read the body of a gate, as a list of (definition, parameters, qubit indices)."""
+        body = []
+        statement.expect('{')
+        while not statement.accept('}'):
+            kind, name, _ = statement.next()
+            if kind == 'barrier':
+                indices = [_local_qubit(statement, qubits, qubit)
+                           for qubit in _read_ids(statement)]
+                body.append((None, [], indices))
+            elif kind in ('U', 'CX', 'id'):
+                definition = self._definition(statement, name)
+                arguments = _read_arguments(statement, params)
+                indices = [_local_qubit(statement, qubits, qubit)
+                           for qubit in _read_ids(statement)]
+                _check_call(statement, name, definition, arguments, indices)
+                if len(set(indices)) != len(indices):
+                    raise statement.error('Duplicate qubits in call to %s' % name)
+                body.append((definition, arguments, indices))
+            else:
+                raise statement.error("Invalid gate body statement starting with '%s'" % name)
+            statement.expect(';')
+        statement.end()
+        return body
+
+    def _if(self, statement):
+        statement.expect('(')
+        name = statement.expect('id')
+        if name not in self._cregs:
+            raise statement.error("Cannot find definition for creg '%s'" % name)
+        statement.expect('==')
+        value = statement.expect('int')
+        statement.expect(')')
+        yield from self._statement(statement, statement.next()[0],
+                                   (self._cregs[name], value))
+
+    def _call(self, statement, condition):
+        name = statement.tokens[statement.position - 1][1]
+        definition = self._definition(statement, name)
+        arguments = _read_arguments(statement, None)
+        bits = []
+        while True:
+            bits.append(self._bits(statement, self._qubits, 'qreg'))
+            if not statement.accept(','):
+                break
+        statement.end()
+        _check_call(statement, name, definition, arguments, bits)
+
+        for qubits in _broadcast(statement, bits):
+            if len(set(qubits)) != len(qubits):
+                raise statement.error('Duplicate qubits in call to %s' % name)
+            for op_name, expressions, indices in definition.expansion:
+                params = [_evaluate(expression, arguments) for expression in expressions]
+                qargs = [qubits[index] for index in indices]
+                if op_name == 'barrier':
+                    yield Barrier(len(qargs)), qargs, [], None
+                else:
+                    yield _instruction(op_name, params, len(qargs)), qargs, [], condition
+
+    def _measure(self, statement, condition):
+        qubits = self._bits(statement, self._qubits, 'qreg')
+        statement.expect('->')
+        clbits = self._bits(statement, self._clbits, 'creg')
+        statement.end()
+        if len(qubits) != len(clbits):
+            raise statement.error('Register size mismatch in measure')
+        for qubit, clbit in zip(qubits, clbits):
+            yield Measure(), [qubit], [clbit], condition
+
+    def _bits(self, statement, registers, kind):
+        """Read a register or a bit of a register, as a list of bits."""
+        name = statement.expect('id')
+        bits = registers.get(name)
+        if bits is None:
+            raise statement.error("Cannot find definition for %s '%s'" % (kind, name))
+        if statement.accept('['):
+            index = statement.expect('int')
+            statement.expect(']')
+            if index >= len(bits):
+                raise statement.error("Register index for '%s' out of bounds. Index is %d "
+                                      "bound is 0 <= index < %d" % (name, index, len(bits)))
+            return [bits[index]]
+        return bits
+
+    def _definition(self, statement, name):
+        if name == 'U':
+            return _U_DEFINITION
+        if name == 'CX':
+            return _CX_DEFINITION
+        definition = self._gates.get(name)
+        if definition is None:
+            raise statement.error("Cannot find gate definition for '%s'" % name)
+        return definition
+
+    def _check_undeclared(self, statement, name):
+        if name in self._gates or name in self._qubits or name in self._clbits:
+            raise statement.error("Duplicate declaration for '%s'" % name)
+
+
+def _read_statements(source, filename):
+    """Yield the statements of a program, as lists of (kind, value, line) tokens."""
+    line = 1
+    depth = 0
+    tokens = []
+    for text in _read_text(source):
+        for match in _TOKEN_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == 'skip':
+                continue
+            if kind == 'newline':
+                line += 1
+                continue
+            value = match.group(kind)
+            if kind == 'id':
+                if value in _KEYWORDS:
+                    kind = value
+                elif not value[0].islower():
+                    raise QasmError("Invalid identifier '%s', line %d, file %s"
+                                    % (value, line, filename))
+            elif kind == 'op':
+                kind = value
+            elif kind == 'int':
+                value = int(value)
+            elif kind == 'string':
+                value = value[1:-1]
+            elif kind == 'error':
+                raise QasmError("Unable to match any token, got '%s', line %d, file %s"
+                                % (value, line, filename))
+            tokens.append((kind, value, line))
+
+            if kind == '{':
+                depth += 1
+            elif kind == '}':
+                depth -= 1
+                if depth < 0:
+                    raise QasmError("Unexpected '}', line %d, file %s" % (line, filename))
+            if depth == 0 and kind in (';', '}'):
+                yield tokens
+                tokens = []
+    if tokens:
+        raise QasmError("Error at end of file %s. Perhaps there is a missing ';'" % filename)
+
+
+def _read_text(source):
+    """Yield the text of a source in pieces that end at line ends."""
+    if isinstance(source, str):
+        yield source
+        return
+    pending = None
+    while True:
+        chunk = source.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        if pending:
+            chunk = pending + chunk
+        end = chunk.rfind(b'\n' if isinstance(chunk, bytes) else '\n') + 1
+        pending = chunk[end:]
+        if end:
+            yield _decode(chunk[:end])
+    if pending:
+        yield _decode(pending)
+
+
+def _decode(text):
+    return text.decode('utf-8') if isinstance(text, bytes) else text
+
+
+class _Statement:
+    """Cursor over the tokens of a statement."""
+
+    __slots__ = ('tokens', 'position', 'filename')
+
+    def __init__(self, tokens, filename):
+        self.tokens = tokens
+        self.position = 0
+        self.filename = filename
+
+    def peek(self):
+        """Return the kind of the next token, or None at the end."""
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def next(self):
+        """Return the next token."""
+        if self.position >= len(self.tokens):
+            raise self.error('Unexpected end of statement')
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def accept(self, kind):
+        """Skip the next token if it is of the given kind, and return whether it was."""
+        if self.peek() == kind:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, kind):
+        """Return the value of the next token, which must be of the given kind."""
+        token = self.next()
+        if token[0] != kind:
+            self.position -= 1
+            raise self.error("Expected '%s', received '%s'" % (kind, token[1]))
+        return token[1]
+
+    def end(self):
+        """Check the statement has been read entirely."""
+        if self.position < len(self.tokens) - 1 or self.tokens[-1][0] not in (';', '}'):
+            raise self.error("Unexpected '%s'" % self.tokens[self.position][1])
+
+    def error(self, message):
+        """Return a QasmError for the current token."""
+        line = self.tokens[min(self.position, len(self.tokens) - 1)][2]
+        return QasmError('%s, line %d, file %s' % (message, line, self.filename))
+
+
+class _ParameterExpression:
+    """Expression of the parameters of a gate.
+
+    Constant expressions are kept as their sympy values instead.
+    """
+
+    __slots__ = ('evaluate', 'index')
+
+    def __init__(self, evaluate, index=None):
+        # evaluate(params) returns the value of the expression for a list of
+        # parameter values; index is set for the expressions of a parameter.
+        self.evaluate = evaluate
+        self.index = index
+
+
+def _evaluate(expression, params):
+    if isinstance(expression, _ParameterExpression):
+        return expression.evaluate(params)
+    return expression
+
+
+def _apply(function, *operands):
+    """Return the expression of ``function`` applied to expressions."""
+    if not any(isinstance(operand, _ParameterExpression) for operand in operands):
+        return function(*operands)
+    return _ParameterExpression(
+        lambda params: function(*[_evaluate(operand, params) for operand in operands]))
+
+
+def _compose(expression, arguments):
+    """Return an expression of the parameters of a gate as one of the arguments of a call."""
+    if not isinstance(expression, _ParameterExpression):
+        return expression
+    if expression.index is not None:
+        return arguments[expression.index]
+    if not any(isinstance(argument, _ParameterExpression) for argument in arguments):
+        return expression.evaluate(arguments)
+    return _ParameterExpression(
+        lambda params: expression.evaluate([_evaluate(argument, params)
+                                            for argument in arguments]))
+
+
+def _read_arguments(statement, params):
+    """Read the optional parenthesized expressions of a gate call."""
+    arguments = []
+    if statement.accept('('):
+        if not statement.accept(')'):
+            arguments.append(_read_expression(statement, params))
+            while statement.accept(','):
+                arguments.append(_read_expression(statement, params))
+            statement.expect(')')
+    return arguments
+
+
+def _read_expression(statement, params):
+    value = _read_term(statement, params)
+    while statement.peek() in ('+', '-'):
+        operator = _BINARY_OPERATORS[statement.next()[0]]
+        value = _apply(operator, value, _read_term(statement, params))
+    return value
+
+
+def _read_term(statement, params):
+    value = _read_factor(statement, params)
+    while statement.peek() in ('*', '/'):
+        operator = _BINARY_OPERATORS[statement.next()[0]]
+        value = _apply(operator, value, _read_factor(statement, params))
+    return value
+
+
+def _read_factor(statement, params):
+    # Signs bind less tightly than powers, and powers are right associative
+    if statement.peek() in ('+', '-'):
+        operator = _UNARY_OPERATORS[statement.next()[0]]
+        return _apply(operator, _read_factor(statement, params))
+    value = _read_unary(statement, params)
+    if statement.accept('^'):
+        value = _apply(pow, value, _read_factor(statement, params))
+    return value
+
+
+def _read_unary(statement, params):
+    kind, value, _ = statement.next()
+    if kind == 'int':
+        return _INTEGER(value)
+    if kind == 'real':
+        return _REAL(value)
+    if kind == 'pi':
+        return sympy.pi
+    if kind == '(':
+        value = _read_expression(statement, params)
+        statement.expect(')')
+        return value
+    if kind == 'id':
+        if statement.accept('('):
+            function = _EXTERNAL_FUNCTIONS.get(value)
+            if function is None:
+                raise statement.error('Illegal external function call: %s' % value)
+            argument = _read_expression(statement, params)
+            statement.expect(')')
+            return _apply(function, argument)
+        if params and value in params:
+            return _parameter(params[value])
+        raise statement.error("Argument '%s' in expression cannot be found" % value)
+    raise statement.error("Invalid expression, received '%s'" % value)
+
+
+def _read_ids(statement):
+    ids = [statement.expect('id')]
+    while statement.accept(','):
+        ids.append(statement.expect('id'))
+    return ids
+
+
+def _local_qubit(statement, qubits, name):
+    index = qubits.get(name)
+    if index is None:
+        raise statement.error("Cannot find symbol '%s' in argument list for gate" % name)
+    return index
+
+
+def _check_call(statement, name, definition, arguments, qubits):
+    if len(arguments) != definition.num_params:
+        raise statement.error('Gate or opaque call to %s uses %d parameters but is '
+                              'declared for %d' % (name, len(arguments),
+                                                   definition.num_params))
+    if len(qubits) != definition.num_qubits:
+        raise statement.error('Gate or opaque call to %s uses %d qubits but is '
+                              'declared for %d' % (name, len(qubits), definition.num_qubits))
+
+
+def _broadcast(statement, bits):
+    """Yield the lists of qubits of a call on registers and qubits."""
+    sizes = {len(register) for register in bits if len(register) != 1}
+    if len(sizes) > 1:
+        raise statement.error('Register size mismatch')
+    for index in range(sizes.pop() if sizes else 1):
+        yield [register[index] if len(register) != 1 else register[0] for register in bits]
+
+
+def _self_expansion(name, num_params, num_qubits):
+    return [(name, [_parameter(index) for index in range(num_params)],
+             list(range(num_qubits)))]
+
+
+def _expand(body):
+    """Return the expansion of a gate body into basis operations."""
+    expansion = []
+    for definition, arguments, indices in body:
+        if definition is None:
+            expansion.append(('barrier', [], indices))
+            continue
+        for name, expressions, callee_indices in definition.expansion:
+            expansion.append((name, [_compose(expression, arguments)
+                                     for expression in expressions],
+                              [indices[index] for index in callee_indices]))
+    return expansion
+
+
+def _instruction(name, params, num_qubits):
+    if name == 'U':
+        return UBase(*params)
+    if name == 'CX':
+        return CXBase()
+    standard_gate = AstInterpreter.standard_extension.get(name)
+    if standard_gate is not None:
+        return standard_gate(*params)
+    return Gate(name=name, num_qubits=num_qubits, params=params)
+
+
+@lru_cache(maxsize=None)
+def _parameter(index):
+    """Return the expression of the parameter of a gate at ``index``."""
+    return _ParameterExpression(itemgetter(index), index)
+
+
+_U_DEFINITION = _GateDefinition(3, 1, _self_expansion('U', 3, 1))
+_CX_DEFINITION = _GateDefinition(0, 2, _self_expansion('CX', 0, 2))
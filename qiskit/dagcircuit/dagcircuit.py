@@ -21,9 +21,16 @@ from node A to node B means that the (qu)bit passes from the output of A
 to the input of B. The object's methods allow circuits to be constructed,
 composed, and modified. Some natural properties like depth can be computed
 directly from the graph.
+
+The graph itself is kept in a compact array-backed form rather than in a
+general purpose graph library: nodes are identified by contiguous integer
+ids and, since every node has exactly one incoming and one outgoing edge per
+wire it touches, the edges are stored as per-wire predecessor and successor
+ids on each node record.
 """
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import copy
+import heapq
 import itertools
 import networkx as nx
 
@@ -33,6 +40,9 @@ from qiskit.circuit.gate import Gate
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
 
+# Operations that are not included in the qubit partition of a layer
+_NON_PARTITION_OPS = frozenset(["barrier", "snapshot", "save", "load", "noise"])
+
 
 class DAGCircuit:
     """
@@ -55,23 +65,56 @@ class DAGCircuit:
         # Set of wires (Register,idx) in the dag
         self.wires = []
 
+        # Map from wire (Register,idx) to its integer index in self.wires
+        self._wire_indices = {}
+
         # Map from wire (Register,idx) to input nodes of the graph
         self.input_map = OrderedDict()
 
         # Map from wire (Register,idx) to output nodes of the graph
         self.output_map = OrderedDict()
 
-        # Stores the max id of a node added to the DAG
-        self._max_node_id = 0
-
-        # Directed multigraph whose nodes are inputs, outputs, or operations.
-        # Operation nodes have equal in- and out-degrees and carry
+        # Slot-based node records. A node id indexes into each of these
+        # parallel lists; slot 0 is unused so that node ids start at 1.
+        # Removing a node empties its slot (None) so that ids remain stable.
+        # Nodes are inputs, outputs, or operations. Operation nodes carry
         # additional data about the operation, including the argument order
         # and parameter values.
-        # Input nodes have out-degree 1 and output nodes have in-degree 1.
-        # Edges carry wire labels (reg,idx) and each operation has
-        # corresponding in- and out-edges with the same wire labels.
-        self._multi_graph = nx.MultiDiGraph()
+        self._nodes = [None]
+
+        # Ordered tuple of the wire indices touched by each node.
+        self._node_wires = [None]
+
+        # Per-wire predecessor and successor node ids of each node, aligned
+        # with its entry in _node_wires. Input nodes have no predecessors and
+        # output nodes have no successors, so their lists are empty.
+        self._preds = [None]
+        self._succs = [None]
+
+        # Stamp of the edge behind each entry of _preds and _succs: a pair of
+        # the number of the first edge between the same two nodes and the
+        # number of the edge itself. Edges are numbered as they are linked,
+        # so sorting by stamp lists neighbours in the order they were first
+        # connected and the edges to each of them in the order they were
+        # added, as in a networkx MultiDiGraph.
+        self._pred_stamps = [None]
+        self._succ_stamps = [None]
+        self._num_stamps = 0
+
+        # Number of occupied node slots
+        self._num_nodes = 0
+
+        # Key used to break ties between nodes in topological_nodes(). It
+        # is computed once when the node is added, from its qargs.
+        self._sort_keys = [None]
+
+        # Cached topological order (list of node ids) together with the
+        # position of each node in it. Mutations do not recompute the order
+        # but only shorten the prefix of it that is known to still be valid;
+        # the remainder is recomputed on the next read.
+        self._topological_order = None
+        self._topological_position = None
+        self._topological_valid = 0
 
         # Map of qreg name to QuantumRegister object
         self.qregs = OrderedDict()
@@ -79,12 +122,16 @@ class DAGCircuit:
         # Map of creg name to ClassicalRegister object
         self.cregs = OrderedDict()
 
-        # TO REMOVE WHEN NODE IS HAVE BEEN REMOVED FULLY
-        self._id_to_node = {}
-
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
-        return copy.deepcopy(self._multi_graph)
+        return copy.deepcopy(self._to_networkx())
+
+    def _to_networkx(self):
+        """Build a networkx MultiDiGraph view sharing this DAG's nodes."""
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.nodes())
+        graph.add_edges_from(self.edges())
+        return graph
 
     def qubits(self):
         """Return a list of qubits (as a list of Qubit instances)."""
@@ -99,7 +146,7 @@ class DAGCircuit:
         """
         Returns the number of nodes in the dag
         """
-        return len(self._multi_graph)
+        return self._num_nodes
 
     def remove_all_ops_named(self, opname):
         """Remove all operation nodes with the given name."""
@@ -136,38 +183,126 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if trying to add duplicate wire
         """
-        if wire not in self.wires:
+        if wire not in self._wire_indices:
+            wire_index = len(self.wires)
             self.wires.append(wire)
-            self._max_node_id += 1
-            input_map_wire = self.input_map[wire] = self._max_node_id
-
-            self._max_node_id += 1
-            output_map_wire = self._max_node_id
+            self._wire_indices[wire] = wire_index
 
             wire_name = "%s[%s]" % (wire.register.name, wire.index)
 
-            inp_node = DAGNode(data_dict={'type': 'in', 'name': wire_name, 'wire': wire},
-                               nid=input_map_wire)
-            outp_node = DAGNode(data_dict={'type': 'out', 'name': wire_name, 'wire': wire},
-                                nid=output_map_wire)
-            self._id_to_node[input_map_wire] = inp_node
-            self._id_to_node[output_map_wire] = outp_node
+            input_id = self._add_node({'type': 'in', 'name': wire_name, 'wire': wire},
+                                      (wire_index,))
+            output_id = self._add_node({'type': 'out', 'name': wire_name, 'wire': wire},
+                                       (wire_index,))
+            self._preds[input_id] = []
+            self._succs[input_id] = [output_id]
+            self._preds[output_id] = [input_id]
+            self._succs[output_id] = []
+            stamp = (self._num_stamps, self._num_stamps)
+            self._num_stamps += 1
+            self._pred_stamps[input_id] = []
+            self._succ_stamps[input_id] = [stamp]
+            self._pred_stamps[output_id] = [stamp]
+            self._succ_stamps[output_id] = []
+
+            self.input_map[wire] = self._nodes[input_id]
+            self.output_map[wire] = self._nodes[output_id]
+
+            self._invalidate_topological_order()
+        else:
+            raise DAGCircuitError("duplicate wire %s" % (wire,))
 
-            self.input_map[wire] = inp_node
-            self.output_map[wire] = outp_node
+    def _add_node(self, data_dict, wire_indices):
+        """Allocate the next node slot.
 
-            self._multi_graph.add_node(inp_node)
-            self._multi_graph.add_node(outp_node)
+        Args:
+            data_dict (dict): the data of the new DAGNode
+            wire_indices (tuple[int]): indices of the wires touched by the node
 
-            self._multi_graph.add_edge(inp_node,
-                                       outp_node)
+        Returns:
+            int: the id of the new node
+        """
+        node_id = len(self._nodes)
+        self._nodes.append(DAGNode(data_dict=data_dict, nid=node_id))
+        self._node_wires.append(wire_indices)
+        self._preds.append([None] * len(wire_indices))
+        self._succs.append([None] * len(wire_indices))
+        self._pred_stamps.append([None] * len(wire_indices))
+        self._succ_stamps.append([None] * len(wire_indices))
+        self._sort_keys.append(str(data_dict.get('qargs', [])))
+        self._num_nodes += 1
+        return node_id
+
+    def _remove_node(self, node_id):
+        """Free the slot of a node without touching its neighbours."""
+        self._nodes[node_id] = None
+        self._node_wires[node_id] = None
+        self._preds[node_id] = None
+        self._succs[node_id] = None
+        self._pred_stamps[node_id] = None
+        self._succ_stamps[node_id] = None
+        self._sort_keys[node_id] = None
+        self._num_nodes -= 1
+
+    def _invalidate_topological_order(self, node_ids=None):
+        """Discard the part of the cached topological order that a mutation may change.
 
-            self._multi_graph.adj[inp_node][outp_node][0]["name"] \
-                = "%s[%s]" % (wire.register.name, wire.index)
-            self._multi_graph.adj[inp_node][outp_node][0]["wire"] \
-                = wire
-        else:
-            raise DAGCircuitError("duplicate wire %s" % (wire,))
+        Args:
+            node_ids (iterable[int]): ids of the nodes that gain new successors
+                by the mutation. Only the order after the earliest of them is
+                discarded. If None, the whole order is discarded.
+        """
+        if self._topological_order is None:
+            return
+        if node_ids is None:
+            self._topological_valid = 0
+            return
+        position = self._topological_position
+        for node_id in node_ids:
+            if node_id < len(position) and position[node_id] < self._topological_valid:
+                self._topological_valid = position[node_id] + 1
+
+    def _link(self, src_id, dst_id, wire_index):
+        """Connect two nodes by an edge along the given wire.
+
+        The edge replaces whatever successor of src and predecessor of
+        dst were previously recorded for that wire.
+        """
+        succs = self._succs[src_id]
+        succ_stamps = self._succ_stamps[src_id]
+        first = next((succ_stamp[0] for succ, succ_stamp in zip(succs, succ_stamps)
+                      if succ == dst_id), self._num_stamps)
+        stamp = (first, self._num_stamps)
+        self._num_stamps += 1
+
+        src_index = self._node_wires[src_id].index(wire_index)
+        succs[src_index] = dst_id
+        succ_stamps[src_index] = stamp
+        dst_index = self._node_wires[dst_id].index(wire_index)
+        self._preds[dst_id][dst_index] = src_id
+        self._pred_stamps[dst_id][dst_index] = stamp
+
+    def _node_id(self, node):
+        """Return the id of a node, checking that it belongs to this dag.
+
+        Args:
+            node (DAGNode): the node
+
+        Returns:
+            int: the id of the node
+
+        Raises:
+            DAGCircuitError: if the node is not in the dag
+        """
+        node_id = node._node_id
+        if 0 < node_id < len(self._nodes) and self._nodes[node_id] is node:
+            return node_id
+        raise DAGCircuitError("node %s is not in the dag" % node.name)
+
+    def _edge_data(self, wire_index):
+        """Return the attribute dict of an edge along the given wire."""
+        wire = self.wires[wire_index]
+        return {'name': "%s[%s]" % (wire.register.name, wire.index), 'wire': wire}
 
     def _check_condition(self, name, condition):
         """Verify that the condition is valid.
@@ -220,6 +355,10 @@ class DAGCircuit:
             qargs (list[Qubit]): list of quantum wires to attach to.
             cargs (list[Clbit]): list of classical wires to attach to.
             condition (tuple or None): optional condition (ClassicalRegister, int)
+
+        Returns:
+            int: the id of the new node. Its predecessors and successors are
+                left unset and must be linked by the caller.
         """
         node_properties = {
             "type": "op",
@@ -230,11 +369,15 @@ class DAGCircuit:
             "condition": condition
         }
 
-        # Add a new operation node to the graph
-        self._max_node_id += 1
-        new_node = DAGNode(data_dict=node_properties, nid=self._max_node_id)
-        self._multi_graph.add_node(new_node)
-        self._id_to_node[self._max_node_id] = new_node
+        # Each wire gets a single in- and out-edge even if it appears
+        # both as a carg and in the condition.
+        wire_indices = []
+        for wire in itertools.chain(qargs, cargs, self._bits_in_condition(condition)):
+            wire_index = self._wire_indices[wire]
+            if wire_index not in wire_indices:
+                wire_indices.append(wire_index)
+
+        return self._add_node(node_properties, tuple(wire_indices))
 
     def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
         """Apply an operation to the output of the circuit.
@@ -262,25 +405,18 @@ class DAGCircuit:
         self._check_bits(qargs, self.output_map)
         self._check_bits(all_cbits, self.output_map)
 
-        self._add_op_node(op, qargs, cargs, condition)
-
-        # Add new in-edges from predecessors of the output nodes to the
-        # operation node while deleting the old in-edges of the output nodes
-        # and adding new edges from the operation node to each output node
-        al = [qargs, all_cbits]
-        for q in itertools.chain(*al):
-            ie = list(self._multi_graph.predecessors(self.output_map[q]))
-
-            if len(ie) != 1:
-                raise DAGCircuitError("output node has multiple in-edges")
+        node_id = self._add_op_node(op, qargs, cargs, condition)
 
-            self._multi_graph.add_edge(ie[0], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-            self._multi_graph.remove_edge(ie[0], self.output_map[q])
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], self.output_map[q],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
+        # Insert the operation node between each output node and its
+        # predecessor
+        preds = self._preds[node_id]
+        for wire_index in self._node_wires[node_id]:
+            output_id = self.output_map[self.wires[wire_index]]._node_id
+            self._link(self._preds[output_id][0], node_id, wire_index)
+            self._link(node_id, output_id, wire_index)
+        self._invalidate_topological_order(preds)
 
-        return self._id_to_node[self._max_node_id]
+        return self._nodes[node_id]
 
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
@@ -303,22 +439,17 @@ class DAGCircuit:
         self._check_condition(op.name, condition)
         self._check_bits(qargs, self.input_map)
         self._check_bits(all_cbits, self.input_map)
-        self._add_op_node(op, qargs, cargs, condition)
-        # Add new out-edges to successors of the input nodes from the
-        # operation node while deleting the old out-edges of the input nodes
-        # and adding new edges to the operation node from each input node
-        al = [qargs, all_cbits]
-        for q in itertools.chain(*al):
-            ie = list(self._multi_graph.successors(self.input_map[q]))
-            if len(ie) != 1:
-                raise DAGCircuitError("input node has multiple out-edges")
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], ie[0],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-            self._multi_graph.remove_edge(self.input_map[q], ie[0])
-            self._multi_graph.add_edge(self.input_map[q], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-
-        return self._id_to_node[self._max_node_id]
+        node_id = self._add_op_node(op, qargs, cargs, condition)
+
+        # Insert the operation node between each input node and its
+        # successor
+        for wire_index in self._node_wires[node_id]:
+            input_id = self.input_map[self.wires[wire_index]]._node_id
+            self._link(node_id, self._succs[input_id][0], wire_index)
+            self._link(input_id, node_id, wire_index)
+        self._invalidate_topological_order(self._preds[node_id])
+
+        return self._nodes[node_id]
 
     def _check_edgemap_registers(self, edge_map, keyregs, valregs, valreg=True):
         """Check that wiremap neither fragments nor leaves duplicate registers.
@@ -568,13 +699,13 @@ class DAGCircuit:
             Bit: Bit in idle wire.
         """
         for wire in self.wires:
-            nodes = self.nodes_on_wire(wire, only_ops=False)
-            if len([i for i in nodes]) == 2:
+            input_id = self.input_map[wire]._node_id
+            if self._succs[input_id][0] == self.output_map[wire]._node_id:
                 yield wire
 
     def size(self):
         """Return the number of operations."""
-        return self._multi_graph.order() - 2 * len(self.wires)
+        return self._num_nodes - 2 * len(self.wires)
 
     def depth(self):
         """Return the circuit depth.
@@ -583,10 +714,17 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if not a directed acyclic graph
         """
-        if not nx.is_directed_acyclic_graph(self._multi_graph):
-            raise DAGCircuitError("not a DAG")
+        if not self._num_nodes:
+            return 0
 
-        depth = nx.dag_longest_path_length(self._multi_graph) - 1
+        # Length of the longest path (in edges) ending at each node
+        dist = [0] * len(self._nodes)
+        for node_id in self._topological_ids():
+            preds = self._preds[node_id]
+            if preds:
+                dist[node_id] = max(dist[pred] for pred in preds) + 1
+
+        depth = max(dist) - 1
         return depth if depth != -1 else 0
 
     def width(self):
@@ -613,7 +751,25 @@ class DAGCircuit:
 
     def num_tensor_factors(self):
         """Compute how many components the circuit can decompose into."""
-        return nx.number_weakly_connected_components(self._multi_graph)
+        # Union-find over the node ids; every edge joins two components
+        parent = list(range(len(self._nodes)))
+
+        def find(node_id):
+            while parent[node_id] != node_id:
+                parent[node_id] = parent[parent[node_id]]
+                node_id = parent[node_id]
+            return node_id
+
+        for node_id, succs in enumerate(self._succs):
+            if succs is None:
+                continue
+            for succ in succs:
+                root, succ_root = find(node_id), find(succ)
+                if root != succ_root:
+                    parent[succ_root] = root
+
+        return len({find(node_id) for node_id, node in enumerate(self._nodes)
+                    if node is not None})
 
     def _check_wires_list(self, wires, node):
         """Check that a list of wires is compatible with a node to be replaced.
@@ -652,11 +808,10 @@ class DAGCircuit:
                 These map from wire (Register, int) to predecessor (successor)
                 nodes of n.
         """
-
-        pred_map = {e[2]['wire']: e[0] for e in
-                    self._multi_graph.in_edges(nbunch=node, data=True)}
-        succ_map = {e[2]['wire']: e[1] for e in
-                    self._multi_graph.out_edges(nbunch=node, data=True)}
+        node_id = self._node_id(node)
+        wires = [self.wires[wire_index] for wire_index in self._node_wires[node_id]]
+        pred_map = {wire: self._nodes[pred] for wire, pred in zip(wires, self._preds[node_id])}
+        succ_map = {wire: self._nodes[succ] for wire, succ in zip(wires, self._succs[node_id])}
         return pred_map, succ_map
 
     def _full_pred_succ_maps(self, pred_map, succ_map, input_circuit,
@@ -690,18 +845,14 @@ class DAGCircuit:
                 # Otherwise, use the corresponding output nodes of self
                 # and compute the predecessor.
                 full_succ_map[w] = self.output_map[w]
-                full_pred_map[w] = self._multi_graph.predecessors(
-                    self.output_map[w])[0]
-                if len(list(self._multi_graph.predecessors(self.output_map[w]))) != 1:
-                    raise DAGCircuitError("too many predecessors for %s[%d] "
-                                          "output node" % (w.register, w.index))
+                full_pred_map[w] = self._nodes[self._preds[self.output_map[w]._node_id][0]]
 
         return full_pred_map, full_succ_map
 
     def __eq__(self, other):
         # TODO this works but is a horrible way to do this
-        slf = copy.deepcopy(self._multi_graph)
-        oth = copy.deepcopy(other._multi_graph)
+        slf = self._to_networkx()
+        oth = other._to_networkx()
 
         for node in slf.nodes:
             slf.nodes[node]['node'] = node
@@ -715,11 +866,77 @@ class DAGCircuit:
         """
         Yield nodes in topological order.
 
+        Ties between nodes are broken by the string of their qargs and
+        then by node id, so the order only depends on the graph.
+
         Returns:
             generator(DAGNode): node in topological order
         """
-        return nx.lexicographical_topological_sort(self._multi_graph,
-                                                   key=lambda x: str(x.qargs))
+        nodes = self._nodes
+        return iter([nodes[node_id] for node_id in self._topological_ids()])
+
+    def _topological_ids(self):
+        """Return the ids of all nodes in topological order.
+
+        The order is cached. Only the suffix invalidated by mutations since
+        the last call is recomputed, resuming Kahn's algorithm from the
+        state it had at the end of the still valid prefix.
+
+        Returns:
+            list[int]: the ids of the nodes. The list is the cache itself
+                and must not be modified.
+
+        Raises:
+            DAGCircuitError: if not a directed acyclic graph
+        """
+        nodes = self._nodes
+        order = self._topological_order
+        if order is None:
+            order, valid, pending = [], 0, range(1, len(nodes))
+            position = [len(nodes)] * len(nodes)
+        else:
+            valid = self._topological_valid
+            if valid == len(order) == self._num_nodes:
+                return order
+            position = self._topological_position
+            # Nodes not in the valid prefix are those of the stale suffix
+            # plus the ones added since the order was last computed.
+            pending = itertools.chain(order[valid:], range(len(position), len(nodes)))
+            position.extend([len(nodes)] * (len(nodes) - len(position)))
+            order = order[:valid]
+
+        sort_keys = self._sort_keys
+        succs = self._succs
+        indegree = {}
+        ready = []
+        for node_id in pending:
+            if nodes[node_id] is None:
+                continue
+            degree = sum(1 for pred in self._preds[node_id] if position[pred] >= valid)
+            if degree:
+                indegree[node_id] = degree
+            else:
+                ready.append((sort_keys[node_id], node_id))
+        heapq.heapify(ready)
+
+        while ready:
+            _, node_id = heapq.heappop(ready)
+            position[node_id] = len(order)
+            order.append(node_id)
+            for succ in succs[node_id]:
+                indegree[succ] -= 1
+                if not indegree[succ]:
+                    heapq.heappush(ready, (sort_keys[succ], succ))
+                    del indegree[succ]
+
+        if indegree or len(order) != self._num_nodes:
+            self._topological_order = None
+            raise DAGCircuitError("not a DAG")
+
+        self._topological_order = order
+        self._topological_position = position
+        self._topological_valid = len(order)
+        return order
 
     def topological_op_nodes(self):
         """
@@ -801,6 +1018,12 @@ class DAGCircuit:
         pred_map, succ_map = self._make_pred_succ_maps(node)
         full_pred_map, full_succ_map = self._full_pred_succ_maps(pred_map, succ_map,
                                                                  input_dag, wire_map)
+        # Wires of the node that the input circuit does not touch pass
+        # straight through
+        for w in pred_map:
+            if w not in full_pred_map:
+                full_pred_map[w] = pred_map[w]
+                full_succ_map[w] = succ_map[w]
 
         if condition_bit_list:
             # If we are replacing a conditional node, map input dag through
@@ -816,7 +1039,11 @@ class DAGCircuit:
                                           'on which it would be conditioned.')
 
         # Now that we know the connections, delete node
-        self._multi_graph.remove_node(node)
+        self._invalidate_topological_order(nd._node_id for nd in full_pred_map.values())
+        self._remove_node(node._node_id)
+
+        # Predecessor id on each wire of self, as the replacement grows
+        pred_ids = {self._wire_indices[w]: nd._node_id for w, nd in full_pred_map.items()}
 
         # Iterate over nodes of input_circuit
         for sorted_node in input_dag.topological_op_nodes():
@@ -826,36 +1053,18 @@ class DAGCircuit:
                                sorted_node.qargs))
             m_cargs = list(map(lambda x: wire_map.get(x, x),
                                sorted_node.cargs))
-            self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
+            node_id = self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
             # Add edges from predecessor nodes to new node
             # and update predecessor nodes that change
-            all_cbits = self._bits_in_condition(condition)
-            all_cbits.extend(m_cargs)
-            al = [m_qargs, all_cbits]
-            for q in itertools.chain(*al):
-                self._multi_graph.add_edge(full_pred_map[q],
-                                           self._id_to_node[self._max_node_id],
-                                           name="%s[%s]" % (q.register.name, q.index),
-                                           wire=q)
-                full_pred_map[q] = self._id_to_node[self._max_node_id]
-
-        # Connect all predecessors and successors, and remove
-        # residual edges between input and output nodes
-        for w in full_pred_map:
-            self._multi_graph.add_edge(full_pred_map[w],
-                                       full_succ_map[w],
-                                       name="%s[%s]" % (w.register.name, w.index),
-                                       wire=w)
-            o_pred = list(self._multi_graph.predecessors(self.output_map[w]))
-            if len(o_pred) > 1:
-                if len(o_pred) != 2:
-                    raise DAGCircuitError("expected 2 predecessors here")
-
-                p = [x for x in o_pred if x != full_pred_map[w]]
-                if len(p) != 1:
-                    raise DAGCircuitError("expected 1 predecessor to pass filter")
-
-                self._multi_graph.remove_edge(p[0], self.output_map[w])
+            for wire_index in self._node_wires[node_id]:
+                self._link(pred_ids[wire_index], node_id, wire_index)
+                pred_ids[wire_index] = node_id
+
+        # Connect all predecessors and successors. This overwrites any
+        # edge still pointing at the removed node.
+        for w, succ in full_succ_map.items():
+            wire_index = self._wire_indices[w]
+            self._link(pred_ids[wire_index], succ._node_id, wire_index)
 
     def node(self, node_id):
         """Get the node in the dag.
@@ -866,7 +1075,7 @@ class DAGCircuit:
         Returns:
             node: the node.
         """
-        return self._multi_graph.nodes[node_id]
+        return self._nodes[node_id]
 
     def nodes(self):
         """Iterator for node values.
@@ -874,17 +1083,53 @@ class DAGCircuit:
         Yield:
             node: the node.
         """
-        for node in self._multi_graph.nodes:
-            yield node
+        for node in self._nodes:
+            if node is not None:
+                yield node
 
     def edges(self, nodes=None):
-        """Iterator for node values.
+        """Iterator for the out-edges of the given nodes, or of all nodes.
+
+        Args:
+            nodes (DAGNode or list[DAGNode]): the source node(s). If None,
+                all edges of the dag are returned.
 
         Yield:
-            node: the node.
+            tuple(DAGNode, DAGNode, dict): source node, destination node and
+                edge data with the "name" and "wire" of the edge.
+        """
+        if nodes is None:
+            nodes = self.nodes()
+        elif isinstance(nodes, DAGNode):
+            nodes = [nodes]
+
+        for source_node in nodes:
+            source_id = self._node_id(source_node)
+            for wire_index, succ in zip(self._node_wires[source_id], self._succs[source_id]):
+                yield source_node, self._nodes[succ], self._edge_data(wire_index)
+
+    def in_edges(self, node):
+        """Iterator for the in-edges of a node.
+
+        Yield:
+            tuple(DAGNode, DAGNode, dict): source node, destination node and
+                edge data with the "name" and "wire" of the edge.
+        """
+        node_id = self._node_id(node)
+        for wire_index, pred in zip(self._node_wires[node_id], self._preds[node_id]):
+            yield self._nodes[pred], node, self._edge_data(wire_index)
+
+    def out_edges(self, node):
+        """Iterator for the out-edges of a node.
+
+        Args:
+            node (DAGNode): the source node
+
+        Returns:
+            generator(tuple(DAGNode, DAGNode, dict)): source node, destination
+                node and edge data with the "name" and "wire" of the edge.
         """
-        for source_node, dest_node, edge_data in self._multi_graph.edges(nodes, data=True):
-            yield source_node, dest_node, edge_data
+        return self.edges(node)
 
     def op_nodes(self, op=None):
         """Get the list of "op" nodes in the dag.
@@ -896,7 +1141,7 @@ class DAGCircuit:
             list[DAGNode]: the list of node ids containing the given op.
         """
         nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self.nodes():
             if node.type == "op":
                 if op is None or isinstance(node.op, op):
                     nodes.append(node)
@@ -917,7 +1162,7 @@ class DAGCircuit:
     def named_nodes(self, *names):
         """Get the set of "op" nodes with the given name."""
         named_nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self.nodes():
             if node.type == 'op' and node.op.name in names:
                 named_nodes.append(node)
         return named_nodes
@@ -940,45 +1185,108 @@ class DAGCircuit:
 
     def longest_path(self):
         """Returns the longest path in the dag as a list of DAGNodes."""
-        return nx.dag_longest_path(self._multi_graph)
+        if not self._num_nodes:
+            return []
+
+        # Length of the longest path ending at each node and the
+        # predecessor it came through
+        dist = {}
+        for node_id in self._topological_ids():
+            best = (0, node_id)
+            for pred in self._preds[node_id]:
+                if dist[pred][0] + 1 > best[0]:
+                    best = (dist[pred][0] + 1, pred)
+            dist[node_id] = best
+
+        node_id = max(dist, key=lambda x: dist[x][0])
+        path = [self._nodes[node_id]]
+        while dist[node_id][1] != node_id:
+            node_id = dist[node_id][1]
+            path.append(self._nodes[node_id])
+        path.reverse()
+        return path
+
+    def _unique_neighbours(self, node_id, neighbours, stamps, quantum=False):
+        """Return the ids of the neighbours of a node, without repeats, in
+        the order they were first connected to it.
+
+        Args:
+            node_id (int): the id of the node
+            neighbours (list): _preds or _succs
+            stamps (list): _pred_stamps or _succ_stamps
+            quantum (bool): only follow the edges along qubits
+
+        Returns:
+            list[int]: the ids of the neighbours
+        """
+        first_stamps = {}
+        for wire_index, neighbour, stamp in zip(self._node_wires[node_id],
+                                                neighbours[node_id], stamps[node_id]):
+            if not quantum or isinstance(self.wires[wire_index], Qubit):
+                first_stamps.setdefault(neighbour, stamp)
+        return sorted(first_stamps, key=first_stamps.get)
 
     def successors(self, node):
         """Returns iterator of the successors of a node as DAGNodes."""
-        return self._multi_graph.successors(node)
+        succs = self._unique_neighbours(self._node_id(node), self._succs, self._succ_stamps)
+        return (self._nodes[succ] for succ in succs)
 
     def predecessors(self, node):
         """Returns iterator of the predecessors of a node as DAGNodes."""
-        return self._multi_graph.predecessors(node)
+        preds = self._unique_neighbours(self._node_id(node), self._preds, self._pred_stamps)
+        return (self._nodes[pred] for pred in preds)
 
     def quantum_predecessors(self, node):
         """Returns iterator of the predecessors of a node that are
         connected by a quantum edge as DAGNodes."""
-        for predecessor in self.predecessors(node):
-            if isinstance(self._multi_graph.get_edge_data(predecessor, node, key=0)['wire'], Qubit):
-                yield predecessor
+        preds = self._unique_neighbours(self._node_id(node), self._preds, self._pred_stamps,
+                                        quantum=True)
+        return (self._nodes[pred] for pred in preds)
+
+    def _reachable(self, node, neighbours):
+        """Return the set of nodes reachable from node through neighbours."""
+        seen = set()
+        stack = [self._node_id(node)]
+        while stack:
+            for other in neighbours[stack.pop()]:
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        return {self._nodes[node_id] for node_id in seen}
 
     def ancestors(self, node):
         """Returns set of the ancestors of a node as DAGNodes."""
-        return nx.ancestors(self._multi_graph, node)
+        return self._reachable(node, self._preds)
 
     def descendants(self, node):
         """Returns set of the descendants of a node as DAGNodes."""
-        return nx.descendants(self._multi_graph, node)
+        return self._reachable(node, self._succs)
 
     def bfs_successors(self, node):
         """
         Returns an iterator of tuples of (DAGNode, [DAGNodes]) where the DAGNode is the current node
         and [DAGNode] is its successors in  BFS order.
         """
-        return nx.bfs_successors(self._multi_graph, node)
+        source_id = self._node_id(node)
+        seen = {source_id}
+        queue = deque([source_id])
+        while queue:
+            node_id = queue.popleft()
+            children = []
+            for succ in self._unique_neighbours(node_id, self._succs, self._succ_stamps):
+                if succ not in seen:
+                    seen.add(succ)
+                    queue.append(succ)
+                    children.append(self._nodes[succ])
+            if children or node_id == source_id:
+                yield self._nodes[node_id], children
 
     def quantum_successors(self, node):
         """Returns iterator of the successors of a node that are
         connected by a quantum edge as DAGNodes."""
-        for successor in self.successors(node):
-            if isinstance(self._multi_graph.get_edge_data(
-                    node, successor, key=0)['wire'], Qubit):
-                yield successor
+        succs = self._unique_neighbours(self._node_id(node), self._succs, self._succ_stamps,
+                                        quantum=True)
+        return (self._nodes[succ] for succ in succs)
 
     def remove_op_node(self, node):
         """Remove an operation node n.
@@ -989,18 +1297,20 @@ class DAGCircuit:
             raise DAGCircuitError('The method remove_op_node only works on op node types. An "%s" '
                                   'node type was wrongly provided.' % node.type)
 
-        pred_map, succ_map = self._make_pred_succ_maps(node)
-
-        # remove from graph and map
-        self._multi_graph.remove_node(node)
+        node_id = self._node_id(node)
+        self._invalidate_topological_order(self._preds[node_id])
+        # Reconnect the wires in the order of the in-edges of the node
+        edges = sorted(zip(self._pred_stamps[node_id], self._node_wires[node_id],
+                           self._preds[node_id], self._succs[node_id]))
+        for _, wire_index, pred, succ in edges:
+            self._link(pred, succ, wire_index)
 
-        for w in pred_map.keys():
-            self._multi_graph.add_edge(pred_map[w], succ_map[w],
-                                       name="%s[%s]" % (w.register.name, w.index), wire=w)
+        # remove from graph
+        self._remove_node(node_id)
 
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self.ancestors(node)
         # TODO: probably better to do all at once using
         # multi_graph.remove_nodes_from; same for related functions ...
         for anc_node in anc:
@@ -1009,23 +1319,23 @@ class DAGCircuit:
 
     def remove_descendants_of(self, node):
         """Remove all of the descendant operation nodes of node."""
-        desc = nx.descendants(self._multi_graph, node)
+        desc = self.descendants(node)
         for desc_node in desc:
             if desc_node.type == "op":
                 self.remove_op_node(desc_node)
 
     def remove_nonancestors_of(self, node):
         """Remove all of the non-ancestors operation nodes of node."""
-        anc = nx.ancestors(self._multi_graph, node)
-        comp = list(set(self._multi_graph.nodes()) - set(anc))
+        anc = self.ancestors(node)
+        comp = list(set(self.nodes()) - set(anc))
         for n in comp:
             if n.type == "op":
                 self.remove_op_node(n)
 
     def remove_nondescendants_of(self, node):
         """Remove all of the non-descendants operation nodes of node."""
-        dec = nx.descendants(self._multi_graph, node)
-        comp = list(set(self._multi_graph.nodes()) - set(dec))
+        dec = self.descendants(node)
+        comp = list(set(self.nodes()) - set(dec))
         for n in comp:
             if n.type == "op":
                 self.remove_op_node(n)
@@ -1044,32 +1354,15 @@ class DAGCircuit:
         NOT the DAGNodes from the original DAG. The original vs new nodes can be compared using
         DAGNode.semantic_eq(node1, node2)
 
+        Callers that only need the op nodes and partitions of the layers
+        should use op_node_layers(), which does not build a DAGCircuit per
+        layer.
+
         TODO: Gates that use the same cbits will end up in different
         layers as this is currently implemented. This may not be
         the desired behavior.
         """
-        graph_layers = self.multigraph_layers()
-        try:
-            next(graph_layers)  # Remove input nodes
-        except StopIteration:
-            return
-
-        for graph_layer in graph_layers:
-
-            # Get the op nodes from the layer, removing any input and output nodes.
-            op_nodes = [node for node in graph_layer if node.type == "op"]
-
-            # Sort to make sure they are in the order they were added to the original DAG
-            # It has to be done by node_id as graph_layer is just a list of nodes
-            # with no implied topology
-            # Drawing tools that rely on _node_id to infer order of node creation
-            # so we need this to be preserved by layers()
-            op_nodes.sort(key=lambda nd: nd._node_id)
-
-            # Stop yielding once there are no more op_nodes in a layer.
-            if not op_nodes:
-                return
-
+        for layer in self.op_node_layers():
             # Construct a shallow copy of self
             new_layer = DAGCircuit()
             new_layer.name = self.name
@@ -1080,7 +1373,7 @@ class DAGCircuit:
             for qreg in self.qregs.values():
                 new_layer.add_qreg(qreg)
 
-            for node in op_nodes:
+            for node in layer["nodes"]:
                 # this creates new DAGNodes in the new_layer
                 new_layer.apply_operation_back(node.op,
                                                node.qargs,
@@ -1088,14 +1381,48 @@ class DAGCircuit:
                                                node.condition)
 
             # The quantum registers that have an operation in this layer.
-            support_list = [
-                op_node.qargs
-                for op_node in new_layer.op_nodes()
-                if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
-            ]
+            support_list = _layer_partition(new_layer.op_nodes())
 
             yield {"graph": new_layer, "partition": support_list}
 
+    def op_node_layers(self):
+        """Yield the op nodes of each of the d layers of this circuit.
+
+        The layers are the same as those of layers(), but they are read off
+        the graph in a single pass and returned as the DAGNodes of this
+        DAGCircuit, without building a new DAGCircuit for each layer.
+        Each returned layer is a dict containing {"nodes": list of DAGNodes
+        in the order of topological_op_nodes(), "partition": list of qubit
+        lists}.
+        """
+        self._topological_ids()
+        position = self._topological_position
+        nodes = self._nodes
+        preds = self._preds
+        succs = self._succs
+        predecessor_count = {}  # Dict[node id, predecessors not visited]
+        cur_layer = [node._node_id for node in self.input_map.values()]
+        while cur_layer:
+            next_layer = []
+            for node_id in cur_layer:
+                for succ in succs[node_id]:
+                    count = predecessor_count.get(succ, len(preds[succ])) - 1
+                    if count:
+                        predecessor_count[succ] = count
+                    else:
+                        predecessor_count.pop(succ, None)
+                        next_layer.append(succ)
+
+            op_nodes = [nodes[node_id] for node_id in sorted(next_layer, key=position.__getitem__)
+                        if nodes[node_id].type == "op"]
+
+            # Stop yielding once there are no more op_nodes in a layer.
+            if not op_nodes:
+                return
+
+            yield {"nodes": op_nodes, "partition": _layer_partition(op_nodes)}
+            cur_layer = next_layer
+
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
 
@@ -1120,12 +1447,22 @@ class DAGCircuit:
             # Add node to new_layer
             new_layer.apply_operation_back(op, qa, ca, co)
             # Add operation to partition
-            if next_node.name not in ["barrier",
-                                      "snapshot", "save", "load", "noise"]:
+            if next_node.name not in _NON_PARTITION_OPS:
                 support_list.append(list(qa))
             l_dict = {"graph": new_layer, "partition": support_list}
             yield l_dict
 
+    def serial_op_node_layers(self):
+        """Yield a layer for each op node of this circuit, in topological order.
+
+        Like serial_layers(), with the op nodes in the order of
+        topological_op_nodes(), but each layer is a dict containing
+        {"nodes": [DAGNode of this DAGCircuit], "partition": list of qubit
+        lists} instead of a new DAGCircuit.
+        """
+        for next_node in self.topological_op_nodes():
+            yield {"nodes": [next_node], "partition": _layer_partition([next_node])}
+
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
         predecessor_count = dict()  # Dict[node, predecessors not visited]
@@ -1134,17 +1471,16 @@ class DAGCircuit:
         next_layer = []
         while cur_layer:
             for node in cur_layer:
-                # Count multiedges with multiplicity.
-                for successor in self._multi_graph.successors(node):
-                    multiplicity = self._multi_graph.number_of_edges(node, successor)
+                # Successors are listed once per wire, so multiedges are
+                # counted with multiplicity.
+                for successor in self._succs[node._node_id]:
                     if successor in predecessor_count:
-                        predecessor_count[successor] -= multiplicity
+                        predecessor_count[successor] -= 1
                     else:
-                        predecessor_count[successor] = \
-                            self._multi_graph.in_degree(successor) - multiplicity
+                        predecessor_count[successor] = len(self._preds[successor]) - 1
 
                     if predecessor_count[successor] == 0:
-                        next_layer.append(successor)
+                        next_layer.append(self._nodes[successor])
                         del predecessor_count[successor]
 
             yield next_layer
@@ -1175,14 +1511,14 @@ class DAGCircuit:
                     and not nodes_seen[node]:
                 group = [node]
                 nodes_seen[node] = True
-                s = list(self._multi_graph.successors(node))
+                s = list(self.successors(node))
                 while len(s) == 1 and \
                         s[0].type == "op" and \
                         s[0].name in namelist and \
                         s[0].condition is None:
                     group.append(s[0])
                     nodes_seen[s[0]] = True
-                    s = list(self._multi_graph.successors(s[0]))
+                    s = list(self.successors(s[0]))
                 if len(group) >= 1:
                     group_list.append(tuple(group))
         return set(group_list)
@@ -1207,19 +1543,19 @@ class DAGCircuit:
             raise DAGCircuitError('The given wire %s is not present in the circuit'
                                   % str(wire))
 
-        more_nodes = True
-        while more_nodes:
-            more_nodes = False
+        wire_index = self._wire_indices[wire]
+        node_id = current_node._node_id
+        while True:
             # allow user to just get ops on the wire - not the input/output nodes
             if current_node.type == 'op' or not only_ops:
                 yield current_node
 
-            # find the adjacent node that takes the wire being looked at as input
-            for node, edges in self._multi_graph.adj[current_node].items():
-                if any(wire == edge['wire'] for edge in edges.values()):
-                    current_node = node
-                    more_nodes = True
-                    break
+            # follow the successor along the wire being looked at
+            succs = self._succs[node_id]
+            if not succs:
+                break
+            node_id = succs[self._node_wires[node_id].index(wire_index)]
+            current_node = self._nodes[node_id]
 
     def count_ops(self):
         """Count the occurrences of operation names.
@@ -1281,3 +1617,8 @@ class DAGCircuit:
         """
         from qiskit.visualization.dag_visualization import dag_drawer
         return dag_drawer(dag=self, scale=scale, filename=filename, style=style)
+
+
+def _layer_partition(op_nodes):
+    """Return the list of qubit lists acted on by the given op nodes."""
+    return [node.qargs for node in op_nodes if node.name not in _NON_PARTITION_OPS]
@@ -24,6 +24,8 @@ class DAGNode:
     be supplied to functions that take a node.
     """
 
+    __slots__ = ['_node_id', 'data_dict']
+
     def __init__(self, data_dict, nid=-1):
         """Create a node """
         self._node_id = nid
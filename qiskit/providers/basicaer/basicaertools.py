@@ -16,9 +16,22 @@
 
 """
 
+from collections import namedtuple
 from string import ascii_uppercase, ascii_lowercase
 import numpy as np
 from qiskit.exceptions import QiskitError
+from qiskit.qobj import ColumnarQasmQobjExperiment
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
+
+# A unitary gate made by fusing consecutive gates. It is simulated as a
+# 'unitary' qobj instruction.
+FusedGate = namedtuple('FusedGate', ['name', 'qubits', 'params'])
+
+# Names of the gates which may be fused
+_FUSABLE_GATES = ('U', 'u1', 'u2', 'u3', 'CX', 'cx', 'unitary')
+
+# Names of the instructions which do nothing in the simulators
+_NOOP_INSTRUCTIONS = ('id', 'u0', 'barrier')
 
 
 def single_gate_params(gate, params=None):
@@ -71,6 +84,133 @@ def cx_gate_matrix():
                      [0, 1, 0, 0]], dtype=complex)
 
 
+def apply_gate(tensor, gate, axes):
+    """Apply a gate matrix to axes of a tensor, in place when possible.
+
+    The tensor is a statevector, or a unitary matrix, reshaped to one axis of
+    dimension 2 per qubit. Monomial gates, which have a single non-zero entry
+    in every row and column (e.g. u1, cx, x or diagonal gates), permute and
+    scale slices of the tensor in place. Other gates are applied by
+    contracting the tensor with the gate, which returns a new tensor.
+
+    Args:
+        tensor (ndarray): complex tensor with an axis of dimension 2 per qubit.
+        gate (matrix_like): an N-qubit gate matrix.
+        axes (list[int]): the N axes of the tensor the gate is applied to,
+            the axis of the most significant qubit of the gate first.
+
+    Returns:
+        ndarray: the updated tensor. It is tensor itself unless the gate was
+        applied by contraction.
+    """
+    gate = np.asarray(gate, dtype=complex)
+    plan = monomial_plan(gate, axes, tensor.ndim)
+    if plan is not None:
+        apply_monomial_plan(tensor, plan)
+        return tensor
+    return contract_gate(tensor, gate, axes)
+
+
+def contract_gate(tensor, gate, axes):
+    """Return the tensor contracted with a gate matrix on some of its axes.
+
+    Args:
+        tensor (ndarray): complex tensor with an axis of dimension 2 per qubit.
+        gate (ndarray): an N-qubit gate matrix.
+        axes (list[int]): the N axes of the tensor the gate is applied to,
+            the axis of the most significant qubit of the gate first.
+
+    Returns:
+        ndarray: a new tensor.
+    """
+    num_qubits = len(axes)
+    gate_tensor = np.reshape(gate, num_qubits * [2, 2])
+    # Contract the input axes of the gate with the axes of the tensor, and
+    # move the output axes of the gate back to their positions
+    return np.moveaxis(np.tensordot(gate_tensor, tensor,
+                                    axes=(list(range(num_qubits, 2 * num_qubits)), axes)),
+                       list(range(num_qubits)), axes)
+
+
+def monomial_plan(gate, axes, num_axes):
+    """Return how to apply a gate with one non-zero entry per row and column.
+
+    The gate maps the slice of the tensor for basis state j to the slice for
+    basis state i, scaled by gate[i, j], so the slices are permuted along the
+    cycles of the permutation and scaled. The plan lists these cycles, and
+    only depends on the gate, its axes and the number of axes of the tensor,
+    so it can be reused for every tensor the gate is applied to.
+
+    Args:
+        gate (ndarray): an N-qubit gate matrix.
+        axes (list[int]): the N axes of the tensor the gate is applied to,
+            the axis of the most significant qubit of the gate first.
+        num_axes (int): the number of axes of the tensor.
+
+    Returns:
+        list: the plan for ``apply_monomial_plan``, a list of cycles of
+        (target index, source index, factor) steps, or None if the gate is
+        not monomial.
+    """
+    nonzero = gate != 0
+    if not ((nonzero.sum(axis=0) == 1).all() and (nonzero.sum(axis=1) == 1).all()):
+        return None
+    num_qubits = len(axes)
+    dim = 2 ** num_qubits
+    # sources[i] is the basis state mapped to basis state i
+    sources = np.argmax(nonzero, axis=1)
+
+    def index(basis_state):
+        # Slices of length 1 rather than integers, so the views are never scalars
+        slices = [slice(None)] * num_axes
+        for position, axis in enumerate(axes):
+            bit = (basis_state >> (num_qubits - 1 - position)) & 1
+            slices[axis] = slice(bit, bit + 1)
+        return tuple(slices)
+
+    plan = []
+    visited = [False] * dim
+    for start in range(dim):
+        if visited[start]:
+            continue
+        visited[start] = True
+        source = sources[start]
+        if source == start:
+            if gate[start, start] != 1:
+                plan.append([(index(start), index(start), gate[start, start])])
+            continue
+        cycle = []
+        target = start
+        while source != start:
+            visited[source] = True
+            cycle.append((index(target), index(source), gate[target, source]))
+            target, source = source, sources[source]
+        cycle.append((index(target), index(start), gate[target, start]))
+        plan.append(cycle)
+    return plan
+
+
+def apply_monomial_plan(tensor, plan):
+    """Apply a gate to a tensor in place with a plan from ``monomial_plan``.
+
+    Args:
+        tensor (ndarray): complex tensor with an axis of dimension 2 per qubit.
+        plan (list): the plan of the gate.
+    """
+    for cycle in plan:
+        if len(cycle) == 1:
+            target, _, factor = cycle[0]
+            view = tensor[target]
+            np.multiply(view, factor, out=view)
+            continue
+        # The last step of a cycle reads the slice overwritten by the first
+        start = tensor[cycle[-1][1]].copy()
+        for target, source, factor in cycle[:-1]:
+            np.multiply(tensor[source], factor, out=tensor[target])
+        target, _, factor = cycle[-1]
+        np.multiply(start, factor, out=tensor[target])
+
+
 def einsum_matmul_index(gate_indices, number_of_qubits):
     """Return the index string for Numpy.eignsum matrix-matrix multiplication.
 
@@ -178,3 +318,130 @@ def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     # Combine indices into matrix multiplication string format
     # for numpy.einsum function
     return mat_left, mat_right, tens_in, tens_out
+
+
+def instruction_names(experiment):
+    """Return the names of the instructions of a qobj experiment.
+
+    The names of a ``ColumnarQasmQobjExperiment`` are read from its columns,
+    without building its instructions.
+    """
+    if isinstance(experiment, ColumnarQasmQobjExperiment):
+        return experiment.instruction_names
+    return [instruction.name for instruction in experiment.instructions]
+
+
+def fuse_gates(instructions, max_qubits):
+    """Fuse runs of consecutive gates into unitary gates.
+
+    Consecutive unconditional gates are merged into a single unitary gate as
+    long as they act on at most max_qubits qubits in total. Gates which do
+    nothing are dropped, and any other instruction, e.g. measure, reset or a
+    conditional gate, ends the current run.
+
+    Args:
+        instructions (list): the qobj instructions of an experiment.
+        max_qubits (int): the maximum number of qubits of a fused gate.
+
+    Returns:
+        tuple: (fused_instructions, stats) where fused_instructions is the
+        list of instructions with FusedGate instances in place of the fused
+        runs, and stats is a dict with the number of gates before and after
+        fusion and the number of fused gates.
+
+    Raises:
+        QiskitError: if max_qubits is less than 1.
+    """
+    if max_qubits < 1:
+        raise QiskitError('The maximum number of qubits of a fused gate '
+                          'must be at least 1.')
+    fused_instructions = []
+    stats = {'input_gates': 0, 'output_gates': 0, 'fused_gates': 0}
+    # The current run of gates and the qubits it acts on, in order of use
+    run = []
+    run_qubits = []
+
+    def flush():
+        if len(run) == 1:
+            fused_instructions.append(run[0])
+        elif run:
+            fused_instructions.append(FusedGate('unitary', list(run_qubits),
+                                                [_fused_matrix(run, run_qubits)]))
+            stats['fused_gates'] += 1
+        if run:
+            stats['output_gates'] += 1
+        run.clear()
+        run_qubits.clear()
+
+    for instruction in instructions:
+        name = instruction.name
+        if name in _NOOP_INSTRUCTIONS:
+            continue
+        if name not in _FUSABLE_GATES or \
+                getattr(instruction, 'conditional', None) is not None:
+            flush()
+            fused_instructions.append(instruction)
+            continue
+        stats['input_gates'] += 1
+        new_qubits = [qubit for qubit in instruction.qubits if qubit not in run_qubits]
+        if len(run_qubits) + len(new_qubits) > max_qubits:
+            flush()
+            new_qubits = list(instruction.qubits)
+        run.append(instruction)
+        run_qubits.extend(new_qubits)
+    flush()
+    return fused_instructions, stats
+
+
+def gate_matrix(instruction):
+    """Return the matrix of a gate qobj instruction.
+
+    Args:
+        instruction (QasmQobjInstruction): a U, u1, u2, u3, cx or unitary
+            instruction.
+
+    Returns:
+        array: A numpy array representing the matrix, for the qubits of the
+        instruction in little-endian order.
+    """
+    if instruction.name == 'unitary':
+        return np.array(instruction.params[0], dtype=complex)
+    if instruction.name in ('CX', 'cx'):
+        return cx_gate_matrix()
+    return single_gate_matrix(instruction.name, getattr(instruction, 'params', None))
+
+
+def _fused_matrix(gates, qubits):
+    """Return the matrix of applying gates in order, on qubits."""
+    num_qubits = len(qubits)
+    matrix = np.reshape(np.eye(2 ** num_qubits, dtype=complex), 2 * num_qubits * [2])
+    for gate in gates:
+        gate_indices = [qubits.index(qubit) for qubit in gate.qubits]
+        gate_tensor = np.reshape(gate_matrix(gate), 2 * len(gate_indices) * [2])
+        matrix = np.einsum(einsum_matmul_index(gate_indices, num_qubits),
+                           gate_tensor, matrix, dtype=complex, casting='no')
+    return np.reshape(matrix, (2 ** num_qubits, 2 ** num_qubits))
+
+
+def run_experiments(backend, experiments, max_parallel_experiments=1):
+    """Run the experiments of a qobj on a simulator, in parallel if allowed.
+
+    Args:
+        backend (BaseBackend): a basic aer simulator, with its options set.
+        experiments (list[QobjExperiment]): the experiments to run.
+        max_parallel_experiments (int): the maximum number of experiments run
+            at the same time. If 0 the number of CPUs is used.
+
+    Returns:
+        list[dict]: the result of ``backend.run_experiment`` for each
+        experiment, in the order of the experiments.
+    """
+    num_processes = min(max_parallel_experiments or CPU_COUNT, len(experiments))
+    if num_processes <= 1:
+        return [backend.run_experiment(experiment) for experiment in experiments]
+    return parallel_map(_run_experiment, experiments, task_args=(backend,),
+                        num_processes=num_processes)
+
+
+def _run_experiment(experiment, backend):
+    return backend.run_experiment(experiment)
@@ -30,12 +30,14 @@ later be queried for the Result object. The result will contain a 'memory' data
 field, which is a result of measurements for each shot.
 """
 
+import copy
 import uuid
 import time
 import logging
 
 from math import log2
-from collections import Counter
+from collections import Counter, namedtuple
+import operator
 import numpy as np
 
 from qiskit.util import local_hardware_info
@@ -46,10 +48,33 @@ from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
+from .basicaertools import fuse_gates
+from .basicaertools import instruction_names
+from .basicaertools import apply_gate
+from .basicaertools import contract_gate
+from .basicaertools import monomial_plan
+from .basicaertools import apply_monomial_plan
+from .basicaertools import run_experiments
 
 logger = logging.getLogger(__name__)
 
+# An instruction compiled by QasmSimulatorPy._compile_instructions. The
+# condition is None, (_REGISTER_BIT, bit) or (_MEMORY_VALUE, mask, shift, val)
+# and the args depend on the opcode:
+#   _GATE: (gate matrix, statevector axes)
+#   _MONOMIAL_GATE: (plan of the gate from basicaertools.monomial_plan,)
+#   _MEASURE: (qubit, cmembit, cregbit)
+#   _RESET: (qubit,)
+#   _BFUNC: (mask, val, relation function, cregbit, cmembit)
+CompiledInstruction = namedtuple('CompiledInstruction', ['opcode', 'condition', 'args'])
+
+_GATE, _MONOMIAL_GATE, _MEASURE, _RESET, _BFUNC = range(5)
+
+_REGISTER_BIT, _MEMORY_VALUE = range(2)
+
+_RELATIONS = {'==': operator.eq, '!=': operator.ne, '<': operator.lt,
+              '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+
 
 class QasmSimulatorPy(BaseBackend):
     """Python implementation of a qasm simulator."""
@@ -59,7 +84,7 @@ class QasmSimulatorPy(BaseBackend):
     DEFAULT_CONFIGURATION = {
         'backend_name': 'qasm_simulator',
         'backend_version': '2.0.0',
-        'n_qubits': min(24, MAX_QUBITS_MEMORY),
+        'n_qubits': min(30, MAX_QUBITS_MEMORY - 2),
         'url': 'https://github.com/Qiskit/qiskit-terra',
         'simulator': True,
         'local': True,
@@ -106,7 +131,11 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "fusion_enable": False,
+        "fusion_max_qubit": 3,
+        "shot_branching_enable": False,
+        "max_parallel_experiments": 1
     }
 
     # Class level variable to return the final state at the end of simulation
@@ -129,6 +158,10 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_enable = self.DEFAULT_OPTIONS["fusion_enable"]
+        self._fusion_max_qubit = self.DEFAULT_OPTIONS["fusion_max_qubit"]
+        self._shot_branching_enable = self.DEFAULT_OPTIONS["shot_branching_enable"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
@@ -140,16 +173,25 @@ class QasmSimulatorPy(BaseBackend):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
-                                 num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor, self._statevector,
-                                      dtype=complex, casting='no')
+        # Axes of the statevector tensor for the qubits. Qubit 0 is the last
+        # axis of the statevector, and the first qubit is the least
+        # significant qubit of the gate.
+        axes = [self._number_of_qubits - 1 - qubit for qubit in reversed(qubits)]
+        self._statevector = apply_gate(self._statevector, gate, axes)
+
+    def _get_measure_probabilities(self, qubit):
+        """Return the probabilities of the outcomes of measuring a qubit.
+
+        Args:
+            qubit (int): the qubit to measure
+
+        Return:
+            ndarray: the probabilities of outcomes '0' and '1'.
+        """
+        # Axis for numpy.sum to compute probabilities
+        axis = list(range(self._number_of_qubits))
+        axis.remove(self._number_of_qubits - 1 - qubit)
+        return np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
 
     def _get_measure_outcome(self, qubit):
         """Simulate the outcome of measurement of a qubit.
@@ -161,11 +203,7 @@ class QasmSimulatorPy(BaseBackend):
             tuple: pair (outcome, probability) where outcome is '0' or '1' and
             probability is the probability of the returned outcome.
         """
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
-        # Compute einsum index string for 1-qubit matrix multiplication
+        probabilities = self._get_measure_probabilities(qubit)
         random_number = self._local_random.rand()
         if random_number < probabilities[0]:
             return '0', probabilities[0]
@@ -181,7 +219,7 @@ class QasmSimulatorPy(BaseBackend):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            ndarray: The classical memory value of each sample as an integer.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
@@ -201,19 +239,18 @@ class QasmSimulatorPy(BaseBackend):
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_random.choice(range(2 ** num_measured),
-                                            num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        # Python ints if the memory does not fit in a signed 64-bit integer
+        dtype = np.int64 if self._number_of_cmembits < 63 else object
+        samples = samples.astype(dtype)
+        memory = np.full(num_samples, self._classical_memory, dtype=dtype)
+        # Scatter the bit of each measured qubit into its memory bit for
+        # all the samples at once
+        for qubit, cmembit in measure_params:
+            pos = measured_qubits.index(qubit)
+            qubit_outcome = (samples >> pos) & 1
+            memory &= ~(1 << cmembit)
+            memory |= qubit_outcome << cmembit
         return memory
 
     def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
@@ -226,6 +263,18 @@ class QasmSimulatorPy(BaseBackend):
         """
         # get measure outcome
         outcome, probability = self._get_measure_outcome(qubit)
+        self._set_measure_outcome(qubit, outcome, probability, cmembit, cregbit)
+
+    def _set_measure_outcome(self, qubit, outcome, probability, cmembit, cregbit=None):
+        """Store the outcome of a measurement and project the statevector on it.
+
+        Args:
+            qubit (int): qubit is the qubit measured.
+            outcome (str): the outcome of the measurement, '0' or '1'.
+            probability (float): the probability of the outcome.
+            cmembit (int): is the classical memory bit to store outcome in.
+            cregbit (int, optional): is the classical register bit to store outcome in.
+        """
         # update classical state
         membit = 1 << cmembit
         self._classical_memory = (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
@@ -255,6 +304,16 @@ class QasmSimulatorPy(BaseBackend):
         """
         # get measure outcome
         outcome, probability = self._get_measure_outcome(qubit)
+        self._set_reset_outcome(qubit, outcome, probability)
+
+    def _set_reset_outcome(self, qubit, outcome, probability):
+        """Project the statevector on a measurement outcome of a reset qubit.
+
+        Args:
+            qubit (int): the qubit being reset.
+            outcome (str): the outcome of the measurement, '0' or '1'.
+            probability (float): the probability of the outcome.
+        """
         # update quantum state
         if outcome == '0':
             update = [[1 / np.sqrt(probability), 0], [0, 0]]
@@ -280,6 +339,10 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_enable = self.DEFAULT_OPTIONS["fusion_enable"]
+        self._fusion_max_qubit = self.DEFAULT_OPTIONS["fusion_max_qubit"]
+        self._shot_branching_enable = self.DEFAULT_OPTIONS["shot_branching_enable"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
         if backend_options is None:
             backend_options = {}
 
@@ -303,6 +366,19 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for gate fusion, shot branching and parallelization options
+        for option in ('fusion_enable', 'fusion_max_qubit', 'shot_branching_enable',
+                       'max_parallel_experiments'):
+            if option in backend_options:
+                setattr(self, '_' + option, backend_options[option])
+            elif hasattr(qobj_config, option):
+                setattr(self, '_' + option, getattr(qobj_config, option))
+        if self._fusion_max_qubit < 1:
+            raise BasicAerError('fusion_max_qubit must be at least 1: ' +
+                                '{} < 1'.format(self._fusion_max_qubit))
+        if self._max_parallel_experiments < 0:
+            raise BasicAerError('max_parallel_experiments must not be negative: ' +
+                                '{} < 0'.format(self._max_parallel_experiments))
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -347,9 +423,9 @@ class QasmSimulatorPy(BaseBackend):
         # the first measure.
         else:
             measure_flag = False
-            for instruction in experiment.instructions:
+            for name in instruction_names(experiment):
                 # If circuit contains reset operations we cannot sample
-                if instruction.name == "reset":
+                if name == "reset":
                     self._sample_measure = False
                     return
                 # If circuit contains a measure option then we can
@@ -357,15 +433,193 @@ class QasmSimulatorPy(BaseBackend):
                 if measure_flag:
                     # If we find a non-measure instruction
                     # we cannot do measure sampling
-                    if instruction.name not in ["measure", "barrier", "id", "u0"]:
+                    if name not in ["measure", "barrier", "id", "u0"]:
                         self._sample_measure = False
                         return
-                elif instruction.name == "measure":
+                elif name == "measure":
                     measure_flag = True
             # If we made it to the end of the circuit without returning
             # measure sampling is allowed
             self._sample_measure = True
 
+    def _compile_instructions(self, instructions):
+        """Compile the instructions of an experiment for the simulation.
+
+        The matrices and tensor axes of the gates, the classical conditions
+        and the boolean functions are computed once here, instead of for
+        every shot, and instructions which do nothing are dropped.
+
+        Args:
+            instructions (list): the instructions of the experiment.
+
+        Returns:
+            list[CompiledInstruction]: the compiled instructions.
+
+        Raises:
+            BasicAerError: if an instruction is not supported.
+        """
+        compiled = []
+        for operation in instructions:
+            name = operation.name
+            if name in ('id', 'u0', 'barrier'):
+                continue
+            if name == 'unitary':
+                gate = np.asarray(operation.params[0], dtype=complex)
+                opcode, args = self._compile_gate(gate, operation.qubits)
+            elif name in ('U', 'u1', 'u2', 'u3'):
+                gate = single_gate_matrix(name, getattr(operation, 'params', None))
+                opcode, args = self._compile_gate(gate, operation.qubits)
+            elif name in ('CX', 'cx'):
+                opcode, args = self._compile_gate(cx_gate_matrix(), operation.qubits)
+            elif name == 'reset':
+                opcode, args = _RESET, (operation.qubits[0],)
+            elif name == 'measure':
+                cregbit = operation.register[0] if hasattr(operation, 'register') else None
+                opcode, args = _MEASURE, (operation.qubits[0], operation.memory[0], cregbit)
+            elif name == 'bfunc':
+                if operation.relation not in _RELATIONS:
+                    raise BasicAerError('Invalid boolean function relation.')
+                cmembit = operation.memory if hasattr(operation, 'memory') else None
+                opcode, args = _BFUNC, (int(operation.mask, 16), int(operation.val, 16),
+                                        _RELATIONS[operation.relation],
+                                        operation.register, cmembit)
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicAerError(err_msg.format(backend, name))
+            compiled.append(CompiledInstruction(
+                opcode, _compile_condition(getattr(operation, 'conditional', None)), args))
+        return compiled
+
+    def _compile_gate(self, gate, qubits):
+        """Return the opcode and arguments of a gate matrix applied to qubits."""
+        # Axes of the statevector tensor for the qubits. Qubit 0 is the last
+        # axis of the statevector, and the first qubit is the least
+        # significant qubit of the gate.
+        axes = [self._number_of_qubits - 1 - qubit for qubit in reversed(qubits)]
+        plan = monomial_plan(gate, axes, self._number_of_qubits)
+        if plan is not None:
+            return _MONOMIAL_GATE, (plan,)
+        return _GATE, (gate, axes)
+
+    def _check_condition(self, condition):
+        """Return whether the compiled classical condition of an instruction holds.
+
+        Args:
+            condition (tuple): the condition of a CompiledInstruction.
+
+        Returns:
+            bool: True if the instruction is unconditional or its condition holds.
+        """
+        if condition is None:
+            return True
+        if condition[0] == _REGISTER_BIT:
+            return bool((self._classical_register >> condition[1]) & 1)
+        _, mask, shift, val = condition
+        return (self._classical_memory & mask) >> shift == val
+
+    def _apply_operation(self, operation):
+        """Apply a compiled instruction to the statevector and classical registers.
+
+        Args:
+            operation (CompiledInstruction): a compiled instruction.
+        """
+        opcode, _, args = operation
+        if opcode == _MONOMIAL_GATE:
+            apply_monomial_plan(self._statevector, args[0])
+        elif opcode == _GATE:
+            self._statevector = contract_gate(self._statevector, *args)
+        elif opcode == _MEASURE:
+            self._add_qasm_measure(*args)
+        elif opcode == _RESET:
+            self._add_qasm_reset(*args)
+        else:
+            mask, val, relation, cregbit, cmembit = args
+            outcome = relation((self._classical_register & mask) - val, 0)
+
+            # Store outcome in register and optionally memory slot
+            regbit = 1 << cregbit
+            self._classical_register = \
+                (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
+            if cmembit is not None:
+                membit = 1 << cmembit
+                self._classical_memory = \
+                    (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
+
+    def _run_shot_branches(self, instructions):
+        """Simulate all the shots of an experiment by branching the statevector.
+
+        The shots share the simulation of the instructions until a measure or
+        reset. There the shots are split between the two outcomes with a
+        binomial draw, and each outcome with shots continues as a branch with
+        its own projected statevector and classical registers. Branches are
+        simulated depth first, so at most one statevector per pending branch
+        is kept, and the cost scales with the number of branches instead of
+        the number of shots.
+
+        Args:
+            instructions (list[CompiledInstruction]): the compiled instructions
+                of the experiment.
+
+        Returns:
+            tuple: (memory, num_branches) where memory is the classical memory
+            of each shot as an integer array, in random order, and num_branches
+            is the number of branches that were simulated to the end.
+        """
+        self._initialize_statevector()
+        # Branches to simulate, as (index of the next instruction, statevector,
+        # classical memory, classical register, number of shots)
+        branches = [(0, self._statevector, 0, 0, self._shots)]
+        leaves = {}
+        num_branches = 0
+        while branches:
+            start, self._statevector, self._classical_memory, \
+                self._classical_register, shots = branches.pop()
+            for position in range(start, len(instructions)):
+                operation = instructions[position]
+                if not self._check_condition(operation.condition):
+                    continue
+                if operation.opcode not in (_MEASURE, _RESET):
+                    self._apply_operation(operation)
+                    continue
+                qubit = operation.args[0]
+                probabilities = self._get_measure_probabilities(qubit)
+                probability_1 = min(max(probabilities[1], 0.), 1.)
+                shots_1 = self._local_random.binomial(shots, probability_1)
+                if shots_1 == shots:
+                    outcome = '1'
+                elif shots_1 == 0:
+                    outcome = '0'
+                else:
+                    # Continue with outcome '0' and leave outcome '1' for later
+                    saved_state = (self._statevector.copy(), self._classical_memory,
+                                   self._classical_register)
+                    self._set_operation_outcome(operation, '1', probabilities[1])
+                    branches.append((position + 1, self._statevector, self._classical_memory,
+                                     self._classical_register, shots_1))
+                    self._statevector, self._classical_memory, \
+                        self._classical_register = saved_state
+                    outcome = '0'
+                    shots -= shots_1
+                self._set_operation_outcome(operation, outcome, probabilities[int(outcome)])
+            num_branches += 1
+            leaves[self._classical_memory] = leaves.get(self._classical_memory, 0) + shots
+
+        # Python ints if the memory does not fit in a signed 64-bit integer
+        dtype = np.int64 if self._number_of_cmembits < 63 else object
+        memory = np.repeat(np.array(list(leaves), dtype=dtype), list(leaves.values()))
+        if self._memory:
+            self._local_random.shuffle(memory)
+        return memory, num_branches
+
+    def _set_operation_outcome(self, operation, outcome, probability):
+        """Apply a compiled measure or reset instruction with a given outcome."""
+        if operation.opcode == _RESET:
+            self._set_reset_outcome(operation.args[0], outcome, probability)
+        else:
+            self._set_measure_outcome(operation.args[0], outcome, probability,
+                                      *operation.args[1:])
+
     def run(self, qobj, backend_options=None):
         """Run qobj asynchronously.
 
@@ -379,16 +633,45 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "fusion_enable": bool
+                * "fusion_max_qubit": int
+                * "shot_branching_enable": bool
+                * "max_parallel_experiments": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "fusion_enable" option fuses runs of consecutive gates into
+            unitary gates before the simulation, so the statevector is updated
+            once per fused gate instead of once per gate. The default value is
+            False. The "fusion_max_qubit" option is the maximum number of
+            qubits of a fused gate; the default value is 3. The number of gates
+            before and after fusion is reported in the "fusion" entry of the
+            metadata of each experiment result.
+
+            The "shot_branching_enable" option simulates all the shots of a
+            circuit that cannot be sampled from its final statevector (because
+            of resets or gates after measurements) at once. The statevector is
+            only copied when the shots branch on different measure or reset
+            outcomes, so the cost scales with the number of distinct outcomes
+            rather than the number of shots. The default value is False. The
+            number of branches is reported in the "shot_branching" entry of the
+            metadata of each experiment result.
+
+            The "max_parallel_experiments" option is the maximum number of
+            experiments of the qobj simulated in parallel worker processes.
+            If it is 0 the number of CPUs is used. The default value is 1, so
+            the experiments are simulated one after the other. Experiments
+            without a seed are given one before they are distributed, so the
+            results do not depend on the number of workers.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
+                    "fusion_enable": True
                 }
         """
         self._set_options(qobj_config=qobj.config,
@@ -409,13 +692,14 @@ class QasmSimulatorPy(BaseBackend):
             Result: Result object
         """
         self._validate(qobj)
-        result_list = []
         self._shots = qobj.config.shots
         self._memory = getattr(qobj.config, 'memory', False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        experiments = qobj.experiments
+        if self._max_parallel_experiments != 1:
+            experiments = [self._seed_experiment(experiment) for experiment in experiments]
+        result_list = run_experiments(self, experiments, self._max_parallel_experiments)
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -429,6 +713,31 @@ class QasmSimulatorPy(BaseBackend):
 
         return Result.from_dict(result)
 
+    def _seed_experiment(self, experiment):
+        """Return the experiment with the seed it is simulated with.
+
+        The seeds of experiments without a seed_simulator in their config or
+        in the qobj config are drawn here in the order of the experiments, as
+        when they are run one after the other, so that experiments run in
+        parallel get the same seeds.
+
+        Args:
+            experiment (QobjExperiment): experiment from qobj experiments list
+
+        Returns:
+            QobjExperiment: the experiment, or a copy of it with a
+            seed_simulator in its config.
+        """
+        if hasattr(experiment.config, 'seed_simulator') or \
+                hasattr(self._qobj_config, 'seed_simulator'):
+            return experiment
+        experiment = copy.copy(experiment)
+        experiment.config = copy.copy(experiment.config)
+        # For compatibility on Windows force dyte to be int32
+        # and set the maximum value to be (2 ** 31) - 1
+        experiment.config.seed_simulator = np.random.randint(2147483647, dtype='int32')
+        return experiment
+
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
 
@@ -477,6 +786,14 @@ class QasmSimulatorPy(BaseBackend):
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
+        instructions = experiment.instructions
+        metadata = {}
+        if self._fusion_enable:
+            instructions, fusion_stats = fuse_gates(instructions, self._fusion_max_qubit)
+            metadata['fusion'] = dict(enabled=True, max_qubit=self._fusion_max_qubit,
+                                      **fusion_stats)
+        instructions = self._compile_instructions(instructions)
+
         # List of final counts for all shots
         memory = []
         # Check if we can sample measurements, if so we only perform 1 shot
@@ -486,6 +803,13 @@ class QasmSimulatorPy(BaseBackend):
             # Store (qubit, cmembit) pairs for all measure ops in circuit to
             # be sampled
             measure_sample_ops = []
+        elif self._shot_branching_enable and self._shots > 1:
+            # Simulate all the shots at once, branching at measures and resets
+            shots = 0
+            memory, num_branches = self._run_shot_branches(instructions)
+            metadata['shot_branching'] = dict(enabled=True, branches=num_branches)
+            if self._number_of_cmembits == 0:
+                memory = []
         else:
             shots = self._shots
         for _ in range(shots):
@@ -493,97 +817,16 @@ class QasmSimulatorPy(BaseBackend):
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, 'conditional', None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-
-                # Check if single  gate
-                if operation.name == 'unitary':
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                # Check if reset
-                elif operation.name == 'reset':
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
-                # Check if measure
-                elif operation.name == 'measure':
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, 'register') else None
-
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
-                elif operation.name == 'bfunc':
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, 'memory') else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == '==':
-                        outcome = (compared == 0)
-                    elif relation == '!=':
-                        outcome = (compared != 0)
-                    elif relation == '<':
-                        outcome = (compared < 0)
-                    elif relation == '<=':
-                        outcome = (compared <= 0)
-                    elif relation == '>':
-                        outcome = (compared > 0)
-                    elif relation == '>=':
-                        outcome = (compared >= 0)
-                    else:
-                        raise BasicAerError('Invalid boolean function relation.')
-
-                    # Store outcome in register and optionally memory slot
-                    regbit = 1 << cregbit
-                    self._classical_register = \
-                        (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
-                    if cmembit is not None:
-                        membit = 1 << cmembit
-                        self._classical_memory = \
-                            (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
+            for operation in instructions:
+                if operation.condition is not None and \
+                        not self._check_condition(operation.condition):
+                    continue
+                if operation.opcode == _MEASURE and self._sample_measure:
+                    # If sampling measurements record the qubit and cmembit
+                    # for this measurement for later sampling
+                    measure_sample_ops.append(operation.args[:2])
                 else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicAerError(err_msg.format(backend, operation.name))
+                    self._apply_operation(operation)
 
             # Add final creg data to memory list
             if self._number_of_cmembits > 0:
@@ -596,10 +839,20 @@ class QasmSimulatorPy(BaseBackend):
                     memory.append(hex(int(outcome, 2)))
 
         # Add data
-        data = {'counts': dict(Counter(memory))}
-        # Optionally add memory list
-        if self._memory:
-            data['memory'] = memory
+        if isinstance(memory, np.ndarray):
+            # Count the sampled memory values, and only convert each distinct
+            # value to hex
+            values, inverse, counts = np.unique(memory, return_inverse=True,
+                                                return_counts=True)
+            hex_values = [hex(int(value)) for value in values]
+            data = {'counts': dict(zip(hex_values, counts.tolist()))}
+            if self._memory:
+                data['memory'] = np.array(hex_values, dtype=object)[inverse].tolist()
+        else:
+            data = {'counts': dict(Counter(memory))}
+            # Optionally add memory list
+            if self._memory:
+                data['memory'] = memory
         # Optionally add final statevector
         if self.SHOW_FINAL_STATE:
             data['statevector'] = self._get_statevector()
@@ -609,14 +862,17 @@ class QasmSimulatorPy(BaseBackend):
             if 'memory' in data and not data['memory']:
                 data.pop('memory')
         end = time.time()
-        return {'name': experiment.header.name,
-                'seed_simulator': seed_simulator,
-                'shots': self._shots,
-                'data': data,
-                'status': 'DONE',
-                'success': True,
-                'time_taken': (end - start),
-                'header': experiment.header.to_dict()}
+        result = {'name': experiment.header.name,
+                  'seed_simulator': seed_simulator,
+                  'shots': self._shots,
+                  'data': data,
+                  'status': 'DONE',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': experiment.header.to_dict()}
+        if metadata:
+            result['metadata'] = metadata
+        return result
 
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas."""
@@ -631,6 +887,20 @@ class QasmSimulatorPy(BaseBackend):
             if experiment.config.memory_slots == 0:
                 logger.warning('No classical registers in circuit "%s", '
                                'counts will be empty.', name)
-            elif 'measure' not in [op.name for op in experiment.instructions]:
+            elif 'measure' not in instruction_names(experiment):
                 logger.warning('No measurements in circuit "%s", '
                                'classical register will remain all zeros.', name)
+
+
+def _compile_condition(conditional):
+    """Return the compiled condition of the conditional of an instruction."""
+    if conditional is None:
+        return None
+    if isinstance(conditional, int):
+        return (_REGISTER_BIT, conditional)
+    mask = int(conditional.mask, 16)
+    if mask == 0:
+        return None
+    # Number of trailing zeros of the mask
+    shift = (mask & -mask).bit_length() - 1
+    return (_MEMORY_VALUE, mask, shift, int(conditional.val, 16))
@@ -43,7 +43,7 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
     DEFAULT_CONFIGURATION = {
         'backend_name': 'statevector_simulator',
         'backend_version': '1.0.0',
-        'n_qubits': min(24, MAX_QUBITS_MEMORY),
+        'n_qubits': min(30, MAX_QUBITS_MEMORY - 2),
         'url': 'https://github.com/Qiskit/qiskit-terra',
         'simulator': True,
         'local': True,
@@ -111,6 +111,8 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
                 * "chop_threshold": double
+                * "fusion_enable": bool
+                * "fusion_max_qubit": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
@@ -121,11 +123,17 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             setting small values to zero in the output statevector. The default
             value is 1e-15.
 
+            The "fusion_enable" option fuses runs of consecutive gates into
+            unitary gates of at most "fusion_max_qubit" qubits before the
+            simulation. It is disabled by default, and "fusion_max_qubit"
+            defaults to 3.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
-                    "chop_threshold": 1e-15
+                    "chop_threshold": 1e-15,
+                    "fusion_enable": True
                 }
         """
         return super().run(qobj, backend_options=backend_options)
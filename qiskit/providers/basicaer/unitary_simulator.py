@@ -29,11 +29,15 @@ data field, which is a 2**n x 2**n complex numpy array representing the
 circuit's unitary matrix.
 """
 import logging
+import os
+import tempfile
 import uuid
 import time
+import weakref
 from math import log2, sqrt
 import numpy as np
 from qiskit.util import local_hardware_info
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
@@ -41,7 +45,12 @@ from qiskit.result import Result
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_matmul_index
+from .basicaertools import apply_gate
+from .basicaertools import instruction_names
+from .basicaertools import contract_gate
+from .basicaertools import monomial_plan
+from .basicaertools import apply_monomial_plan
+from .basicaertools import run_experiments
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +114,11 @@ class UnitarySimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_unitary": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "max_parallel_experiments": 1,
+        "max_memory_mb": None,
+        "memmap_dir": None,
+        "max_parallel_blocks": 1
     }
 
     def __init__(self, configuration=None, provider=None):
@@ -118,6 +131,10 @@ class UnitarySimulatorPy(BaseBackend):
         self._number_of_qubits = 0
         self._initial_unitary = None
         self._chop_threshold = 1e-15
+        self._max_parallel_experiments = 1
+        self._max_memory_mb = None
+        self._memmap_dir = None
+        self._max_parallel_blocks = 1
 
     def _add_unitary(self, gate, qubits):
         """Apply an N-qubit unitary matrix.
@@ -126,16 +143,10 @@ class UnitarySimulatorPy(BaseBackend):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_matmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
-                                 num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._unitary = np.einsum(indexes, gate_tensor, self._unitary,
-                                  dtype=complex, casting='no')
+        # Axes of the row indices of the unitary tensor for the qubits. The
+        # row indices are the first N axes of the tensor, with qubit 0 last.
+        axes = [self._number_of_qubits - 1 - qubit for qubit in reversed(qubits)]
+        self._unitary = apply_gate(self._unitary, gate, axes)
 
     def _validate_initial_unitary(self):
         """Validate an initial unitary matrix"""
@@ -155,6 +166,10 @@ class UnitarySimulatorPy(BaseBackend):
         # Reset default options
         self._initial_unitary = self.DEFAULT_OPTIONS["initial_unitary"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
+        self._max_memory_mb = self.DEFAULT_OPTIONS["max_memory_mb"]
+        self._memmap_dir = self.DEFAULT_OPTIONS["memmap_dir"]
+        self._max_parallel_blocks = self.DEFAULT_OPTIONS["max_parallel_blocks"]
         if backend_options is None:
             backend_options = {}
 
@@ -185,6 +200,20 @@ class UnitarySimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for the parallelization and memory options
+        for option in ('max_parallel_experiments', 'max_memory_mb', 'memmap_dir',
+                       'max_parallel_blocks'):
+            if option in backend_options:
+                setattr(self, '_' + option, backend_options[option])
+            elif hasattr(qobj_config, option):
+                setattr(self, '_' + option, getattr(qobj_config, option))
+        for option in ('max_parallel_experiments', 'max_parallel_blocks'):
+            if getattr(self, '_' + option) < 0:
+                raise BasicAerError('{} must not be negative: {} < 0'.format(
+                    option, getattr(self, '_' + option)))
+        if self._max_memory_mb is not None and self._max_memory_mb <= 0:
+            raise BasicAerError('max_memory_mb must be positive: ' +
+                                '{} <= 0'.format(self._max_memory_mb))
 
     def _initialize_unitary(self):
         """Set the initial unitary for simulation"""
@@ -223,6 +252,10 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "max_parallel_experiments": int
+                * "max_memory_mb": int
+                * "memmap_dir": str
+                * "max_parallel_blocks": int
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -233,6 +266,25 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "max_parallel_experiments" option is the maximum number of
+            experiments of the qobj simulated in parallel worker processes.
+            If it is 0 the number of CPUs is used. The default value is 1.
+
+            The "max_memory_mb" option bounds the memory used to evolve the
+            unitary. If the unitary and the intermediate results of a gate do
+            not fit, the unitary is evolved by blocks of columns that fit, and
+            stored in a numpy.memmap file in the "memmap_dir" directory (by
+            default the temporary directory). The "max_parallel_blocks"
+            option is the maximum number of blocks evolved in parallel worker
+            processes, each within its share of "max_memory_mb". If it is 0
+            the number of CPUs is used. By default the memory is not bounded
+            and the unitary is evolved at once, and "max_parallel_blocks" is
+            only used with "max_memory_mb".
+
+            The budget only bounds the evolution: the Result still converts
+            the unitary to nested lists of complex numbers, which take
+            several times the memory of the unitary itself.
+
             Example::
 
                 backend_options = {
@@ -261,10 +313,8 @@ class UnitarySimulatorPy(BaseBackend):
             Result: Result object
         """
         self._validate(qobj)
-        result_list = []
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        result_list = run_experiments(self, qobj.experiments, self._max_parallel_experiments)
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -310,19 +360,57 @@ class UnitarySimulatorPy(BaseBackend):
 
         # Validate the dimension of initial unitary if set
         self._validate_initial_unitary()
-        self._initialize_unitary()
+        gates = self._get_gates(experiment)
+        num_workers = min(self._max_parallel_blocks or CPU_COUNT,
+                          2 ** self._number_of_qubits)
+        block_size = self._get_block_size(num_workers)
+        if block_size is None:
+            self._initialize_unitary()
+            for gate, qubits in gates:
+                self._add_unitary(gate, qubits)
+            # Add final state to data
+            data = {'unitary': self._get_unitary()}
+            metadata = None
+        else:
+            data = {'unitary': self._get_blocked_unitary(gates, block_size, num_workers)}
+            metadata = {'blocks': dict(enabled=True, block_size=block_size,
+                                       num_blocks=2 ** self._number_of_qubits // block_size)}
+        end = time.time()
+        result = {'name': experiment.header.name,
+                  'shots': 1,
+                  'data': data,
+                  'status': 'DONE',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': experiment.header.to_dict()}
+        if metadata:
+            result['metadata'] = metadata
+        return result
+
+    def _get_gates(self, experiment):
+        """Return the gates of an experiment as (matrix, qubits) pairs.
+
+        Args:
+            experiment (QobjExperiment): a qobj experiment.
+
+        Returns:
+            list: the (matrix, qubits) pairs of the gates of the experiment.
 
+        Raises:
+            BasicAerError: if an instruction is not supported.
+        """
+        gates = []
         for operation in experiment.instructions:
             if operation.name == 'unitary':
                 qubits = operation.qubits
                 gate = operation.params[0]
-                self._add_unitary(gate, qubits)
+                gates.append((gate, qubits))
             # Check if single  gate
             elif operation.name in ('U', 'u1', 'u2', 'u3'):
                 params = getattr(operation, 'params', None)
                 qubit = operation.qubits[0]
                 gate = single_gate_matrix(operation.name, params)
-                self._add_unitary(gate, [qubit])
+                gates.append((gate, [qubit]))
             elif operation.name in ('id', 'u0'):
                 pass
             # Check if CX gate
@@ -330,7 +418,7 @@ class UnitarySimulatorPy(BaseBackend):
                 qubit0 = operation.qubits[0]
                 qubit1 = operation.qubits[1]
                 gate = cx_gate_matrix()
-                self._add_unitary(gate, [qubit0, qubit1])
+                gates.append((gate, [qubit0, qubit1]))
             # Check if barrier
             elif operation.name == 'barrier':
                 pass
@@ -338,16 +426,96 @@ class UnitarySimulatorPy(BaseBackend):
                 backend = self.name()
                 err_msg = '{0} encountered unrecognized operation "{1}"'
                 raise BasicAerError(err_msg.format(backend, operation.name))
-        # Add final state to data
-        data = {'unitary': self._get_unitary()}
-        end = time.time()
-        return {'name': experiment.header.name,
-                'shots': 1,
-                'data': data,
-                'status': 'DONE',
-                'success': True,
-                'time_taken': (end - start),
-                'header': experiment.header.to_dict()}
+        return gates
+
+    def _get_block_size(self, num_workers):
+        """Return the number of columns of the blocks of the unitary.
+
+        Args:
+            num_workers (int): the number of blocks evolved at the same time.
+
+        Returns:
+            int: a power of 2, or None if the whole unitary is evolved at once.
+
+        Raises:
+            BasicAerError: if a single column does not fit in max_memory_mb.
+        """
+        if self._max_memory_mb is None:
+            return None
+        dim = 2 ** self._number_of_qubits
+        # A block and the result of contracting it with a gate, of 16 bytes
+        # per complex entry, must fit in the share of a worker
+        max_columns = int(self._max_memory_mb * 1024 ** 2 / num_workers) // (32 * dim)
+        if max_columns >= dim and num_workers == 1:
+            return None
+        if max_columns < 1:
+            raise BasicAerError('max_memory_mb is too small to evolve a column of a ' +
+                                '{}-qubit unitary: {}'.format(self._number_of_qubits,
+                                                              self._max_memory_mb))
+        return 2 ** int(log2(min(max_columns, dim // num_workers)))
+
+    def _get_blocked_unitary(self, gates, block_size, num_workers):
+        """Evolve the unitary by blocks of columns stored in a memmap file.
+
+        Args:
+            gates (list): the (matrix, qubits) pairs of the gates.
+            block_size (int): the number of columns of a block.
+            num_workers (int): the number of blocks evolved at the same time.
+
+        Returns:
+            numpy.memmap: the unitary in JSON Result spec format.
+        """
+        num_qubits = self._number_of_qubits
+        dim = 2 ** num_qubits
+        # The row axes of a block are the first axes of its tensor, and the
+        # columns the last axis
+        compiled_gates = []
+        for gate, qubits in gates:
+            gate = np.asarray(gate, dtype=complex)
+            axes = [num_qubits - 1 - qubit for qubit in reversed(qubits)]
+            compiled_gates.append((gate, axes, monomial_plan(gate, axes, num_qubits + 1)))
+        tmp_fd, path = tempfile.mkstemp(suffix='.unitary', dir=self._memmap_dir)
+        os.close(tmp_fd)
+        unitary = None
+        try:
+            unitary = np.memmap(path, dtype=float, mode='w+', shape=(dim, dim, 2))
+        finally:
+            if unitary is None:
+                _remove(path)
+        # Remove the file once the memmap is garbage collected
+        weakref.finalize(unitary, _remove, path)
+        starts = list(range(0, dim, block_size))
+        if num_workers > 1:
+            parallel_map(_evolve_block, starts,
+                         task_args=(self, compiled_gates, block_size, path),
+                         num_processes=num_workers)
+        else:
+            for start in starts:
+                self._evolve_block(start, compiled_gates, block_size, path)
+        return unitary
+
+    def _evolve_block(self, start, compiled_gates, block_size, path):
+        """Evolve the block of columns starting at start and store it in path."""
+        dim = 2 ** self._number_of_qubits
+        if self._initial_unitary is None:
+            block = np.zeros((dim, block_size), dtype=complex)
+            block[np.arange(start, start + block_size), np.arange(block_size)] = 1
+        else:
+            block = np.array(self._initial_unitary[:, start:start + block_size], dtype=complex)
+        block = np.reshape(block, self._number_of_qubits * [2] + [block_size])
+        for gate, axes, plan in compiled_gates:
+            if plan is not None:
+                apply_monomial_plan(block, plan)
+            else:
+                block = contract_gate(block, gate, axes)
+        block = np.reshape(block, (dim, block_size))
+        # Expand complex numbers and truncate small values
+        block = np.stack((block.real, block.imag), axis=-1)
+        block[abs(block) < self._chop_threshold] = 0.0
+        unitary = np.memmap(path, dtype=float, mode='r+', shape=(dim, dim, 2))
+        unitary[:, start:start + block_size] = block
+        unitary.flush()
+        del unitary
 
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas.
@@ -372,8 +540,20 @@ class UnitarySimulatorPy(BaseBackend):
                             'Setting shots=1 for circuit "%s".',
                             self.name(), name)
                 experiment.config.shots = 1
-            for operation in experiment.instructions:
-                if operation.name in ['measure', 'reset']:
+            for operation_name in instruction_names(experiment):
+                if operation_name in ['measure', 'reset']:
                     raise BasicAerError('Unsupported "%s" instruction "%s" ' +
                                         'in circuit "%s" ', self.name(),
-                                        operation.name, name)
+                                        operation_name, name)
+
+
+def _evolve_block(start, backend, compiled_gates, block_size, path):
+    # pylint: disable=protected-access
+    backend._evolve_block(start, compiled_gates, block_size, path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -20,6 +20,7 @@ by creating a stack of lexers.
 """
 
 import os
+import threading
 
 import ply.lex as lex
 from sympy import Number
@@ -30,6 +31,10 @@ from .exceptions import QasmError
 CORE_LIBS_PATH = os.path.join(os.path.dirname(__file__), 'libs')
 CORE_LIBS = os.listdir(CORE_LIBS_PATH)
 
+# PLY lexers of the lexer classes, built once and cloned by their instances
+_LEXERS = {}
+_LEXERS_LOCK = threading.Lock()
+
 
 class QasmLexer:
     """OPENQASM Lexer.
@@ -42,7 +47,7 @@ class QasmLexer:
 
     def __mklexer__(self, filename):
         """Create a PLY lexer."""
-        self.lexer = lex.lex(module=self, debug=False)
+        self.lexer = self._make_lexer()
         self.filename = filename
         self.lineno = 1
 
@@ -56,6 +61,25 @@ class QasmLexer:
         self.__mklexer__(filename)
         self.stack = []
 
+    def _make_lexer(self):
+        """Clone the PLY lexer of this class, building it the first time."""
+        cls = type(self)
+        lexer = _LEXERS.get(cls)
+        if lexer is None:
+            with _LEXERS_LOCK:
+                lexer = _LEXERS.get(cls)
+                if lexer is None:
+                    # Built on an empty instance, so that it doesn't keep
+                    # this one alive
+                    lexer = _LEXERS[cls] = lex.lex(module=cls.__new__(cls), debug=False)
+        lexer = lexer.clone(self)
+        # clone() rebinds the rules but not the EOF functions of the states,
+        # and begin() selects the rebound functions of the initial state
+        lexer.lexstateeoff = {state: getattr(self, function.__name__)
+                              for state, function in lexer.lexstateeoff.items()}
+        lexer.begin('INITIAL')
+        return lexer
+
     def input(self, data):
         """Set the input text data."""
         self.data = data
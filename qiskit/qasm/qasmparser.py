@@ -15,8 +15,8 @@
 """OpenQASM parser."""
 
 import os
-import shutil
-import tempfile
+import threading
+import types
 import warnings
 
 import ply.yacc as yacc
@@ -26,6 +26,11 @@ from . import node
 from .exceptions import QasmError
 from .qasmlexer import QasmLexer
 
+# LALR tables of the parser classes, generated by their first instance and
+# read by the others instead of generating them again
+_PARSE_TABLES = {}
+_PARSE_TABLES_LOCK = threading.Lock()
+
 
 class QasmParser:
     """OPENQASM Parser."""
@@ -38,15 +43,12 @@ class QasmParser:
             filename = ""
         self.lexer = QasmLexer(filename)
         self.tokens = self.lexer.tokens
-        self.parse_dir = tempfile.mkdtemp(prefix='qiskit')
         self.precedence = (
             ('left', '+', '-'),
             ('left', '*', '/'),
             ('left', 'negative', 'positive'),
             ('right', '^'))
-        # For yacc, also, write_tables = Bool and optimize = Bool
-        self.parser = yacc.yacc(module=self, debug=False,
-                                outputdir=self.parse_dir)
+        self.parser = self._make_parser()
         self.qasm = None
         self.parse_deb = False
         self.global_symtab = {}                          # global symtab
@@ -59,8 +61,24 @@ class QasmParser:
         return self
 
     def __exit__(self, *args):
-        if os.path.exists(self.parse_dir):
-            shutil.rmtree(self.parse_dir)
+        pass
+
+    def _make_parser(self):
+        """Create the PLY parser, generating the parse tables only once per class."""
+        cls = type(self)
+        tables = _PARSE_TABLES.get(cls)
+        if tables is None:
+            with _PARSE_TABLES_LOCK:
+                tables = _PARSE_TABLES.get(cls)
+                if tables is None:
+                    parser = yacc.yacc(module=self, debug=False, write_tables=False)
+                    _PARSE_TABLES[cls] = _tables_module(parser)
+                    return parser
+        # The tables were generated from the grammar of this same class, so
+        # their signature is not checked (optimize=True). Nothing is written
+        # to outputdir.
+        return yacc.yacc(module=self, debug=False, tabmodule=tables, optimize=True,
+                         write_tables=False, outputdir=os.path.dirname(__file__))
 
     def update_symtab(self, obj):
         """Update a node in the symbol table.
@@ -1107,3 +1125,18 @@ class QasmParser:
         ast = self.parser.parse(data, debug=True)
         self.parser.parse(data, debug=True)
         ast.to_string(0)
+
+
+def _tables_module(parser):
+    """Return a module with the parse tables of ``parser``, as read by yacc."""
+    tables = types.ModuleType('parsetab')
+    tables._tabversion = yacc.__tabversion__
+    tables._lr_method = 'LALR'
+    tables._lr_signature = None
+    tables._lr_action = parser.action
+    tables._lr_goto = parser.goto
+    tables._lr_productions = [(str(production), production.name, production.len,
+                               production.func, os.path.basename(production.file),
+                               production.line)
+                              for production in parser.productions]
+    return tables
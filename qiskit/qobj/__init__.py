@@ -25,6 +25,8 @@ from .models.pulse import (PulseQobjInstruction, PulseQobjExperimentConfig,
 from .models.qasm import (QasmQobjInstruction, QasmQobjExperimentConfig,
                           QasmQobjExperiment, QasmQobjConfig)
 
+from .columnar import ColumnarQasmQobjExperiment
+
 from .qobj import Qobj, QasmQobj, PulseQobj
 
 from .utils import validate_qobj_against_schema
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Columnar representation of QASM qobj experiments."""
+
+import copy
+from array import array
+
+import sympy
+
+from qiskit.validation import BaseModel
+from .models.qasm import QasmQobjInstruction, QasmQobjExperiment
+
+
+class ColumnarQasmQobjExperiment(QasmQobjExperiment):
+    """A QASM qobj experiment with its instructions stored in columns.
+
+    Instead of a ``QasmQobjInstruction`` model per instruction, the experiment
+    keeps the opcode of each instruction, indexing a table of instruction
+    names, the qubits and memory slots of all the instructions in flat integer
+    arrays with the offsets of each instruction in them, and the parameters in
+    a pool with their offsets. The other fields, e.g. ``conditional``,
+    ``register`` or the fields of ``bfunc`` instructions, are kept in a dict
+    for the instructions that have them.
+
+    Neither the experiment nor its instructions are validated when they are
+    created; ``validate()`` validates them against the schema of
+    ``QasmQobjExperiment``. ``to_dict()`` returns the same dict as the
+    ``to_dict()`` of the equivalent ``QasmQobjExperiment``, without going
+    through marshmallow, and ``instructions`` builds ``QasmQobjInstruction``
+    models on access.
+    """
+
+    def __init__(self, instructions=None, header=None, config=None, **kwargs):
+        """Create a columnar experiment.
+
+        Args:
+            instructions (list[QasmQobjInstruction or dict]): instructions of
+                the experiment.
+            header (QobjExperimentHeader): header of the experiment.
+            config (QasmQobjExperimentConfig): config of the experiment.
+            kwargs: other attributes of the experiment.
+        """
+        # pylint: disable=super-init-not-called
+        # The base __init__ validates the experiment, so it is not called.
+        self._clear_instructions()
+        if header is not None:
+            self.header = header
+        if config is not None:
+            self.config = config
+        self.__dict__.update(kwargs)
+        for instruction in instructions or ():
+            self.append_instruction(instruction)
+
+    @classmethod
+    def from_experiment(cls, experiment):
+        """Return the columnar experiment of a ``QasmQobjExperiment``."""
+        kwargs = {key: value for key, value in experiment.__dict__.items()
+                  if key != 'instructions'}
+        return cls(instructions=experiment.instructions, **kwargs)
+
+    def _clear_instructions(self):
+        self._names = []
+        self._opcodes_by_name = {}
+        self._opcodes = array('i')
+        self._qubits = array('i')
+        self._qubit_offsets = array('q', [0])
+        self._memory = array('i')
+        self._memory_offsets = array('q', [0])
+        self._params = []
+        self._param_offsets = array('q', [0])
+        self._extras = {}
+
+    def append(self, name, qubits=None, memory=None, params=None, **fields):
+        """Append an instruction to the experiment.
+
+        Args:
+            name (str): name of the instruction.
+            qubits (list[int]): qubits of the instruction.
+            memory (list[int]): memory slots of the instruction.
+            params (list): parameters of the instruction. Real sympy numbers
+                are stored as floats, or ints for sympy integers.
+            fields: the other fields of the instruction.
+        """
+        opcode = self._opcodes_by_name.get(name)
+        if opcode is None:
+            opcode = self._opcodes_by_name[name] = len(self._names)
+            self._names.append(name)
+        index = len(self._opcodes)
+        self._opcodes.append(opcode)
+
+        # Empty lists are kept with the other fields, so that they are
+        # serialized like in a QasmQobjInstruction
+        if qubits:
+            self._qubits.extend(qubits)
+        elif qubits is not None:
+            fields['qubits'] = list(qubits)
+        self._qubit_offsets.append(len(self._qubits))
+        if memory:
+            self._memory.extend(memory)
+        elif memory is not None:
+            fields['memory'] = list(memory)
+        self._memory_offsets.append(len(self._memory))
+        if params:
+            self._params.extend(_pool_param(param) for param in params)
+        elif params is not None:
+            fields['params'] = list(params)
+        self._param_offsets.append(len(self._params))
+        if fields:
+            self._extras[index] = fields
+
+    def append_instruction(self, instruction):
+        """Append a ``QasmQobjInstruction``, or a dict of its fields."""
+        fields = dict(instruction if isinstance(instruction, dict) else instruction.__dict__)
+        self.append(**fields)
+
+    def instruction(self, index):
+        """Return an instruction of the experiment.
+
+        Args:
+            index (int): index of the instruction.
+
+        Returns:
+            QasmQobjInstruction: a new, not validated, model of the instruction.
+                Modifying it does not modify the experiment.
+        """
+        instruction = QasmQobjInstruction.__new__(QasmQobjInstruction)
+        instruction.__dict__.update(self._instruction_fields(index))
+        return instruction
+
+    @property
+    def instructions(self):
+        """list[QasmQobjInstruction]: the instructions, built on each access."""
+        return [self.instruction(index) for index in range(len(self._opcodes))]
+
+    @instructions.setter
+    def instructions(self, instructions):
+        self._clear_instructions()
+        for instruction in instructions:
+            self.append_instruction(instruction)
+
+    @property
+    def instruction_names(self):
+        """list[str]: the names of the instructions, in order."""
+        names = self._names
+        return [names[opcode] for opcode in self._opcodes]
+
+    def param_index(self, instruction_index, param_index):
+        """Return the index in the parameter pool of a parameter of an instruction."""
+        return self._param_offsets[instruction_index] + param_index
+
+    def copy_with_params(self, values):
+        """Return a copy of the experiment with some parameters replaced.
+
+        Only the parameter pool is copied; the other columns, the header and
+        the config are shared with this experiment.
+
+        Args:
+            values (dict): new values of the parameters, keyed by their index
+                in the parameter pool, as returned by ``param_index()``.
+
+        Returns:
+            ColumnarQasmQobjExperiment: the new experiment.
+        """
+        params = list(self._params)
+        for index, value in values.items():
+            params[index] = value
+        experiment = copy.copy(self)
+        # The columns are defined in __init__ by _clear_instructions
+        experiment._params = params  # pylint: disable=attribute-defined-outside-init
+        return experiment
+
+    def _instruction_fields(self, index):
+        fields = {'name': self._names[self._opcodes[index]]}
+        start, end = self._qubit_offsets[index], self._qubit_offsets[index + 1]
+        if start != end:
+            fields['qubits'] = self._qubits[start:end].tolist()
+        start, end = self._memory_offsets[index], self._memory_offsets[index + 1]
+        if start != end:
+            fields['memory'] = self._memory[start:end].tolist()
+        start, end = self._param_offsets[index], self._param_offsets[index + 1]
+        if start != end:
+            fields['params'] = self._params[start:end]
+        extras = self._extras.get(index)
+        if extras:
+            fields.update(extras)
+        return fields
+
+    def _dump(self):
+        """Serialize the experiment without validating it.
+
+        Returns:
+            dict: the experiment as a dict of simple types.
+        """
+        data = {}
+        for key, value in self.__dict__.items():
+            if key.startswith('_'):
+                continue
+            data[key] = value._dump() if isinstance(value, BaseModel) else value
+
+        fields = QasmQobjInstruction.schema.fields
+        instructions = []
+        for index in range(len(self._opcodes)):
+            instruction = self._instruction_fields(index)
+            for key, value in instruction.items():
+                if key in fields:
+                    instruction[key] = fields[key]._serialize(value, key, None)
+            instructions.append(instruction)
+        data['instructions'] = instructions
+        return data
+
+    def to_experiment(self):
+        """Return the experiment as a validated ``QasmQobjExperiment``.
+
+        Returns:
+            QasmQobjExperiment: the experiment, with a ``QasmQobjInstruction``
+                for each instruction.
+
+        Raises:
+            ModelValidationError: if an instruction is not valid.
+        """
+        kwargs = {key: value for key, value in self.__dict__.items()
+                  if not key.startswith('_')}
+        instructions = [QasmQobjInstruction(**self._instruction_fields(index))
+                        for index in range(len(self._opcodes))]
+        return QasmQobjExperiment(instructions=instructions, **kwargs)
+
+    def validate(self):
+        """Validate the experiment against the schema of ``QasmQobjExperiment``.
+
+        Raises:
+            ModelValidationError: if the experiment is not valid.
+        """
+        self._validate()
+
+    def __eq__(self, other):
+        if isinstance(other, QasmQobjExperiment):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _columnar_from_state, (self.__class__, self.__dict__)
+
+    def __repr__(self):
+        return '{}(<{} instructions>, header={!r}, config={!r})'.format(
+            self.__class__.__name__, len(self._opcodes),
+            getattr(self, 'header', None), getattr(self, 'config', None))
+
+
+def _columnar_from_state(cls, state):
+    """Helper for ColumnarQasmQobjExperiment.__reduce__."""
+    experiment = cls.__new__(cls)
+    experiment.__dict__.update(state)
+    return experiment
+
+
+def _pool_param(param):
+    """Return a real sympy number as a float, or an int for an integer."""
+    if isinstance(param, sympy.Basic) and param.is_number and param.is_real:
+        return int(param) if param.is_Integer else float(param)
+    return param
@@ -21,6 +21,7 @@ from qiskit.qobj.models.pulse import PulseQobjExperimentSchema, PulseQobjConfigS
 from qiskit.qobj.models.qasm import QasmQobjExperimentSchema, QasmQobjConfigSchema
 from qiskit.validation.base import BaseModel, BaseSchema, bind_schema
 from qiskit.validation.fields import Nested, String
+from .columnar import ColumnarQasmQobjExperiment
 from .utils import QobjType
 
 QOBJ_VERSION = '1.1.0'
@@ -120,6 +121,24 @@ class QasmQobj(Qobj):
                          type=QobjType.QASM.value,
                          **kwargs)
 
+    def _dump(self):
+        """Serialize the qobj without validating it.
+
+        Columnar experiments are serialized by their own ``_dump()``, the
+        rest of the qobj by its schema.
+        """
+        experiments = getattr(self, 'experiments', None)
+        if not isinstance(experiments, list) or \
+                not any(isinstance(experiment, ColumnarQasmQobjExperiment)
+                        for experiment in experiments):
+            return super()._dump()
+        qobj = self.__class__.__new__(self.__class__)
+        qobj.__dict__.update(self.__dict__)
+        qobj.experiments = []
+        data = super(QasmQobj, qobj)._dump()
+        data['experiments'] = [experiment._dump() for experiment in experiments]
+        return data
+
 
 @bind_schema(PulseQobjSchema)
 class PulseQobj(Qobj):
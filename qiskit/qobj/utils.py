@@ -17,6 +17,7 @@
 from enum import Enum
 
 from qiskit.validation.jsonschema import validate_json_against_schema
+from qiskit.validation.policy import get_validation_policy, is_validated, mark_validated
 
 
 class QobjType(str, Enum):
@@ -34,10 +35,16 @@ class MeasReturnType(str, Enum):
 def validate_qobj_against_schema(qobj):
     """Validates a QObj against the .json schema.
 
+    The Qobj is not validated with the ``'off'`` validation policy, nor if
+    it was already validated and has not been modified since.
+
     Args:
         qobj (Qobj): Qobj to be validated.
     """
+    if get_validation_policy() == 'off' or is_validated(qobj, 'jsonschema'):
+        return
     validate_json_against_schema(
         qobj.to_dict(), 'qobj',
         err_msg='Qobj failed validation. Set Qiskit log level to DEBUG '
                 'for further information.')
+    mark_validated(qobj, 'jsonschema')
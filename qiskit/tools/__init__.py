@@ -20,4 +20,4 @@ scenarios and flows: for more advanced usage, it is encouraged to instead
 refer to the documentation of each component and use them separately.
 """
 
-from .parallel import parallel_map
+from .parallel import parallel_map, parallel_imap
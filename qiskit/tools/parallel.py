@@ -47,15 +47,39 @@
 
 """
 Routines for running Python functions in parallel using process pools
-from the multiprocessing library.
+from the multiprocessing library, thread pools or ``concurrent.futures``
+executors.
+
+The executor used by :func:`parallel_map` is chosen with its ``executor``
+argument, the ``QISKIT_PARALLEL_EXECUTOR`` environment variable or the
+``parallel_executor`` option of the user config file, in that order:
+
+* ``'process'`` (default): a pool of worker processes.
+* ``'thread'``: a pool of worker threads.
+* ``'serial'``: the values are mapped in the calling thread.
+
+A ``concurrent.futures.Executor`` instance can also be passed as
+``executor``. The process and thread pools are started on the first parallel
+call and reused by later calls, so repeated calls do not pay for startup.
+
+Calls to :func:`parallel_map` made by a task running on a thread pool or on
+a ``concurrent.futures`` executor that lives in this process reuse that
+executor. Calls made inside a worker process run serially in that worker.
 """
 
 import os
+import pickle
 import platform
+import sys
+import atexit
+import threading
+import types
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from multiprocessing import Pool
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
 from qiskit.tools.events.pubsub import Publisher
+from qiskit import user_config
 
 # Set parallel flag
 os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
@@ -63,17 +87,37 @@ os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# Number of chunks each worker process gets by default
+CHUNKS_PER_PROCESS = 4
+
+# Names of the executors that can be selected by name
+EXECUTORS = ('process', 'thread', 'serial')
+
+# The persistent worker pools, started lazily by _get_pool() and
+# _get_thread_pool()
+_POOL = None
+_POOL_SIZE = 0
+_POOL_PID = None
+_POOL_MAIN = None
+_THREAD_POOL = None
+_THREAD_POOL_SIZE = 0
+_THREAD_POOL_LOCK = threading.Lock()
+
+# The executor running the task of the current thread, if any
+_LOCAL = threading.local()
+
 
 def parallel_map(  # pylint: disable=dangerous-default-value
-        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT):
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        chunksize=None, executor=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
     is functionally equivalent to::
 
         result = [task(value, *task_args, **task_kwargs) for value in values]
 
-    On Windows this function defaults to a serial implementation to avoid the
-    overhead from spawning processes in Windows.
+    On Windows the process executor defaults to a serial implementation to
+    avoid the overhead from spawning processes in Windows.
 
     Args:
         task (func): Function that is to be called for each value in ``values``.
@@ -81,7 +125,14 @@ def parallel_map(  # pylint: disable=dangerous-default-value
                             function is to be evaluated.
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
-        num_processes (int): Number of processes to spawn.
+        num_processes (int): Number of processes (or threads) to spawn.
+        chunksize (int): Number of values sent to a worker at a time.
+            Defaults to splitting ``values`` into ``CHUNKS_PER_PROCESS`` chunks
+            per worker.
+        executor (str or concurrent.futures.Executor): ``'process'``,
+            ``'thread'``, ``'serial'`` or an executor to run the tasks on.
+            Defaults to the executor running the calling task, if any, and
+            otherwise to the configured executor.
 
     Returns:
         result: The result list contains the value of
@@ -89,7 +140,7 @@ def parallel_map(  # pylint: disable=dangerous-default-value
                     each value in ``values``.
 
     Raises:
-        QiskitError: If user interrupts via keyboard.
+        QiskitError: If user interrupts via keyboard or the executor is invalid.
 
     Events:
         terra.parallel.start: The collection of parallel tasks are about to start.
@@ -99,51 +150,293 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     if len(values) == 1:
         return [task(values[0], *task_args, **task_kwargs)]
 
-    Publisher().publish("terra.parallel.start", len(values))
-    nfinished = [0]
+    return list(parallel_imap(task, values, task_args, task_kwargs,
+                              num_processes, chunksize, executor))
+
+
+def parallel_imap(  # pylint: disable=dangerous-default-value
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        chunksize=None, executor=None):
+    """
+    Lazy version of :func:`parallel_map`. The results are yielded in the order
+    of ``values`` as soon as they are available.
 
-    def _callback(_):
-        nfinished[0] += 1
-        Publisher().publish("terra.parallel.done", nfinished[0])
+    Args:
+        task (func): Function that is to be called for each value in ``values``.
+        values (array_like): List or array of values for which the ``task``
+                            function is to be evaluated.
+        task_args (list): Optional additional arguments to the ``task`` function.
+        task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
+        num_processes (int): Number of processes (or threads) to spawn.
+        chunksize (int): Number of values sent to a worker at a time.
+            Defaults to splitting ``values`` into ``CHUNKS_PER_PROCESS`` chunks
+            per worker.
+        executor (str or concurrent.futures.Executor): ``'process'``,
+            ``'thread'``, ``'serial'`` or an executor to run the tasks on.
+            Defaults to the executor running the calling task, if any, and
+            otherwise to the configured executor.
 
+    Yields:
+        object: The value of ``task(value, *task_args, **task_kwargs)`` for
+        each value in ``values``.
+
+    Raises:
+        QiskitError: If user interrupts via keyboard or the executor is invalid.
+
+    Events:
+        terra.parallel.start: The collection of parallel tasks are about to start.
+        terra.parallel.update: One of the parallel task has finished.
+        terra.parallel.finish: All the parallel tasks have finished.
+    """
+    executor = _resolve_executor(executor)
+    task = _Task(task, task_args, task_kwargs)
+
+    Publisher().publish("terra.parallel.start", len(values))
+
+    if isinstance(executor, Executor):
+        results = _futures_imap(executor, task, values, chunksize or
+                                _default_chunksize(len(values), num_processes))
+    elif executor == 'thread' and num_processes > 1:
+        results = _futures_imap(_get_thread_pool(num_processes), task, values,
+                                chunksize or _default_chunksize(len(values), num_processes))
     # Run in parallel if not Win and not in parallel already
-    if platform.system() != 'Windows' and num_processes > 1 \
-       and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
-        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
-        try:
-            pool = Pool(processes=num_processes)
+    elif executor == 'process' and platform.system() != 'Windows' \
+            and num_processes > 1 and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
+        results = _process_imap(_PickledTask(task), values, num_processes, chunksize or
+                                _default_chunksize(len(values), num_processes))
+    else:
+        # Serial executor, or cannot do parallel on Windows or if another
+        # parallel_map is running in parallel.
+        results = map(task, values)
 
-            async_res = [pool.apply_async(task, (value,) + task_args, task_kwargs,
-                                          _callback) for value in values]
+    for nfinished, result in enumerate(results, 1):
+        Publisher().publish("terra.parallel.done", nfinished)
+        yield result
+    Publisher().publish("terra.parallel.finish")
 
-            while not all([item.ready() for item in async_res]):
-                for item in async_res:
-                    item.wait(timeout=0.1)
 
-            pool.terminate()
-            pool.join()
+def shutdown_pool():
+    """Terminate the persistent worker pools used by :func:`parallel_map`.
+
+    New pools are started by the next parallel call.
+    """
+    global _POOL, _POOL_SIZE, _POOL_PID, _POOL_MAIN  # pylint: disable=global-statement
+    global _THREAD_POOL, _THREAD_POOL_SIZE  # pylint: disable=global-statement
+    pool = _POOL
+    owned = _POOL_PID == os.getpid()
+    _POOL, _POOL_SIZE, _POOL_PID, _POOL_MAIN = None, 0, None, None
+    # A forked child inherits the pool object but not its workers
+    if pool is not None and owned:
+        pool.terminate()
+        pool.join()
+
+    with _THREAD_POOL_LOCK:
+        thread_pool = _THREAD_POOL
+        _THREAD_POOL, _THREAD_POOL_SIZE = None, 0
+    if thread_pool is not None:
+        thread_pool.shutdown(wait=False)
+
+
+def _resolve_executor(executor):
+    """Return the executor to use for a parallel_map call.
+
+    Args:
+        executor (str or concurrent.futures.Executor or None): the executor
+            passed to parallel_map.
+
+    Returns:
+        str or concurrent.futures.Executor: ``'process'``, ``'thread'``,
+            ``'serial'`` or the executor to run the tasks on.
+
+    Raises:
+        QiskitError: If the executor is not valid.
+    """
+    if executor is None:
+        executor = getattr(_LOCAL, 'executor', None)
+    if executor is None and os.getenv('QISKIT_IN_PARALLEL') == 'TRUE':
+        # Already running in parallel, e.g. in a worker process
+        executor = 'serial'
+    if executor is None:
+        executor = os.getenv('QISKIT_PARALLEL_EXECUTOR') or \
+            user_config.get_config().get('parallel_executor', 'process')
+    if not isinstance(executor, Executor) and executor not in EXECUTORS:
+        raise QiskitError("%s is not a valid parallel executor. Must be either "
+                          "'process', 'thread', 'serial' or a "
+                          "concurrent.futures.Executor." % executor)
+    return executor
+
+
+def _default_chunksize(num_values, num_workers):
+    """Split ``num_values`` into CHUNKS_PER_PROCESS chunks per worker."""
+    return max(1, -(-num_values // (max(num_workers, 1) * CHUNKS_PER_PROCESS)))
 
-        except (KeyboardInterrupt, Exception) as error:
-            if isinstance(error, KeyboardInterrupt):
+
+def _process_imap(task, values, num_processes, chunksize):
+    """Yield ``task(value)`` for each value, computed on a process pool.
+
+    ``task`` is a ``_PickledTask``, which is sent the values pickled.
+    """
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    try:
+        # Functions defined in __main__ may use globals of __main__ that
+        # changed since the workers of the persistent pool were started, so
+        # use a fresh pool for those.
+        if getattr(task.task.task, '__module__', None) == '__main__':
+            pool = Pool(processes=num_processes, initializer=_set_parallel_flag)
+        else:
+            pool = _get_pool(num_processes)
+        try:
+            yield from pool.imap(task, map(_dumps, values), chunksize)
+        finally:
+            if pool is not _POOL:
                 pool.terminate()
                 pool.join()
-                Publisher().publish("terra.parallel.finish")
-                os.environ['QISKIT_IN_PARALLEL'] = 'False'
-                raise QiskitError('Keyboard interrupt in parallel_map.')
-            # Otherwise just reset parallel flag and error
-            os.environ['QISKIT_IN_PARALLEL'] = 'False'
-            raise error
 
+    except KeyboardInterrupt:
+        shutdown_pool()
         Publisher().publish("terra.parallel.finish")
+        raise QiskitError('Keyboard interrupt in parallel_map.')
+    finally:
         os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
-        return [ar.get() for ar in async_res]
-
-    # Cannot do parallel on Windows , if another parallel_map is running in parallel,
-    # or len(values) == 1.
-    results = []
-    for _, value in enumerate(values):
-        result = task(value, *task_args, **task_kwargs)
-        results.append(result)
-        _callback(0)
-    Publisher().publish("terra.parallel.finish")
-    return results
+
+
+def _futures_imap(executor, task, values, chunksize):
+    """Yield ``task(value)`` for each value, computed on a futures executor.
+
+    Tasks running in this process make their parallel_map calls on the same
+    executor, and the calling thread runs any chunk that has not been started
+    yet when its result is needed. A task that calls parallel_map on the
+    executor it runs on therefore never waits for a worker that is not busy.
+    Tasks running in the worker processes of a ``ProcessPoolExecutor`` make
+    their parallel_map calls serially, as in the process pool.
+    """
+    in_process = not isinstance(executor, ProcessPoolExecutor)
+    shared = executor if in_process else 'serial'
+    chunks = [values[start:start + chunksize]
+              for start in range(0, len(values), chunksize)]
+    futures = [executor.submit(_run_chunk, task, chunk, shared) for chunk in chunks]
+    try:
+        for future, chunk in zip(futures, chunks):
+            if in_process and future.cancel():
+                yield from _run_chunk(task, chunk, shared)
+            else:
+                yield from future.result()
+    except KeyboardInterrupt:
+        Publisher().publish("terra.parallel.finish")
+        raise QiskitError('Keyboard interrupt in parallel_map.')
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _run_chunk(task, chunk, executor):
+    """Return ``task(value)`` for each value of ``chunk``.
+
+    ``executor`` (an executor or the name of one) is made the default
+    executor of parallel_map calls made by the task.
+    """
+    outer = getattr(_LOCAL, 'executor', None)
+    _LOCAL.executor = executor
+    try:
+        return [task(value) for value in chunk]
+    finally:
+        _LOCAL.executor = outer
+
+
+def _get_pool(num_processes):
+    """Return the persistent worker process pool, starting it if needed.
+
+    The pool is restarted when the classes and functions of ``__main__``
+    have changed since its workers were forked, since the workers could not
+    unpickle values that use the new ones.
+
+    Args:
+        num_processes (int): number of worker processes.
+
+    Returns:
+        multiprocessing.pool.Pool: the pool.
+    """
+    global _POOL, _POOL_SIZE, _POOL_PID, _POOL_MAIN  # pylint: disable=global-statement
+    main_definitions = _main_definitions()
+    if _POOL is None or _POOL_SIZE != num_processes or _POOL_PID != os.getpid() \
+            or _POOL_MAIN != main_definitions:
+        pool = _POOL
+        owned = _POOL_PID == os.getpid()
+        if pool is not None and owned:
+            pool.terminate()
+            pool.join()
+        _POOL = Pool(processes=num_processes, initializer=_set_parallel_flag)
+        _POOL_SIZE = num_processes
+        _POOL_PID = os.getpid()
+        _POOL_MAIN = main_definitions
+    return _POOL
+
+
+def _main_definitions():
+    """Return the classes and functions of ``__main__`` by name."""
+    main = sys.modules.get('__main__')
+    return {name: value for name, value in vars(main).items()
+            if isinstance(value, (type, types.FunctionType))
+            and value.__module__ == '__main__'}
+
+
+def _get_thread_pool(num_threads):
+    """Return the persistent worker thread pool, starting it if needed."""
+    global _THREAD_POOL, _THREAD_POOL_SIZE  # pylint: disable=global-statement
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None or _THREAD_POOL_SIZE != num_threads:
+            if _THREAD_POOL is not None:
+                _THREAD_POOL.shutdown(wait=False)
+            _THREAD_POOL = ThreadPoolExecutor(max_workers=num_threads)
+            _THREAD_POOL_SIZE = num_threads
+        return _THREAD_POOL
+
+
+def _set_parallel_flag():
+    """Mark a worker process as running inside parallel_map."""
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+
+
+class _Task:
+    """A picklable ``task`` with its extra arguments bound.
+
+    Pickled once per chunk instead of once per value.
+    """
+
+    def __init__(self, task, task_args, task_kwargs):
+        self.task = task
+        self.task_args = task_args
+        self.task_kwargs = task_kwargs
+
+    def __call__(self, value):
+        return self.task(value, *self.task_args, **self.task_kwargs)
+
+
+def _dumps(value):
+    """Pickle a value for a ``_PickledTask``."""
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+class _PickledTask:
+    """A ``_Task`` for worker processes, called with pickled values.
+
+    The task and the values are unpickled by the call. A worker that cannot
+    unpickle them, e.g. because they use a class it does not have, then
+    sends the error back to parallel_map instead of dying, which would leave
+    the pool waiting for the result forever.
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self._pickled_task = pickle.dumps(task, pickle.HIGHEST_PROTOCOL)
+
+    def __getstate__(self):
+        return {'_pickled_task': self._pickled_task}
+
+    def __call__(self, value):
+        if not hasattr(self, 'task'):
+            self.task = pickle.loads(self._pickled_task)
+        return self.task(pickle.loads(value))
+
+
+atexit.register(shutdown_pool)
@@ -19,7 +19,12 @@ The nodes of the graph correspond to physical qubits (represented as integers) a
 directed edges indicate which physical qubits are coupled and the permitted direction of
 CNOT gates. The object has a distance function that can be used to map quantum circuits
 onto a device with this coupling.
+
+The undirected distances and shortest paths between physical qubits are computed once
+for each set of edges, and shared by the coupling maps with the same edges.
 """
+from functools import lru_cache
+
 import numpy as np
 import scipy.sparse as sp
 import scipy.sparse.csgraph as cs
@@ -46,8 +51,10 @@ class CouplingMap:
 
         # the coupling map graph
         self.graph = nx.DiGraph()
-        # a dict of dicts from node pairs to distances
+        # a matrix of the distances between physical qubits
         self._dist_matrix = None
+        # a matrix of the next physical qubit on a shortest path between physical qubits
+        self._next_hop_matrix = None
         # a sorted list of physical qubits (integers) in this coupling map
         self._qubit_list = None
         # a sorted list of physical qubits (integers) in this coupling map
@@ -85,6 +92,7 @@ class CouplingMap:
                 "The physical qubit %s is already in the coupling graph" % physical_qubit)
         self.graph.add_node(physical_qubit)
         self._dist_matrix = None  # invalidate
+        self._next_hop_matrix = None  # invalidate
         self._qubit_list = None  # invalidate
 
     def add_edge(self, src, dst):
@@ -100,6 +108,7 @@ class CouplingMap:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst)
         self._dist_matrix = None  # invalidate
+        self._next_hop_matrix = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     def subgraph(self, nodelist):
@@ -132,22 +141,61 @@ class CouplingMap:
         except nx.exception.NetworkXException:
             return False
 
+    @property
+    def distance_matrix(self):
+        """Return the matrix of the undirected distances between physical qubits.
+
+        The matrix is shared by the coupling maps with the same edges and must not
+        be modified.
+
+        Returns:
+            ndarray: the distance between physical qubits i and j at [i, j].
+
+        Raises:
+            CouplingError: if the coupling graph is not connected.
+        """
+        if self._dist_matrix is None:
+            self._compute_distance_matrix()
+        return self._dist_matrix
+
+    @property
+    def next_hop_matrix(self):
+        """Return the matrix of the next physical qubits on the shortest undirected paths.
+
+        The matrix is shared by the coupling maps with the same edges and must not
+        be modified.
+
+        Returns:
+            ndarray: the physical qubit after i on a shortest path from i to j at
+                [i, j], or -9999 if there is no path or i is j.
+        """
+        if self._next_hop_matrix is None:
+            _, self._next_hop_matrix = self._shortest_paths()
+        return self._next_hop_matrix
+
+    def _shortest_paths(self):
+        """Return the distance and next hop matrices of the undirected graph.
+
+        The matrices are computed even if the graph is not connected; only
+        the next hop matrix is cached in that case, see
+        _compute_distance_matrix.
+
+        Returns:
+            tuple(ndarray, ndarray): the distance and next hop matrices.
+        """
+        undirected_edges = {(min(edge), max(edge)) for edge in self.graph.edges()}
+        num_nodes = max(self.physical_qubits) + 1 if self.physical_qubits else 0
+        return _shortest_paths(num_nodes, tuple(sorted(undirected_edges)))
+
     def _compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        The distance matrix self._dist_matrix is computed from the undirected
+        graph with scipy.sparse.csgraph.shortest_path.
         """
         if not self.is_connected():
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        self._dist_matrix, self._next_hop_matrix = self._shortest_paths()
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -162,13 +210,11 @@ class CouplingMap:
         Raises:
             CouplingError: if the qubits do not exist in the CouplingMap
         """
-        if physical_qubit1 not in self.physical_qubits:
+        if physical_qubit1 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit1,))
-        if physical_qubit2 not in self.physical_qubits:
+        if physical_qubit2 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit2,))
-        if self._dist_matrix is None:
-            self._compute_distance_matrix()
-        return self._dist_matrix[physical_qubit1, physical_qubit2]
+        return self.distance_matrix[physical_qubit1, physical_qubit2]
 
     def shortest_undirected_path(self, physical_qubit1, physical_qubit2):
         """Returns the shortest undirected path between physical_qubit1 and physical_qubit2.
@@ -180,12 +226,18 @@ class CouplingMap:
         Raises:
             CouplingError: When there is no path between physical_qubit1, physical_qubit2.
         """
-        try:
-            return nx.shortest_path(self.graph.to_undirected(as_view=True), source=physical_qubit1,
-                                    target=physical_qubit2)
-        except nx.exception.NetworkXNoPath:
-            raise CouplingError(
-                "Nodes %s and %s are not connected" % (str(physical_qubit1), str(physical_qubit2)))
+        for physical_qubit in (physical_qubit1, physical_qubit2):
+            if physical_qubit not in self.graph:
+                raise CouplingError("%s not in coupling graph" % (physical_qubit,))
+        next_hop = self.next_hop_matrix
+        path = [physical_qubit1]
+        while path[-1] != physical_qubit2:
+            physical_qubit = int(next_hop[path[-1], physical_qubit2])
+            if physical_qubit < 0:
+                raise CouplingError("Nodes %s and %s are not connected" % (
+                    str(physical_qubit1), str(physical_qubit2)))
+            path.append(physical_qubit)
+        return path
 
     @property
     def is_symmetric(self):
@@ -247,6 +299,15 @@ class CouplingMap:
 
         return CouplingMap(reduced_cmap)
 
+    def __getstate__(self):
+        # Pickle the edges instead of the graph and the computed matrices
+        return {'nodes': list(self.graph.nodes), 'edges': self.get_edges()}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.graph.add_nodes_from(state['nodes'])
+        self.graph.add_edges_from(state['edges'])
+
     def __str__(self):
         """Return a string representation of the coupling graph."""
         string = ""
@@ -255,3 +316,25 @@ class CouplingMap:
             string += ", ".join(["[%s, %s]" % (src, dst) for (src, dst) in self.get_edges()])
             string += "]"
         return string
+
+
+@lru_cache(maxsize=16)
+def _shortest_paths(num_nodes, undirected_edges):
+    """Return the distance and next hop matrices of an undirected graph.
+
+    Args:
+        num_nodes (int): number of nodes.
+        undirected_edges (tuple): edges as tuples of nodes.
+
+    Returns:
+        tuple(ndarray, ndarray): the distances between the nodes, and the nodes
+            after i on shortest paths from i to j.
+    """
+    rows = np.array([edge[0] for edge in undirected_edges], dtype=int)
+    cols = np.array([edge[1] for edge in undirected_edges], dtype=int)
+    adjacency = sp.coo_matrix((np.ones_like(rows), (rows, cols)),
+                              shape=(num_nodes, num_nodes)).tocsr()
+    dist, predecessors = cs.shortest_path(adjacency, directed=False, unweighted=True,
+                                          return_predecessors=True)
+    # The predecessor of i on a shortest path from j is the next hop from i to j
+    return dist, np.ascontiguousarray(predecessors.T)
@@ -19,18 +19,47 @@ Property_set['commutation_set'] is a dictionary that describes
 the commutation relations on a given wire, all the gates on a wire
 are grouped into a set of gates that commute.
 
-TODO: the current pass determines commutativity through matrix multiplication.
-A rule-based analysis would be potentially faster, but more limited.
+Standard gates that are functions of the same Pauli operator on each of the
+qubits they share commute, e.g. diagonal gates, Y rotations, or the controls
+of CX gates. Other pairs of gates are checked by matrix multiplication, and
+the result is cached for the pairs with the same gates, parameters and
+relative qubits.
 """
 
 from collections import defaultdict
+import numbers
+
 import numpy as np
+import sympy
+
+from qiskit.exceptions import QiskitError
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.quantum_info.operators import Operator
+from qiskit.circuit import Gate, Instruction, ParameterExpression
+from qiskit.extensions.standard import (IdGate, XGate, YGate, ZGate, SGate, SdgGate,
+                                        TGate, TdgGate, RYGate, RZGate, U1Gate,
+                                        CnotGate, CyGate, CzGate, CrzGate, Cu1Gate,
+                                        RZZGate, ToffoliGate)
 
 _CUTOFF_PRECISION = 1E-10
 
+# Maximum number of pairs of gates in the cache of the pass. The cache is
+# cleared when it is full, e.g. for circuits with many distinct parameters.
+_CACHE_SIZE = 4096
+
+# Gates that are functions of a single Pauli operator on each of their qubits,
+# in the order of their qubit arguments. Two such gates commute if they have
+# the same Pauli operator on each of the qubits they share. RXGate is left
+# out as its matrix comes from its decomposition into rx_pi/2 gates.
+_PAULI_TYPES = {
+    XGate: 'X',
+    YGate: 'Y', RYGate: 'Y',
+    ZGate: 'Z', SGate: 'Z', SdgGate: 'Z', TGate: 'Z', TdgGate: 'Z', RZGate: 'Z', U1Gate: 'Z',
+    CnotGate: 'ZX', CyGate: 'ZY', CzGate: 'ZZ', CrzGate: 'ZZ', Cu1Gate: 'ZZ', RZZGate: 'ZZ',
+    ToffoliGate: 'ZZX',
+}
+
 
 class CommutationAnalysis(AnalysisPass):
     """An analysis pass to find commutation relations between DAG nodes."""
@@ -38,6 +67,9 @@ class CommutationAnalysis(AnalysisPass):
     def __init__(self):
         super().__init__()
         self.gates_on_wire = {}
+        # Commutation of the pairs of gates checked by matrix multiplication,
+        # kept across runs of the pass, of at most _CACHE_SIZE pairs
+        self.cache = {}
 
     def run(self, dag):
         """
@@ -79,7 +111,7 @@ class CommutationAnalysis(AnalysisPass):
                     prev_gate = current_comm_set[-1][-1]
                     does_commute = False
                     try:
-                        does_commute = _commute(current_gate, prev_gate)
+                        does_commute = _commute(current_gate, prev_gate, self.cache)
                     except TranspilerError:
                         pass
                     if does_commute:
@@ -92,29 +124,100 @@ class CommutationAnalysis(AnalysisPass):
                 self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
 
 
-def _commute(node1, node2):
-
-    if node1.type != "op" or node2.type != "op":
-        return False
-
-    if any([nd.name in {"barrier", "snapshot", "measure", "reset", "copy"}
-            for nd in [node1, node2]]):
-        return False
+def _commute(node1, node2, cache=None):
 
-    if node1.condition or node2.condition:
+    if not _can_commute(node1) or not _can_commute(node2):
         return False
 
-    qarg = list(set(node1.qargs + node2.qargs))
-    qbit_num = len(qarg)
-
-    qarg1 = [qarg.index(q) for q in node1.qargs]
+    qarg = list(node1.qargs) + [q for q in node2.qargs if q not in node1.qargs]
+    qarg1 = list(range(len(node1.qargs)))
     qarg2 = [qarg.index(q) for q in node2.qargs]
 
-    id_op = Operator(np.eye(2 ** qbit_num))
+    if _commute_by_rules(node1.op, node2.op, qarg1, qarg2):
+        return True
 
-    op12 = id_op.compose(node1.op, qargs=qarg1).compose(node2.op, qargs=qarg2)
-    op21 = id_op.compose(node2.op, qargs=qarg2).compose(node1.op, qargs=qarg1)
+    key1 = _gate_key(node1.op)
+    key2 = _gate_key(node2.op)
+    if cache is None or key1 is None or key2 is None:
+        return _commute_by_matrices(node1.op, node2.op, qarg1, qarg2)
 
-    if_commute = (op12 == op21)
+    key = (key1, key2, tuple(qarg2))
+    if key not in cache:
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        cache[key] = _commute_by_matrices(node1.op, node2.op, qarg1, qarg2)
+    return cache[key]
 
-    return if_commute
+
+def _can_commute(node):
+    """Return False if node is not a gate whose commutation can be checked."""
+    if node.type != "op":
+        return False
+    if node.name in {"barrier", "snapshot", "measure", "reset", "copy"}:
+        return False
+    if node.condition:
+        return False
+    # Gates with unbound parameters have no matrix to compare
+    return not any(isinstance(param, ParameterExpression) and param.parameters
+                   for param in node.op.params)
+
+
+def _commute_by_rules(op1, op2, qarg1, qarg2):
+    """Return True if op1 and op2 are known to commute, False if unknown."""
+    if isinstance(op1, IdGate) or isinstance(op2, IdGate):
+        return True
+    paulis1 = _PAULI_TYPES.get(type(op1))
+    paulis2 = _PAULI_TYPES.get(type(op2))
+    if paulis1 is None or paulis2 is None:
+        return False
+    paulis = dict(zip(qarg1, paulis1))
+    return all(paulis.get(qubit, pauli) == pauli for qubit, pauli in zip(qarg2, paulis2))
+
+
+def _commute_by_matrices(op1, op2, qarg1, qarg2):
+    qbit_num = len(set(qarg1 + qarg2))
+    mat1 = _expand_matrix(_gate_matrix(op1), qarg1, qbit_num)
+    mat2 = _expand_matrix(_gate_matrix(op2), qarg2, qbit_num)
+    return np.allclose(mat1.dot(mat2), mat2.dot(mat1), rtol=Operator.RTOL, atol=Operator.ATOL)
+
+
+def _gate_matrix(op):
+    if hasattr(op, 'to_matrix'):
+        try:
+            return op.to_matrix()
+        except QiskitError:
+            pass
+    return Operator(op).data
+
+
+def _expand_matrix(mat, qargs, qbit_num):
+    """Return the matrix of mat acting on the qubits qargs out of qbit_num."""
+    mat = np.kron(np.eye(2 ** (qbit_num - len(qargs))), mat)
+    # Move qubit i of the expanded matrix to qubit positions[i]
+    positions = list(qargs) + [qubit for qubit in range(qbit_num) if qubit not in qargs]
+    axes = [0] * (2 * qbit_num)
+    for qubit, position in enumerate(positions):
+        axes[qbit_num - 1 - position] = qbit_num - 1 - qubit
+        axes[2 * qbit_num - 1 - position] = 2 * qbit_num - 1 - qubit
+    tensor = np.reshape(mat, [2] * (2 * qbit_num)).transpose(axes)
+    return np.reshape(tensor, mat.shape)
+
+
+def _gate_key(op):
+    """Return a hashable key identifying the matrix of op, or None if there is none.
+
+    Anonymous gates and instructions, e.g. built from circuits, are only
+    identified by their definitions, and gates with array parameters, e.g.
+    unitary gates, are not cached.
+    """
+    cls = type(op)
+    if cls in (Gate, Instruction):
+        return None
+    params = []
+    for param in op.params:
+        if isinstance(param, ParameterExpression):
+            param = float(param)
+        elif not isinstance(param, (sympy.Basic, numbers.Number)):
+            return None
+        params.append(param)
+    return (cls, op.name, op.num_qubits, tuple(params))
@@ -19,7 +19,7 @@ Replace each block of consecutive gates by a single Unitary node.
 The blocks are collected by a previous pass, such as Collect2qBlocks.
 """
 
-from qiskit.circuit import QuantumRegister, QuantumCircuit
+from qiskit.circuit import QuantumRegister, QuantumCircuit, ParameterExpression
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.synthesis import TwoQubitBasisDecomposer
@@ -96,6 +96,11 @@ class ConsolidateBlocks(TransformationPass):
                 # an intermediate node that was added into the overall list
                 new_dag.apply_operation_back(block[0].op, block[0].qargs,
                                              block[0].cargs, block[0].condition)
+            elif any(isinstance(param, ParameterExpression) and param.parameters
+                     for nd in block for param in nd.op.params):
+                # a block with unbound parameters has no unitary to simulate
+                for nd in block:
+                    new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs, nd.condition)
             else:
                 # find the qubits involved in this block
                 block_qargs = set()
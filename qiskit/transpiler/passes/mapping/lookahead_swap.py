@@ -100,7 +100,7 @@ class LookaheadSwap(TransformationPass):
         current_layout = trivial_layout.copy()
 
         mapped_gates = []
-        ordered_virtual_gates = list(dag.serial_layers())
+        ordered_virtual_gates = list(dag.serial_op_node_layers())
         gates_remaining = ordered_virtual_gates.copy()
 
         while gates_remaining:
@@ -204,7 +204,7 @@ def _map_free_gates(layout, gates, coupling_map):
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
         if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+            qubits = gate['nodes'][0].qargs
 
             if not qubits:
                 continue
@@ -276,7 +276,7 @@ def _copy_circuit_metadata(source_dag, coupling_map):
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
 
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op_node = deepcopy(gate['nodes'][0])
 
     # Workaround until #1816, apply mapped to qargs to both DAGNode and op
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
@@ -26,8 +26,10 @@ from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
+from qiskit.dagcircuit.dagcircuit import _NON_PARTITION_OPS
 from qiskit.extensions.standard import SwapGate
 from qiskit.transpiler.layout import Layout
+from qiskit.tools.parallel import parallel_map
 # pylint: disable=no-name-in-module
 from .cython.stochastic_swap.utils import nlayout_from_layout
 # pylint: disable=no-name-in-module
@@ -48,10 +50,12 @@ class StochasticSwap(TransformationPass):
     """
     Maps a DAGCircuit onto a `coupling_map` adding swap gates.
 
-    Uses a randomized algorithm.
+    Uses a randomized algorithm. The circuit can be mapped several times with
+    different seeds, in parallel processes, keeping the mapped circuit with the
+    lowest depth and then size.
     """
 
-    def __init__(self, coupling_map, trials=20, seed=None):
+    def __init__(self, coupling_map, trials=20, seed=None, num_seeds=1):
         """
         Map a DAGCircuit onto a `coupling_map` using swap gates.
 
@@ -64,11 +68,15 @@ class StochasticSwap(TransformationPass):
                 map.
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            num_seeds (int): number of independent mappings of the circuit.
+                The first one uses ``seed`` and the others seeds drawn from
+                it, and they run in parallel processes with ``parallel_map``.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.trials = trials
         self.seed = seed
+        self.num_seeds = num_seeds
         self.qregs = None
         self.rng = None
         self.trivial_layout = None
@@ -100,11 +108,15 @@ class StochasticSwap(TransformationPass):
         self.qregs = dag.qregs
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
-        self.rng = np.random.RandomState(self.seed)
-        logger.debug("StochasticSwap RandomState seeded with seed=%s", self.seed)
+        seeds = [self.seed]
+        if self.num_seeds > 1:
+            seeds += np.random.RandomState(self.seed).randint(
+                0, np.iinfo(np.int32).max, size=self.num_seeds - 1).tolist()
 
-        new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
-        return new_dag
+        new_dags = parallel_map(_map_with_seed, seeds, task_args=(self, dag))
+        # The first of the mappings with the lowest depth and size, so the
+        # result does not depend on how the mappings were run
+        return min(new_dags, key=lambda new_dag: (new_dag.depth(), new_dag.size()))
 
     def _layer_permutation(self, layer_partition, layout, qubit_subset,
                            coupling, trials):
@@ -144,28 +156,21 @@ class StochasticSwap(TransformationPass):
                                   layout, qubit_subset,
                                   coupling, trials, self.rng)
 
-    def _layer_update(self, i, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+    def _layer_update(self, dagcircuit_output, best_layout, best_depth,
+                      best_circuit, layer_nodes):
+        """Append a new mapped layer to the output DAGCircuit.
 
-        i (int) = layer number
+        dagcircuit_output (DAGCircuit) = DAGCircuit the _mapper method is building
         best_layout (Layout) = layout returned from _layer_permutation
         best_depth (int) = depth returned from _layer_permutation
         best_circuit (DAGCircuit) = swap circuit returned
             from _layer_permutation
-        layer_list (list) = list of DAGCircuit objects for each layer,
-            output of DAGCircuit layers() method
-
-        Return a DAGCircuit object to append to the output DAGCircuit
-        that the _mapper method is building.
+        layer_nodes (list) = op nodes of the input circuit in this layer,
+            in the order they are to be appended
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", pformat(layout))
         logger.debug("layer_update: self.trivial_layout = %s", pformat(self.trivial_layout))
-        dagcircuit_output = DAGCircuit()
-        for qubit in layout.get_virtual_bits().keys():
-            if qubit.register not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(qubit.register)
 
         # Output any swaps
         if best_depth > 0:
@@ -174,14 +179,15 @@ class StochasticSwap(TransformationPass):
             dagcircuit_output.extend_back(best_circuit)
         else:
             logger.debug("layer_update: there are no swaps in this layer")
-        # Make qubit edge map and extend by classical bits
+        # Make qubit edge map; classical bits are mapped to themselves
         edge_map = layout.combine_into_edge_map(self.trivial_layout)
-        for bit in dagcircuit_output.clbits():
-            edge_map[bit] = bit
         # Output this layer
-        dagcircuit_output.compose_back(layer_list[i]["graph"], edge_map)
-
-        return dagcircuit_output
+        for node in layer_nodes:
+            dagcircuit_output.apply_operation_back(
+                node.op,
+                [edge_map.get(qubit, qubit) for qubit in node.qargs],
+                node.cargs,
+                node.condition)
 
     def _mapper(self, circuit_graph, coupling_graph, trials=20):
         """Map a DAGCircuit onto a CouplingMap using swap gates.
@@ -201,8 +207,8 @@ class StochasticSwap(TransformationPass):
             TranspilerError: if there was any error during the mapping
                 or with the parameters.
         """
-        # Schedule the input circuit by calling layers()
-        layerlist = list(circuit_graph.layers())
+        # Schedule the input circuit by calling op_node_layers()
+        layerlist = list(circuit_graph.op_node_layers())
         logger.debug("schedule:")
         for i, v in enumerate(layerlist):
             logger.debug("    %d: %s", i, v["partition"])
@@ -221,18 +227,11 @@ class StochasticSwap(TransformationPass):
         for creg in circuit_graph.cregs.values():
             dagcircuit_output.add_creg(creg)
 
-        # Make a trivial wire mapping between the subcircuits
-        # returned by _layer_update and the circuit we build
-        identity_wire_map = {}
-        for qubit in circuit_graph.qubits():
-            identity_wire_map[qubit] = qubit
-        for bit in circuit_graph.clbits():
-            identity_wire_map[bit] = bit
-
         logger.debug("trivial_layout = %s", layout)
 
         # Iterate over layers
         for i, layer in enumerate(layerlist):
+            layer_nodes = layer["nodes"]
 
             # Attempt to find a permutation for this layer
             success_flag, best_circuit, best_depth, best_layout, trivial_flag \
@@ -247,14 +246,15 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
 
                 # Go through each gate in the layer
-                for j, serial_layer in enumerate(serial_layerlist):
+                for j, node in enumerate(layer_nodes):
+                    serial_partition = [list(node.qargs)] \
+                        if node.name not in _NON_PARTITION_OPS else []
 
                     success_flag, best_circuit, best_depth, best_layout, trivial_flag = \
                         self._layer_permutation(
-                            serial_layer["partition"],
+                            serial_partition,
                             layout, qubit_subset,
                             coupling_graph,
                             trials)
@@ -279,26 +279,22 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.extend_back(
-                        self._layer_update(j,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist),
-                        identity_wire_map)
+                    self._layer_update(dagcircuit_output,
+                                       best_layout,
+                                       best_depth,
+                                       best_circuit,
+                                       [node])
 
             else:
                 # Update the record of qubit positions for each iteration
                 layout = best_layout
 
                 # Update the DAG
-                dagcircuit_output.extend_back(
-                    self._layer_update(i,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist),
-                    identity_wire_map)
+                self._layer_update(dagcircuit_output,
+                                   best_layout,
+                                   best_depth,
+                                   best_circuit,
+                                   layer_nodes)
 
         # This is the final edgemap. We might use it to correctly replace
         # any measurements that needed to be removed earlier.
@@ -310,6 +306,15 @@ class StochasticSwap(TransformationPass):
         return dagcircuit_output
 
 
+def _map_with_seed(seed, stochastic_swap, dag):
+    """Map dag with a StochasticSwap pass seeded with seed."""
+    stochastic_swap.rng = np.random.RandomState(seed)
+    logger.debug("StochasticSwap RandomState seeded with seed=%s", seed)
+    # pylint: disable=protected-access
+    return stochastic_swap._mapper(dag, stochastic_swap.coupling_map,
+                                   trials=stochastic_swap.trials)
+
+
 def _layer_permutation(layer_partition, layout, qubit_subset,
                        coupling, trials, rng):
     """Find a swap circuit that implements a permutation for this layer.
@@ -373,7 +378,7 @@ def _layer_permutation(layer_partition, layout, qubit_subset,
     best_circuit = None  # initialize best swap circuit
     best_layout = None  # initialize best final layout
 
-    cdist2 = coupling._dist_matrix**2
+    cdist2 = coupling.distance_matrix**2
     # Scaling matrix
     scale = np.zeros((num_qubits, num_qubits))
 
@@ -391,7 +396,7 @@ def _layer_permutation(layer_partition, layout, qubit_subset,
         if qubit.register not in slice_circuit.qregs.values():
             slice_circuit.add_qreg(qubit.register)
     edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
-    cdist = coupling._dist_matrix
+    cdist = coupling.distance_matrix
     for trial in range(trials):
         logger.debug("layer_permutation: trial %s", trial)
         # This is one Trial --------------------------------------
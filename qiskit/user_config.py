@@ -31,6 +31,9 @@ class UserConfig:
     [default]
     circuit_drawer = mpl
     circuit_mpl_style = default
+    transpile_optimization_level = 1
+    parallel_executor = process
+    validation_policy = eager
 
     """
     def __init__(self, filename=None):
@@ -88,6 +91,28 @@ class UserConfig:
                         "0, 1, 2, or 3.")
                 self.settings['transpile_optimization_level'] = (
                     transpile_optimization_level)
+            # Parse parallel_executor
+            parallel_executor = self.config_parser.get('default',
+                                                       'parallel_executor',
+                                                       fallback=None)
+            if parallel_executor:
+                if parallel_executor not in ['process', 'thread', 'serial']:
+                    raise exceptions.QiskitUserConfigError(
+                        "%s is not a valid parallel executor. Must be "
+                        "either 'process', 'thread' or 'serial'"
+                        % parallel_executor)
+                self.settings['parallel_executor'] = parallel_executor
+            # Parse validation_policy
+            validation_policy = self.config_parser.get('default',
+                                                       'validation_policy',
+                                                       fallback=None)
+            if validation_policy:
+                if validation_policy not in ['eager', 'lazy', 'off']:
+                    raise exceptions.QiskitUserConfigError(
+                        "%s is not a valid validation policy. Must be "
+                        "either 'eager', 'lazy' or 'off'"
+                        % validation_policy)
+                self.settings['validation_policy'] = validation_policy
 
 
 def get_config():
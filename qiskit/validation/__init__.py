@@ -16,3 +16,5 @@
 
 from .base import BaseModel, BaseSchema, bind_schema, ModelTypeValidator
 from .exceptions import ModelValidationError
+from .policy import (VALIDATION_POLICIES, get_validation_policy, set_validation_policy,
+                     validation_policy)
@@ -28,7 +28,11 @@ together by using ``bind_schema``::
     @bind_schema(PersonSchema)
     class Person(BaseModel):
         pass
+
+When models are validated depends on the validation policy, see
+``qiskit.validation.policy``.
 """
+import threading
 import warnings
 
 from functools import wraps
@@ -37,9 +41,16 @@ from types import SimpleNamespace, MethodType
 from marshmallow import ValidationError
 from marshmallow import Schema, post_dump, post_load
 from marshmallow import fields as _fields
-from marshmallow.utils import is_collection
+from marshmallow.utils import is_collection, missing as _missing
 
 from .exceptions import ModelValidationError
+from .policy import get_validation_policy, is_validated, mark_validated
+
+# Validation state of the current thread: ``trusted`` is set while a model is
+# created from data validated by ``load()``, and ``initializing`` holds the
+# ids of the models whose ``__init__`` is running, so that the ``__init__``
+# of their base classes does not validate them again.
+_LOCAL = threading.local()
 
 
 class ModelTypeValidator(_fields.Field):
@@ -170,7 +181,12 @@ class BaseSchema(Schema):
     @post_load
     def make_model(self, data):
         """Make ``load`` return a ``model_cls`` instance instead of a dict."""
-        return self.model_cls(**data)
+        # The data has just been validated by load()
+        _LOCAL.trusted = True
+        try:
+            return self.model_cls(**data)
+        finally:
+            _LOCAL.trusted = False
 
 
 class _SchemaBinder:
@@ -235,7 +251,7 @@ class _SchemaBinder:
     def _validate(instance):
         """Validate the internal representation of the instance."""
         try:
-            _ = instance.schema.validate(instance.to_dict())
+            _ = instance.schema.validate(instance._dump())
         except ValidationError as ex:
             raise ModelValidationError(
                 ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs)
@@ -246,13 +262,27 @@ class _SchemaBinder:
 
         @wraps(init_method)
         def _decorated(self, **kwargs):
+            trusted = getattr(_LOCAL, 'trusted', False)
+            _LOCAL.trusted = False
+            initializing = getattr(_LOCAL, 'initializing', None)
+            if initializing is None:
+                initializing = _LOCAL.initializing = set()
+            if id(self) in initializing:
+                init_method(self, **kwargs)
+                return
+
+            if not trusted and get_validation_policy() == 'eager':
+                try:
+                    _ = self.shallow_schema.validate(kwargs)
+                except ValidationError as ex:
+                    raise ModelValidationError(
+                        ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
+
+            initializing.add(id(self))
             try:
-                _ = self.shallow_schema.validate(kwargs)
-            except ValidationError as ex:
-                raise ModelValidationError(
-                    ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
-
-            init_method(self, **kwargs)
+                init_method(self, **kwargs)
+            finally:
+                initializing.discard(id(self))
 
         return _decorated
 
@@ -328,9 +358,33 @@ class BaseModel(SimpleNamespace):
     def to_dict(self):
         """Serialize the model into a Python dict of simple types.
 
+        With the ``'lazy'`` validation policy, the model is validated
+        against its schema, unless it was already validated and has not
+        been modified since.
+
         Note that this method requires that the model is bound with
         ``@bind_schema``.
+
+        Returns:
+            dict: the model as a dict of simple types.
+
+        Raises:
+            ModelValidationError: if the model is not valid.
         """
+        data = self._dump()
+        if get_validation_policy() == 'lazy' and not is_validated(self, 'schema'):
+            try:
+                _validate_types(self)
+                _ = self.schema.validate(data)
+            except ValidationError as ex:
+                raise ModelValidationError(
+                    ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
+            mark_validated(self, 'schema')
+
+        return data
+
+    def _dump(self):
+        """Serialize the model with its schema, without validating it."""
         try:
             data, _ = self.schema.dump(self)
         except ValidationError as ex:
@@ -343,10 +397,15 @@ class BaseModel(SimpleNamespace):
     def from_dict(cls, dict_):
         """Deserialize a dict of simple types into an instance of this class.
 
+        With the ``'eager'`` validation policy the dict is validated against
+        the schema; with the other policies it is only deserialized.
+
         Note that this method requires that the model is bound with
         ``@bind_schema``.
         """
         try:
+            if get_validation_policy() != 'eager':
+                return _load_without_validation(cls.schema, dict_)
             data, _ = cls.schema.load(dict_)
         except ValidationError as ex:
             raise ModelValidationError(
@@ -361,6 +420,65 @@ class BaseModel(SimpleNamespace):
         return self.to_dict()
 
 
+def _validate_types(value):
+    """Run the validation done when creating ``value`` on it and its nested models.
+
+    Raises:
+        ValidationError: if a model is not valid.
+    """
+    if isinstance(value, list):
+        for item in value:
+            _validate_types(item)
+    elif isinstance(value, BaseModel):
+        shallow_schema = getattr(value, 'shallow_schema', None)
+        if shallow_schema is not None:
+            _ = shallow_schema.validate(value.__dict__)
+        for item in value.__dict__.values():
+            _validate_types(item)
+
+
+def _load_without_validation(schema, data, many=False):
+    """Deserialize ``data`` with ``schema`` like ``load()``, without validating it.
+
+    Nested schemas are loaded recursively, the other fields are deserialized
+    by their ``_deserialize`` method without running their validators, and
+    unknown fields are added as they are.
+    """
+    if many:
+        return [_load_without_validation(schema, item) for item in data]
+
+    fields = schema.fields
+    kwargs = {}
+    for key, value in data.items():
+        field = fields.get(key)
+        if field is None:
+            kwargs[key] = value
+        else:
+            kwargs[key] = _deserialize_without_validation(field, value, key, data)
+    for key, field in fields.items():
+        if key not in kwargs and field.missing is not _missing:
+            kwargs[key] = field.missing() if callable(field.missing) else field.missing
+
+    return schema.model_cls(**kwargs)
+
+
+def _deserialize_without_validation(field, value, attr, data):
+    """Deserialize ``value`` with ``field`` like ``deserialize()``, without validating it.
+
+    The items of lists are deserialized by the container of the list, and
+    nested schemas are loaded with ``_load_without_validation``, honouring
+    the ``many`` option of their field.
+    """
+    if value is None:
+        return value
+    if isinstance(field, _fields.Nested):
+        return _load_without_validation(field.schema, value, field.many)
+    if isinstance(field, _fields.List) and is_collection(value):
+        return [_deserialize_without_validation(field.container, item, attr, data)
+                for item in value]
+    return field._deserialize(value, attr, data)
+
+
 class ObjSchema(BaseSchema):
     """Generic object schema."""
     pass
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Validation policy of the Qiskit validated classes.
+
+The policy decides when models are validated against their schemas:
+
+* ``'eager'``: models are validated when they are created, and dicts when
+  they are loaded with ``from_dict()``. This is the default.
+* ``'lazy'``: models are created and loaded without validation, and are
+  validated when they are serialized with ``to_dict()``.
+* ``'off'``: models are never validated implicitly.
+
+The policy is set for the process with ``set_validation_policy()``, the
+``QISKIT_VALIDATION_POLICY`` environment variable or the
+``validation_policy`` option of the user config file, in that order, and
+for a block of code with the ``validation_policy()`` context manager::
+
+    with validation_policy('off'):
+        result = Result.from_dict(data)
+
+Validations on serialization, and the validation of qobjs against the JSON
+schema, are memoized: an object that was validated and has not been
+modified since is not validated again.
+"""
+
+import os
+import threading
+import weakref
+from array import array
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import numpy as np
+
+from qiskit import user_config
+from qiskit.exceptions import QiskitError
+
+VALIDATION_POLICIES = ('eager', 'lazy', 'off')
+
+# The policy of the process, read from the environment or the user config
+# on first use unless set_validation_policy() is called
+_POLICY = None
+
+# The policy set by validation_policy() for the current thread, if any
+_LOCAL = threading.local()
+
+# The validated objects, as {(id, kind): (weakref, fingerprint)}
+_MEMO = {}
+_MEMO_LOCK = threading.Lock()
+
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def get_validation_policy():
+    """Return the validation policy of the current thread.
+
+    Returns:
+        str: ``'eager'``, ``'lazy'`` or ``'off'``.
+    """
+    policy = getattr(_LOCAL, 'policy', None)
+    if policy is not None:
+        return policy
+    if _POLICY is None:
+        set_validation_policy(None)
+    return _POLICY
+
+
+def set_validation_policy(policy):
+    """Set the validation policy of the process.
+
+    Args:
+        policy (str): ``'eager'``, ``'lazy'`` or ``'off'``. If None, the
+            policy is read from the ``QISKIT_VALIDATION_POLICY`` environment
+            variable or the user config, and defaults to ``'eager'``.
+
+    Raises:
+        QiskitError: if the policy is not valid.
+    """
+    global _POLICY  # pylint: disable=global-statement
+    if policy is None:
+        policy = os.getenv('QISKIT_VALIDATION_POLICY') or \
+            user_config.get_config().get('validation_policy', 'eager')
+    _POLICY = _check_policy(policy)
+
+
+@contextmanager
+def validation_policy(policy):
+    """Context manager setting the validation policy of the current thread.
+
+    Args:
+        policy (str): ``'eager'``, ``'lazy'`` or ``'off'``.
+
+    Yields:
+        str: the policy.
+    """
+    previous = getattr(_LOCAL, 'policy', None)
+    _LOCAL.policy = _check_policy(policy)
+    try:
+        yield policy
+    finally:
+        _LOCAL.policy = previous
+
+
+def is_validated(obj, kind):
+    """Return whether ``obj`` was validated and has not been modified since.
+
+    Args:
+        obj (object): a model, or any object with a ``__dict__``.
+        kind (str): the kind of validation, e.g. ``'schema'``.
+
+    Returns:
+        bool: True if ``mark_validated(obj, kind)`` was called and the
+            contents of ``obj`` have not changed since.
+    """
+    entry = _MEMO.get((id(obj), kind))
+    return entry is not None and entry[0]() is obj and entry[1] == fingerprint(obj)
+
+
+def mark_validated(obj, kind):
+    """Record that ``obj`` passed a validation of the given kind."""
+    key = (id(obj), kind)
+
+    def _forget(_, key=key):
+        with _MEMO_LOCK:
+            _MEMO.pop(key, None)
+
+    with _MEMO_LOCK:
+        _MEMO[key] = (weakref.ref(obj, _forget), fingerprint(obj))
+
+
+def fingerprint(obj):
+    """Return a hash of the contents of ``obj``.
+
+    The hash covers the attributes of models, the items of lists, tuples and
+    dicts, the values of numbers and strings, and the contents of arrays.
+    Other objects only contribute their type and identity.
+
+    Args:
+        obj (object): object to hash.
+
+    Returns:
+        int: the hash.
+    """
+    parts = []
+    _add_fingerprint(obj, parts)
+    return hash(tuple(parts))
+
+
+def _add_fingerprint(value, parts):
+    value_type = type(value)
+    parts.append(value_type)
+    if value_type in _PRIMITIVE_TYPES:
+        parts.append(value)
+    elif isinstance(value, (list, tuple)):
+        parts.append(len(value))
+        for item in value:
+            _add_fingerprint(item, parts)
+    elif isinstance(value, dict):
+        parts.append(len(value))
+        for key, item in value.items():
+            parts.append(key)
+            _add_fingerprint(item, parts)
+    elif isinstance(value, SimpleNamespace):
+        _add_fingerprint(value.__dict__, parts)
+    elif isinstance(value, np.ndarray):
+        parts.extend((value.dtype.str, value.shape, value.tobytes()))
+    elif isinstance(value, array):
+        parts.extend((value.typecode, value.tobytes()))
+    else:
+        parts.append(id(value))
+
+
+def _check_policy(policy):
+    if policy not in VALIDATION_POLICIES:
+        raise QiskitError("%s is not a valid validation policy. Must be either "
+                          "'eager', 'lazy' or 'off'." % policy)
+    return policy
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of assemble()."""
+
+from qiskit import assemble
+from qiskit.test.mock import FakeMelbourne
+
+from .utils import build_circuit
+
+
+class AssemblerBenchmarks:
+    params = ([5, 14], [10, 100], [1, 100])
+    param_names = ['n_qubits', 'depth', 'num_circuits']
+    timeout = 600
+
+    def setup(self, n_qubits, depth, num_circuits):
+        self.backend = FakeMelbourne()
+        self.circuits = [build_circuit('random', n_qubits, depth, seed=seed)
+                         for seed in range(num_circuits)]
+
+    def time_assemble(self, _, __, ___):
+        assemble(self.circuits, self.backend, shots=1024)
+
+    def peakmem_assemble(self, _, __, ___):
+        assemble(self.circuits, self.backend, shots=1024)
+
+    def time_assemble_columnar(self, _, __, ___):
+        assemble(self.circuits, self.backend, shots=1024, columnar=True)
+
+    def peakmem_assemble_columnar(self, _, __, ___):
+        assemble(self.circuits, self.backend, shots=1024, columnar=True)
+
+    def time_assemble_to_dict(self, _, __, ___):
+        assemble(self.circuits, self.backend, shots=1024).to_dict()
+
+    def time_assemble_columnar_to_dict(self, _, __, ___):
+        assemble(self.circuits, self.backend, shots=1024, columnar=True).to_dict()
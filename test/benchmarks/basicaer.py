@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the BasicAer simulators."""
+
+from qiskit import BasicAer, assemble, transpile
+
+from .utils import build_circuit
+
+
+class _SimulatorBenchmarks:
+    backend_name = None
+    measure = True
+    shots = 1
+
+    def setup(self, n_qubits, depth):
+        self.backend = BasicAer.get_backend(self.backend_name)
+        circuit = transpile(build_circuit('quantum_volume', n_qubits, depth,
+                                          measure=self.measure),
+                            self.backend, seed_transpiler=0)
+        self.qobj = assemble(circuit, self.backend, shots=self.shots, seed_simulator=0)
+
+    def time_run(self, _, __):
+        self.backend.run(self.qobj).result()
+
+    def peakmem_run(self, _, __):
+        self.backend.run(self.qobj).result()
+
+
+class QasmSimulatorBenchmarks(_SimulatorBenchmarks):
+    params = ([5, 10, 15], [10, 50])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+    backend_name = 'qasm_simulator'
+    shots = 1024
+
+
+class StatevectorSimulatorBenchmarks(_SimulatorBenchmarks):
+    params = ([5, 10, 15], [10, 50])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+    backend_name = 'statevector_simulator'
+
+
+class UnitarySimulatorBenchmarks(_SimulatorBenchmarks):
+    params = ([4, 8], [10, 50])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+    backend_name = 'unitary_simulator'
+    measure = False
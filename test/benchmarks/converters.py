@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of DAGCircuit construction and conversions."""
+
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+
+from .utils import build_circuit
+
+
+class ConverterBenchmarks:
+    params = ([5, 14, 20], [10, 100, 1000])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+
+    def setup(self, n_qubits, depth):
+        self.circuit = build_circuit('random', n_qubits, depth)
+        self.dag = circuit_to_dag(self.circuit)
+
+    def time_circuit_to_dag(self, _, __):
+        circuit_to_dag(self.circuit)
+
+    def peakmem_circuit_to_dag(self, _, __):
+        circuit_to_dag(self.circuit)
+
+    def time_dag_to_circuit(self, _, __):
+        dag_to_circuit(self.dag)
+
+    def time_layers(self, _, __):
+        for _ in self.dag.layers():
+            pass
+
+    def time_topological_op_nodes(self, _, __):
+        for _ in self.dag.topological_op_nodes():
+            pass
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of OpenQASM parsing."""
+
+from qiskit import QuantumCircuit
+from qiskit.converters import ast_to_dag
+from qiskit.qasm import Qasm
+
+from .utils import build_circuit
+
+
+class QasmParserBenchmarks:
+    params = ([5, 14], [10, 100, 1000])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+
+    def setup(self, n_qubits, depth):
+        self.qasm = build_circuit('random', n_qubits, depth).qasm()
+
+    def time_parse(self, _, __):
+        Qasm(data=self.qasm).parse()
+
+    def time_ast_to_dag(self, _, __):
+        ast_to_dag(Qasm(data=self.qasm).parse())
+
+    def time_from_qasm_str(self, _, __):
+        QuantumCircuit.from_qasm_str(self.qasm)
+
+    def peakmem_from_qasm_str(self, _, __):
+        QuantumCircuit.from_qasm_str(self.qasm)
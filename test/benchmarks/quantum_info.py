@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of Operator and Statevector algebra."""
+
+from qiskit.quantum_info import Operator, Statevector
+from qiskit.quantum_info.random import random_unitary, random_state
+
+from .utils import build_circuit
+
+
+class OperatorBenchmarks:
+    params = [2, 4, 6, 8, 10]
+    param_names = ['n_qubits']
+    timeout = 600
+
+    def setup(self, n_qubits):
+        self.circuit = build_circuit('quantum_volume', n_qubits, n_qubits, measure=False)
+        self.op1 = random_unitary(2 ** n_qubits, seed=1)
+        self.op2 = random_unitary(2 ** n_qubits, seed=2)
+        self.op_1q = random_unitary(2, seed=3)
+        self.op_2q = random_unitary(4, seed=4)
+
+    def time_from_circuit(self, _):
+        Operator(self.circuit)
+
+    def peakmem_from_circuit(self, _):
+        Operator(self.circuit)
+
+    def time_compose(self, _):
+        self.op1.compose(self.op2)
+
+    def time_compose_subsystem(self, _):
+        self.op1.compose(self.op_2q, qargs=[0, 1])
+
+    def time_tensor(self, _):
+        self.op1.tensor(self.op_1q)
+
+    def time_equiv(self, _):
+        self.op1.equiv(self.op2)
+
+
+class StatevectorBenchmarks:
+    params = [2, 6, 10, 14]
+    param_names = ['n_qubits']
+    timeout = 600
+
+    def setup(self, n_qubits):
+        self.circuit = build_circuit('quantum_volume', n_qubits, n_qubits, measure=False)
+        self.state = Statevector(random_state(2 ** n_qubits, seed=1))
+        self.state_1q = Statevector(random_state(2, seed=2))
+        self.op_2q = random_unitary(4, seed=3)
+
+    def time_from_instruction(self, _):
+        Statevector.from_instruction(self.circuit)
+
+    def peakmem_from_instruction(self, _):
+        Statevector.from_instruction(self.circuit)
+
+    def time_evolve_subsystem(self, _):
+        self.state.evolve(self.op_2q, qargs=[0, 1])
+
+    def time_tensor(self, _):
+        self.state.tensor(self.state_1q)
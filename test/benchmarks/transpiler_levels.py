@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of transpile() at the preset optimization levels."""
+
+from qiskit import transpile
+from qiskit.test.mock import FakeMelbourne
+
+from .utils import build_circuit
+
+
+class TranspilerLevelBenchmarks:
+    params = (['random', 'qft', 'quantum_volume'],
+              [5, 14],
+              [0, 1, 2, 3])
+    param_names = ['circuit', 'n_qubits', 'optimization_level']
+    timeout = 600
+
+    def setup(self, circuit, n_qubits, optimization_level):
+        if optimization_level == 3:
+            # Level 3 unrolls the circuit after decomposing the swap gates it
+            # inserts into cz gates, which have no definition to unroll them
+            raise NotImplementedError
+        self.backend = FakeMelbourne()
+        self.circuit = build_circuit(circuit, n_qubits, 10)
+
+    def time_transpile(self, _, __, optimization_level):
+        transpile(self.circuit, self.backend, optimization_level=optimization_level,
+                  seed_transpiler=0)
+
+    def peakmem_transpile(self, _, __, optimization_level):
+        transpile(self.circuit, self.backend, optimization_level=optimization_level,
+                  seed_transpiler=0)
+
+    def track_depth(self, _, __, optimization_level):
+        return transpile(self.circuit, self.backend, optimization_level=optimization_level,
+                         seed_transpiler=0).depth()
+
+    def track_cx_count(self, _, __, optimization_level):
+        return transpile(self.circuit, self.backend, optimization_level=optimization_level,
+                         seed_transpiler=0).count_ops().get('cx', 0)
+
+
+class TranspilerDepthBenchmarks:
+    params = ([5, 14], [2, 8])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+
+    def setup(self, n_qubits, depth):
+        self.backend = FakeMelbourne()
+        self.circuit = build_circuit('quantum_volume', n_qubits, depth)
+
+    def time_transpile(self, _, __):
+        transpile(self.circuit, self.backend, seed_transpiler=0)
+
+    def time_transpile_batch(self, _, __):
+        transpile([self.circuit] * 4, self.backend, seed_transpiler=0)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Circuits used by the benchmarks."""
+
+from inspect import signature
+import math
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.extensions.standard import (IdGate, U1Gate, U2Gate, U3Gate, XGate, YGate, ZGate,
+                                        HGate, SGate, SdgGate, TGate, TdgGate, RXGate, RYGate,
+                                        RZGate, CnotGate, CyGate, CHGate, CrzGate, Cu1Gate,
+                                        Cu3Gate, RZZGate)
+from qiskit.quantum_info.random import random_unitary
+
+# The gates of qiskit.circuit.random.random_circuit that the transpiler can
+# unroll to the basis of the backends: the cz gate has no definition, and the
+# swap gate is defined with cz gates
+ONE_QUBIT_GATES = [IdGate, U1Gate, U2Gate, U3Gate, XGate, YGate, ZGate, HGate, SGate,
+                   SdgGate, TGate, TdgGate, RXGate, RYGate, RZGate]
+TWO_QUBIT_GATES = [CnotGate, CyGate, CHGate, CrzGate, Cu1Gate, Cu3Gate, RZZGate]
+
+
+def build_circuit(name, n_qubits, depth, seed=42, measure=True):
+    """Return a benchmark circuit.
+
+    Args:
+        name (str): ``'random'``, ``'qft'`` or ``'quantum_volume'``.
+        n_qubits (int): number of qubits.
+        depth (int): number of layers of the random and quantum volume
+            circuits. The QFT circuit does not depend on it.
+        seed (int): seed of the random and quantum volume circuits.
+        measure (bool): if True, measure all the qubits at the end.
+
+    Returns:
+        QuantumCircuit: the circuit.
+
+    Raises:
+        ValueError: if the name is not known.
+    """
+    if name == 'random':
+        return random_circuit(n_qubits, depth, seed=seed, measure=measure)
+    if name == 'qft':
+        return qft_circuit(n_qubits, measure=measure)
+    if name == 'quantum_volume':
+        return quantum_volume_circuit(n_qubits, depth, seed=seed, measure=measure)
+    raise ValueError('Unknown benchmark circuit %s' % name)
+
+
+def random_circuit(n_qubits, depth, seed=42, measure=True):
+    """Return a random circuit of one and two-qubit gates.
+
+    Each layer applies random gates, with random angles, to the qubits of a
+    random partition of them in sets of one or two qubits, as
+    ``qiskit.circuit.random.random_circuit`` does, but without the gates
+    which cannot be transpiled.
+    """
+    rng = np.random.RandomState(seed)
+    circuit = QuantumCircuit(n_qubits, n_qubits, name='random')
+    for _ in range(depth):
+        remaining_qubits = list(rng.permutation(n_qubits))
+        while remaining_qubits:
+            num_operands = min(len(remaining_qubits), rng.randint(1, 3))
+            operands = [int(qubit) for qubit in remaining_qubits[:num_operands]]
+            remaining_qubits = remaining_qubits[num_operands:]
+            gates = ONE_QUBIT_GATES if num_operands == 1 else TWO_QUBIT_GATES
+            gate = gates[rng.randint(len(gates))]
+            num_angles = len([arg for arg in signature(gate).parameters if arg != 'label'])
+            circuit.append(gate(*rng.uniform(0, 2 * np.pi, num_angles)), operands)
+    if measure:
+        circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
+
+
+def qft_circuit(n_qubits, measure=True):
+    """Return a quantum Fourier transform on n_qubits."""
+    circuit = QuantumCircuit(n_qubits, n_qubits, name='qft')
+    for j in range(n_qubits):
+        circuit.h(j)
+        for k in range(j + 1, n_qubits):
+            circuit.cu1(math.pi / 2 ** (k - j), k, j)
+    if measure:
+        circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
+
+
+def quantum_volume_circuit(n_qubits, depth, seed=42, measure=True):
+    """Return a quantum volume model circuit.
+
+    Each layer applies Haar random two-qubit unitaries to the pairs of a
+    random permutation of the qubits.
+    """
+    rng = np.random.RandomState(seed)
+    circuit = QuantumCircuit(n_qubits, n_qubits, name='quantum_volume')
+    for _ in range(depth):
+        permutation = rng.permutation(n_qubits)
+        for k in range(n_qubits // 2):
+            unitary = random_unitary(4, seed=rng.randint(2 ** 31))
+            circuit.unitary(unitary, [int(permutation[2 * k]), int(permutation[2 * k + 1])])
+    if measure:
+        circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
@@ -21,7 +21,7 @@ import numpy as np
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile, assemble
-from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import QasmSimulatorPy, BasicAerError
 from qiskit.test import Path
 from qiskit.test import providers
 
@@ -230,6 +230,42 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         for mem in memory:
             self.assertIn(mem, ['10 00', '10 11'])
 
+    def test_measure_sampler_memory(self):
+        """Test sampled memory is consistent with counts."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[2])
+        circuit.h(qr[1])
+        circuit.measure(qr, cr)
+        shots = 200
+        result = execute(circuit, backend=self.backend, shots=shots, memory=True,
+                         seed_simulator=self.seed).result()
+        memory = result.get_memory()
+        self.assertEqual(len(memory), shots)
+        counts = {}
+        for mem in memory:
+            counts[mem] = counts.get(mem, 0) + 1
+        self.assertEqual(counts, result.get_counts())
+        self.assertEqual(set(counts), {'000', '010', '101', '111'})
+
+    def test_measure_sampler_wide_memory(self):
+        """Test measure sampler with more than 64 classical bits."""
+        shots = 100
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(70, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.h(qr[1])
+        circuit.measure(qr[0], cr[69])
+        circuit.measure(qr[1], cr[0])
+        result = execute(circuit, backend=self.backend, shots=shots,
+                         seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        self.assertEqual(sum(counts.values()), shots)
+        self.assertEqual(set(counts), {'1' + '0' * 69, '1' + '0' * 68 + '1'})
+
     def test_unitary(self):
         """Test unitary gate instruction"""
         max_qubits = 4
@@ -255,6 +291,143 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_gate_fusion(self):
+        """Test gate fusion gives the same counts and reports statistics."""
+        self.qobj.config.seed_simulator = self.seed
+        counts = self.backend.run(self.qobj).result().get_counts('test')
+
+        result = self.backend.run(self.qobj,
+                                  backend_options={'fusion_enable': True}).result()
+        self.assertEqual(result.get_counts('test'), counts)
+        fusion = result.results[0].metadata['fusion']
+        self.assertTrue(fusion['enabled'])
+        self.assertEqual(fusion['max_qubit'], 3)
+        self.assertLess(fusion['output_gates'], fusion['input_gates'])
+
+    def test_gate_fusion_conditionals(self):
+        """Test gate fusion does not fuse conditional gates."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.h(qr[1])
+        circuit.h(qr[1])
+        circuit.measure(qr[1], cr[1])
+        counts = execute(circuit, self.backend, shots=100, optimization_level=0,
+                         seed_simulator=self.seed).result().get_counts()
+        result = execute(circuit, self.backend, shots=100, optimization_level=0,
+                         seed_simulator=self.seed,
+                         backend_options={'fusion_enable': True,
+                                          'fusion_max_qubit': 2}).result()
+        self.assertEqual(result.get_counts(), counts)
+        self.assertEqual(set(counts), {'00', '11'})
+        # The gates before and after the measure and the conditional x are
+        # fused separately
+        self.assertEqual(result.results[0].metadata['fusion']['output_gates'], 2)
+
+    def test_gate_fusion_invalid_max_qubit(self):
+        """Test gate fusion raises for a maximum of less than one qubit."""
+        self.assertRaises(BasicAerError, self.backend.run, self.qobj,
+                          backend_options={'fusion_enable': True, 'fusion_max_qubit': 0})
+
+    def test_shot_branching_teleport(self):
+        """Test shot branching on teleportation."""
+        shots = 2000
+        qr = QuantumRegister(3, 'qr')
+        cr0 = ClassicalRegister(1, 'cr0')
+        cr1 = ClassicalRegister(1, 'cr1')
+        cr2 = ClassicalRegister(1, 'cr2')
+        circuit = QuantumCircuit(qr, cr0, cr1, cr2)
+        circuit.h(qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.ry(np.pi / 4, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr0[0])
+        circuit.measure(qr[1], cr1[0])
+        circuit.z(qr[2]).c_if(cr0, 1)
+        circuit.x(qr[2]).c_if(cr1, 1)
+        circuit.measure(qr[2], cr2[0])
+        result = execute(circuit, backend=self.backend, shots=shots, memory=True,
+                         seed_simulator=self.seed,
+                         backend_options={'shot_branching_enable': True}).result()
+        data = result.get_counts()
+        self.assertEqual(sum(data.values()), shots)
+        self.assertEqual(len(result.get_memory()), shots)
+        bob_0 = sum(count for key, count in data.items() if key[0] == '0')
+        bob_ratio = bob_0 / float(shots - bob_0)
+        alice_ratio = 1 / np.tan(np.pi / 8) ** 2
+        self.assertLess(abs(alice_ratio - bob_ratio) / alice_ratio, 0.05)
+        # One branch per outcome of the three measures
+        self.assertEqual(result.results[0].metadata['shot_branching'],
+                         {'enabled': True, 'branches': 8})
+
+    def test_shot_branching_reset(self):
+        """Test shot branching with resets and conditionals."""
+        shots = 100
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.x(qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.reset(qr[1])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.reset(qr[0])
+        circuit.measure(qr, cr)
+        result = execute(circuit, backend=self.backend, shots=shots,
+                         seed_simulator=self.seed,
+                         backend_options={'shot_branching_enable': True}).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'00', '10'})
+        self.assertEqual(sum(counts.values()), shots)
+        self.assertEqual(result.results[0].metadata['shot_branching']['branches'], 2)
+
+    def test_max_parallel_experiments(self):
+        """Test experiments run in parallel give the results of a serial run."""
+        circuits = []
+        for angle in [0.1, 0.2, 0.3]:
+            qr = QuantumRegister(2, 'qr')
+            cr = ClassicalRegister(2, 'cr')
+            circuit = QuantumCircuit(qr, cr)
+            circuit.h(qr[0])
+            circuit.rx(angle, qr[1])
+            circuit.measure(qr[0], cr[0])
+            circuit.cx(qr[0], qr[1])
+            circuit.measure(qr[1], cr[1])
+            circuits.append(circuit)
+        expected = execute(circuits, self.backend, shots=100,
+                           seed_simulator=self.seed).result()
+        result = execute(circuits, self.backend, shots=100, seed_simulator=self.seed,
+                         backend_options={'max_parallel_experiments': 2}).result()
+        for index in range(len(circuits)):
+            self.assertEqual(result.get_counts(index), expected.get_counts(index))
+
+        # Experiments without seeds are given different seeds
+        result = execute(circuits, self.backend, shots=100,
+                         backend_options={'max_parallel_experiments': 0}).result()
+        self.assertEqual(len({experiment.seed_simulator for experiment in result.results}),
+                         len(circuits))
+
+    def test_max_parallel_experiments_invalid(self):
+        """Test a negative number of parallel experiments raises."""
+        self.assertRaises(BasicAerError, self.backend.run, self.qobj,
+                          backend_options={'max_parallel_experiments': -1})
+
+    def test_unrecognized_instruction(self):
+        """Test an unrecognized instruction raises."""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.measure(qr[0], cr[0])
+        qobj = assemble(circuit, shots=10)
+        qobj.experiments[0].instructions[0].name = 'foo'
+        job = self.backend.run(qobj)
+        self.assertRaises(BasicAerError, job.result)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -23,6 +23,7 @@ from qiskit.test import providers
 from qiskit import QuantumRegister, QuantumCircuit, execute
 from qiskit.quantum_info.random import random_unitary
 from qiskit.quantum_info import state_fidelity
+from qiskit.quantum_info import Operator
 
 
 class StatevectorSimulatorTest(providers.BackendTestCase):
@@ -85,6 +86,53 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
                 fidelity = state_fidelity(psi_target, psi_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_gate_fusion(self):
+        """Test gate fusion gives the same statevector"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        rng = np.random.RandomState(42)
+        for _ in range(5):
+            for qubit in qr:
+                circuit.u3(*rng.rand(3), qubit)
+            circuit.cx(qr[0], qr[1])
+            circuit.cx(qr[2], qr[3])
+            circuit.barrier(qr)
+            circuit.cx(qr[1], qr[2])
+            circuit.unitary(random_unitary(4, seed=rng.randint(1000)), [qr[3], qr[0]])
+        expected = execute(circuit, self.backend).result().get_statevector()
+
+        for max_qubit in range(1, 5):
+            result = execute(circuit, self.backend,
+                             backend_options={'fusion_enable': True,
+                                              'fusion_max_qubit': max_qubit}).result()
+            self.assertTrue(np.allclose(result.get_statevector(), expected))
+            fusion = result.results[0].metadata['fusion']
+            self.assertEqual(fusion['max_qubit'], max_qubit)
+            self.assertEqual(fusion['input_gates'], len(circuit.data) - 5)
+        self.assertEqual(fusion['output_gates'], 1)
+
+    def test_monomial_gates(self):
+        """Test gates with one non-zero entry per row and column"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[2])
+        circuit.x(qr[0])
+        circuit.y(qr[3])
+        circuit.s(qr[2])
+        circuit.tdg(qr[0])
+        circuit.u1(0.3, qr[1])
+        circuit.cx(qr[3], qr[0])
+        circuit.unitary(np.diag(np.exp(1j * np.array([0.5, 0.6, 0.7, 0.8]))), [qr[1], qr[2]])
+        circuit.cx(qr[0], qr[2])
+        # A permutation with phases on non-adjacent qubits
+        phases = np.exp(1j * np.array([0.1, 0.2, 0.3, 0.4]))
+        permutation = np.eye(4)[[2, 0, 3, 1]] * phases[:, None]
+        circuit.unitary(permutation, [qr[3], qr[1]])
+        expected = Operator(circuit).data[:, 0]
+        result = execute(circuit, self.backend).result()
+        self.assertAlmostEqual(state_fidelity(result.get_statevector(0), expected), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,18 +14,22 @@
 
 """Tests for unitary simulator."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
 import numpy as np
 
-from qiskit import execute
+from qiskit import execute, assemble
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
-from qiskit.providers.basicaer import UnitarySimulatorPy
+from qiskit.providers.basicaer import UnitarySimulatorPy, BasicAerError
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit.quantum_info.random import random_unitary
 from qiskit.quantum_info import process_fidelity
+from qiskit.quantum_info import Operator
 
 
 class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
@@ -119,6 +123,79 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
                 fidelity = process_fidelity(unitary_target, unitary_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_monomial_gates(self):
+        """Test gates with one non-zero entry per row and column"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr)
+        circuit.x(qr[0])
+        circuit.y(qr[3])
+        circuit.z(qr[1])
+        circuit.s(qr[2])
+        circuit.tdg(qr[0])
+        circuit.u1(0.3, qr[1])
+        circuit.cx(qr[3], qr[0])
+        circuit.unitary(np.diag(np.exp(1j * np.array([0.5, 0.6, 0.7, 0.8]))), [qr[1], qr[2]])
+        circuit.cx(qr[0], qr[2])
+        # A permutation with phases on non-adjacent qubits
+        phases = np.exp(1j * np.array([0.1, 0.2, 0.3, 0.4]))
+        permutation = np.eye(4)[[2, 0, 3, 1]] * phases[:, None]
+        circuit.unitary(permutation, [qr[3], qr[1]])
+        result = execute(circuit, self.backend).result()
+        self.assertTrue(matrix_equal(result.get_unitary(0), Operator(circuit).data,
+                                     ignore_phase=True))
+
+    def test_max_parallel_experiments(self):
+        """Test experiments run in parallel give the results of a serial run."""
+        circuits = self._test_circuits()
+        result = execute(circuits, backend=self.backend,
+                         backend_options={'max_parallel_experiments': 2}).result()
+        for circuit, reference in zip(circuits, self._reference_unitaries()):
+            self.assertTrue(matrix_equal(result.get_unitary(circuit), reference,
+                                         ignore_phase=True))
+
+    def test_blocks(self):
+        """Test the unitary evolved by blocks of columns in a memmap file."""
+        qr = QuantumRegister(5, 'qr')
+        circuit = QuantumCircuit(qr)
+        rng = np.random.RandomState(42)
+        for _ in range(3):
+            for qubit in qr:
+                circuit.u3(*rng.rand(3), qubit)
+            circuit.cx(qr[0], qr[3])
+            circuit.cx(qr[4], qr[1])
+            circuit.unitary(random_unitary(4, seed=rng.randint(1000)), [qr[2], qr[0]])
+        initial_unitary = random_unitary(32, seed=5).data
+        expected = execute(circuit, self.backend, backend_options={
+            'initial_unitary': initial_unitary}).result().get_unitary()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        # A column of 32 complex numbers and its contraction take 1KB
+        for options in [{'max_memory_mb': 8 / 1024}, {'max_memory_mb': 16 / 1024},
+                        {'max_memory_mb': 8 / 1024, 'max_parallel_blocks': 2}]:
+            options.update(initial_unitary=initial_unitary, memmap_dir=directory)
+            result = execute(circuit, self.backend, backend_options=options).result()
+            self.assertTrue(np.allclose(result.get_unitary(), expected))
+            self.assertTrue(result.results[0].metadata['blocks']['enabled'])
+        self.assertEqual(result.results[0].metadata['blocks'],
+                         {'enabled': True, 'block_size': 4, 'num_blocks': 8})
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_blocks_need_memory_budget(self):
+        """Test the unitary is evolved at once without a memory budget."""
+        result = execute(self._test_circuits(), self.backend,
+                         backend_options={'max_parallel_blocks': 2}).result()
+        self.assertFalse(hasattr(result.results[0], 'metadata'))
+
+    def test_blocks_invalid_memory(self):
+        """Test a memory budget too small for a column raises."""
+        qobj = assemble(self._test_circuits())
+        self.assertRaises(BasicAerError, self.backend.run, qobj,
+                          backend_options={'max_memory_mb': -1})
+        job = self.backend.run(qobj, backend_options={'max_memory_mb': 1e-6})
+        self.assertRaises(BasicAerError, job.result)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -248,6 +248,80 @@ class TestParameters(QiskitTestCase):
             if hasattr(gate_tuple[0], 'params') and gate_tuple[0].params:
                 self.assertIn(float(gate_tuple[0].params[0]), theta_vals)
 
+    def test_bind_parameters_batch(self):
+        """Test binding arrays of values gives the circuits of bind_parameters"""
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        qc.u3(theta, phi, 2 * theta - phi, 1)
+
+        thetas = numpy.linspace(0, numpy.pi, 4)
+        phis = numpy.linspace(1, 2, 4)
+        bound = list(qc.bind_parameters_batch({theta: thetas, phi: phis}))
+
+        self.assertEqual(len(bound), 4)
+        for bqc, theta_val, phi_val in zip(bound, thetas, phis):
+            self.assertEqual(bqc.parameters, set())
+            self.assertEqual(bqc, qc.bind_parameters({theta: theta_val, phi: phi_val}))
+            self.assertEqual([type(param) for inst, _, _ in bqc.data for param in inst.params],
+                             [float] * 4)
+            # Instructions without parameters are shared
+            self.assertIs(bqc.data[0][0], qc.data[0][0])
+        self.assertEqual(qc.parameters, {theta, phi})
+
+    def test_bind_parameters_batch_vector(self):
+        """Test binding arrays of values to a ParameterVector"""
+        theta = ParameterVector('θ', length=3)
+        qc = QuantumCircuit(3)
+        for i, param in enumerate(theta):
+            qc.ry(param, i)
+
+        values = numpy.arange(6).reshape(2, 3)
+        bound = list(qc.bind_parameters_batch({theta: values}))
+
+        self.assertEqual(len(bound), 2)
+        for bqc, row in zip(bound, values):
+            self.assertEqual([inst.params for inst, _, _ in bqc.data],
+                             [[value] for value in row])
+
+    def test_bind_parameters_batch_partial(self):
+        """Test binding arrays of values to some of the parameters"""
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        qc.rz(theta + phi, 0)
+        qc.ry(phi, 0)
+
+        bound = list(qc.bind_parameters_batch({theta: [0.5, 1.5]}))
+
+        for bqc, theta_val in zip(bound, [0.5, 1.5]):
+            self.assertEqual(bqc.parameters, {phi})
+            fully_bound = bqc.bind_parameters({phi: 2})
+            self.assertEqual(fully_bound, qc.bind_parameters({theta: theta_val, phi: 2}))
+
+    def test_bind_parameters_batch_raises(self):
+        """Test bind_parameters_batch raises for invalid values"""
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+        vector = ParameterVector('v', length=2)
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        qc.rz(phi, 0)
+        qc.ry(vector[0], 0)
+        qc.ry(vector[1], 0)
+
+        self.assertRaises(QiskitError, qc.bind_parameters_batch,
+                          {theta: [0.1], Parameter('x'): [0.2]})
+        self.assertRaises(QiskitError, qc.bind_parameters_batch,
+                          {theta: [0.1, 0.2], phi: [0.3]})
+        self.assertRaises(QiskitError, qc.bind_parameters_batch, {theta: ['a']})
+        self.assertRaises(QiskitError, qc.bind_parameters_batch, {vector: [[0.1, 0.2, 0.3]]})
+        self.assertRaises(QiskitError, qc.bind_parameters_batch, {'θ': [0.1]})
+
     def test_compile_vector(self):
         """Test compiling a circuit with an unbound ParamterVector"""
         qc = QuantumCircuit(4)
@@ -344,7 +418,7 @@ class TestParameters(QiskitTestCase):
         self.assertEqual(len(qobj.experiments), 1)
         self.assertEqual(len(qobj.experiments[0].instructions), 4)
         self.assertTrue(all(len(inst.params) == 1
-                            and isinstance(inst.params[0], ParameterExpression)
+                            and isinstance(inst.params[0], float)
                             and float(inst.params[0]) == 1
                             for inst in qobj.experiments[0].instructions))
 
@@ -509,6 +583,55 @@ class TestParameterExpressions(QiskitTestCase):
 
         self.assertEqual(float(bound_expr2), 5)
 
+    def test_bound_values_match_sympy(self):
+        """Verify numerically bound expressions match substituting with sympy."""
+
+        x = Parameter('x')
+        y = Parameter('y')
+        z = Parameter('z')
+        values = {x: 0.3, y: -1.7, z: 2}
+
+        expressions = [(x + y) * z, x * (y + z) - 3, 1.5 / (x - y) + z,
+                       2 - x / z * y, (x * y) / (y + 2.1) * z]
+        for expr in expressions:
+            # pylint: disable=protected-access
+            expected = float(expr._symbol_expr.subs(
+                {expr._parameter_symbols[p]: v for p, v in values.items()}))
+            bound_expr = expr.bind(values)
+
+            self.assertEqual(bound_expr.parameters, set())
+            self.assertAlmostEqual(float(bound_expr), expected)
+
+            # Partially bound expressions are compiled from their sympy expression
+            partially_bound_expr = expr.bind({x: values[x]})
+            self.assertAlmostEqual(float(partially_bound_expr.bind({y: values[y],
+                                                                    z: values[z]})),
+                                   expected)
+
+    def test_bind_pickled_expression(self):
+        """Verify expressions can be bound after a pickle round trip."""
+
+        x = Parameter('x')
+        y = Parameter('y')
+        expr = (x + 1) * y
+        # Compile the evaluator before pickling
+        self.assertEqual(float(expr.bind({x: 1, y: 2})), 4)
+
+        unpickled = pickle.loads(pickle.dumps(expr))
+        x, y = sorted(unpickled.parameters, key=lambda p: p.name)
+        self.assertEqual(float(unpickled.bind({x: 2, y: 3})), 9)
+
+    def test_bind_deep_expression(self):
+        """Verify expressions of many chained operations can be bound."""
+
+        x = Parameter('x')
+        expr = x
+        for _ in range(3000):
+            expr = expr + 1
+        expr = expr * expr
+
+        self.assertEqual(float(expr.bind({x: 1})), 3001 ** 2)
+
     def test_name_collision(self):
         """Verify Expressions of distinct Parameters of shared name raises."""
 
@@ -14,18 +14,26 @@
 
 """Assembler Test."""
 
+from functools import partial
+import sys
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 
 import qiskit.pulse as pulse
-from qiskit.circuit import Instruction, Parameter
+from qiskit.circuit import Instruction, Parameter, ParameterVector
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import transpile
 from qiskit.compiler.assemble import assemble
 from qiskit.exceptions import QiskitError
 from qiskit.qobj import QasmQobj
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeOpenPulse2Q
+from qiskit.tools.parallel import parallel_map
+
+# qiskit.assembler.assemble_circuits is shadowed by the assemble_circuits function
+ASSEMBLE_CIRCUITS_MODULE = sys.modules['qiskit.assembler.assemble_circuits']
 
 
 class TestCircuitAssembler(QiskitTestCase):
@@ -292,6 +300,114 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertEqual(_qobj_inst_params(7, 0), [1, 0])
         self.assertEqual(_qobj_inst_params(8, 0), [2, 1])
 
+    def test_assemble_transpiled_circuit_binds_parameters(self):
+        """Verify a circuit transpiled once with parameters is bound in the qobj."""
+        theta = Parameter('theta')
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        qc.rz(2 * theta, 1)
+        qc.measure([0, 1], [0, 1])
+
+        for optimization_level in range(4):
+            transpiled = transpile(qc, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   optimization_level=optimization_level)
+            self.assertEqual(transpiled.parameters, {theta})
+
+            values = [0.1, 0.2, 0.3]
+            qobj = assemble(transpiled,
+                            parameter_binds=[{theta: value} for value in values])
+            self.assertEqual(len(qobj.experiments), 3)
+            for value, expt in zip(values, qobj.experiments):
+                bound = assemble(transpiled.bind_parameters({theta: value}))
+                self.assertEqual(
+                    [[float(param) for param in inst.params]
+                     for inst in expt.instructions if hasattr(inst, 'params')],
+                    [[float(param) for param in inst.params]
+                     for inst in bound.experiments[0].instructions
+                     if hasattr(inst, 'params')])
+
+    def test_assemble_binds_parameter_vector(self):
+        """Verify parameter binds can be given for a whole ParameterVector."""
+        params = ParameterVector('p', 2)
+        qc = QuantumCircuit(1)
+        qc.rz(params[0], 0)
+        qc.rx(params[1], 0)
+
+        qobj = assemble(qc, parameter_binds=[{params: [0.1, 0.3]}, {params: [0.2, 0.4]}])
+        self.assertEqual(len(qobj.experiments), 2)
+        self.assertEqual(qobj.experiments[0].instructions[0].params, [0.1])
+        self.assertEqual(qobj.experiments[0].instructions[1].params, [0.3])
+        self.assertEqual(qobj.experiments[1].instructions[0].params, [0.2])
+        self.assertEqual(qobj.experiments[1].instructions[1].params, [0.4])
+
+    def test_assemble_parameter_binds_do_not_modify_circuit(self):
+        """Verify binding parameters in assemble leaves the circuit unbound."""
+        theta = Parameter('theta')
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.rz(theta, 0)
+
+        qobj = assemble(qc, parameter_binds=[{theta: 0.5}, {theta: 1.5}])
+        self.assertEqual(qc.parameters, {theta})
+        self.assertEqual(qobj.experiments[0].instructions[1].params, [0.5])
+        self.assertEqual(qobj.experiments[1].instructions[1].params, [1.5])
+
+    def test_bit_indices_across_registers(self):
+        """Verify bits are numbered across registers in the order of the registers."""
+        qr1 = QuantumRegister(2, 'qr1')
+        qr2 = QuantumRegister(3, 'qr2')
+        cr1 = ClassicalRegister(1, 'cr1')
+        cr2 = ClassicalRegister(2, 'cr2')
+        qc = QuantumCircuit(qr1, qr2, cr1, cr2)
+        qc.cx(qr2[2], qr1[1])
+        qc.measure(qr2[1], cr2[1])
+        qc.x(qr1[0]).c_if(cr2, 2)
+
+        qobj = assemble(qc)
+        cx_op, measure_op, bfunc_op, x_op = qobj.experiments[0].instructions
+        self.assertEqual(cx_op.qubits, [4, 1])
+        self.assertEqual(measure_op.qubits, [3])
+        self.assertEqual(measure_op.memory, [2])
+        self.assertEqual(bfunc_op.mask, '0x6')
+        self.assertEqual(bfunc_op.val, '0x4')
+        self.assertEqual(x_op.qubits, [0])
+
+    def test_circuits_with_same_registers(self):
+        """Verify circuits with the same registers keep their own names in the headers."""
+        circuits = []
+        for name in ['first', 'second']:
+            qc = QuantumCircuit(2, 2, name=name)
+            qc.h(0)
+            qc.measure([0, 1], [0, 1])
+            circuits.append(qc)
+
+        qobj = assemble(circuits)
+        first, second = qobj.experiments
+        self.assertEqual(first.header.name, 'first')
+        self.assertEqual(second.header.name, 'second')
+        self.assertEqual(first.header.qubit_labels, second.header.qubit_labels)
+        self.assertEqual(first.header.clbit_labels, [['c', 0], ['c', 1]])
+
+    def test_parallel_assembly_order(self):
+        """Verify experiments are in the order of the circuits when assembled in parallel."""
+        circuits = []
+        for i in range(6):
+            qc = QuantumCircuit(i + 1, i + 1, name='circuit%d' % i)
+            qc.h(i)
+            qc.measure(i, i)
+            circuits.append(qc)
+
+        with patch.object(ASSEMBLE_CIRCUITS_MODULE, 'parallel_map',
+                          partial(parallel_map, num_processes=2, executor='thread')):
+            qobj = assemble(circuits)
+        self.assertEqual([experiment.header.name for experiment in qobj.experiments],
+                         ['circuit%d' % i for i in range(6)])
+        self.assertEqual([experiment.instructions[0].qubits for experiment in qobj.experiments],
+                         [[i] for i in range(6)])
+        self.assertEqual(qobj.config.n_qubits, 6)
+
 
 class TestPulseAssembler(QiskitTestCase):
     """Tests for assembling schedules to qobj."""
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the caches of transpiled circuits"""
+
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Gate, Parameter
+from qiskit.compiler import (transpile, TranspileCache, MemoryTranspileCache,
+                             DiskTranspileCache)
+from qiskit.compiler.transpile_cache import circuit_structural_hash
+from qiskit.extensions.standard import RZGate
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeMelbourne
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.exceptions import TranspilerError
+
+# qiskit.compiler.transpile is shadowed by the transpile function
+TRANSPILE_MODULE = sys.modules['qiskit.compiler.transpile']
+TRANSPILE_CACHE_MODULE = sys.modules['qiskit.compiler.transpile_cache']
+
+
+def _make_circuit(angle=0.5, name=None):
+    qr = QuantumRegister(3, 'qr')
+    cr = ClassicalRegister(3, 'cr')
+    circuit = QuantumCircuit(qr, cr, name=name)
+    circuit.h(qr[0])
+    circuit.cx(qr[0], qr[2])
+    circuit.rz(angle, qr[1])
+    circuit.cx(qr[2], qr[1])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+class _LazyGate(Gate):
+    """Gate that builds its definition when it is first used."""
+
+    def __init__(self, angle):
+        super().__init__('lazy', 1, [angle])
+
+    def _define(self):
+        qr = QuantumRegister(1, 'q')
+        self.definition = [(RZGate(self.params[0]), [qr[0]], [])]
+
+
+class TestCircuitStructuralHash(QiskitTestCase):
+    """Test the structural hash of circuits."""
+
+    def test_same_structure(self):
+        """Circuits with the same instructions have the same hash, whatever their names."""
+        self.assertEqual(circuit_structural_hash(_make_circuit(name='a')),
+                         circuit_structural_hash(_make_circuit(name='b')))
+
+    def test_different_params(self):
+        """Circuits with different gate parameters have different hashes."""
+        self.assertNotEqual(circuit_structural_hash(_make_circuit(0.5)),
+                            circuit_structural_hash(_make_circuit(0.25)))
+
+    def test_different_qubits(self):
+        """Circuits acting on different qubits have different hashes."""
+        qr = QuantumRegister(2, 'qr')
+        circuit1 = QuantumCircuit(qr)
+        circuit1.cx(qr[0], qr[1])
+        circuit2 = QuantumCircuit(qr)
+        circuit2.cx(qr[1], qr[0])
+        self.assertNotEqual(circuit_structural_hash(circuit1),
+                            circuit_structural_hash(circuit2))
+
+    def test_definitions(self):
+        """Custom instructions are hashed with their definitions."""
+        def make_circuit(angle):
+            definition = QuantumCircuit(1, name='custom')
+            definition.rz(angle, 0)
+            circuit = QuantumCircuit(1)
+            circuit.append(definition.to_instruction(), [0])
+            return circuit
+
+        self.assertEqual(circuit_structural_hash(make_circuit(0.5)),
+                         circuit_structural_hash(make_circuit(0.5)))
+        self.assertNotEqual(circuit_structural_hash(make_circuit(0.5)),
+                            circuit_structural_hash(make_circuit(0.25)))
+
+    def test_definitions_built_or_not(self):
+        """The hash does not depend on whether definitions were already built."""
+        circuit = QuantumCircuit(1)
+        circuit.append(_LazyGate(0.5), [0])
+        circuit_hash = circuit_structural_hash(circuit)
+        circuit.data[0][0].definition  # pylint: disable=pointless-statement
+        self.assertEqual(circuit_structural_hash(circuit), circuit_hash)
+
+        standard = _make_circuit()
+        standard_hash = circuit_structural_hash(standard)
+        for instruction, _, _ in standard.data:
+            instruction.definition  # pylint: disable=pointless-statement
+        self.assertEqual(circuit_structural_hash(standard), standard_hash)
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Test transpile() with a cache."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = FakeMelbourne()
+
+    def test_memory_cache_hit(self):
+        """A circuit transpiled again is taken from the cache."""
+        cache = MemoryTranspileCache()
+        first = transpile(_make_circuit(name='first'), self.backend,
+                          seed_transpiler=42, cache=cache)
+        self.assertEqual(len(cache), 1)
+
+        with patch.object(TRANSPILE_MODULE, 'parallel_map') as mock_map:
+            second = transpile(_make_circuit(name='second'), self.backend,
+                               seed_transpiler=42, cache=cache)
+        mock_map.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, 'second')
+
+    def test_cache_matches_transpile(self):
+        """Cached results are the same as transpiling without a cache."""
+        cache = MemoryTranspileCache()
+        circuits = [_make_circuit(0.1 * i) for i in range(3)]
+        expected = transpile(circuits, self.backend, seed_transpiler=42)
+        transpile(circuits, self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(transpile(circuits, self.backend, seed_transpiler=42, cache=cache),
+                         expected)
+
+    def test_different_options_miss(self):
+        """Transpiling with different options does not use the cached circuit."""
+        cache = MemoryTranspileCache()
+        transpile(_make_circuit(), self.backend, seed_transpiler=42, cache=cache)
+        transpile(_make_circuit(), self.backend, seed_transpiler=42,
+                  optimization_level=2, cache=cache)
+        transpile(_make_circuit(), self.backend, seed_transpiler=43, cache=cache)
+        self.assertEqual(len(cache), 3)
+
+    def test_memory_cache_eviction(self):
+        """The least recently used circuits are evicted."""
+        cache = MemoryTranspileCache(max_entries=2)
+        for angle in [0.1, 0.2, 0.3]:
+            transpile(_make_circuit(angle), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_memory_cache_size_eviction(self):
+        """Circuits are evicted when their pickles are over the size of the cache."""
+        cache = MemoryTranspileCache()
+        transpile(_make_circuit(), self.backend, seed_transpiler=42, cache=cache)
+        size = cache._size  # pylint: disable=protected-access
+
+        cache = MemoryTranspileCache(max_size=int(size * 1.5))
+        for angle in [0.1, 0.2, 0.3]:
+            transpile(_make_circuit(angle), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_parameters_of_input_circuit(self):
+        """A cached circuit uses the parameters of the circuit being transpiled."""
+        cache = MemoryTranspileCache()
+        for _ in range(2):
+            theta = Parameter('theta')
+            circuit = QuantumCircuit(2)
+            circuit.rx(theta, 0)
+            circuit.cx(0, 1)
+            out = transpile(circuit, self.backend, seed_transpiler=42, cache=cache)
+            self.assertEqual(out.parameters, {theta})
+            out.bind_parameters({theta: 0.5})
+        self.assertEqual(len(cache), 1)
+
+    def test_different_version_miss(self):
+        """Circuits cached by another Qiskit version are not reused."""
+        cache = MemoryTranspileCache()
+        transpile(_make_circuit(), self.backend, seed_transpiler=42, cache=cache)
+        with patch.object(TRANSPILE_CACHE_MODULE, '__version__', '0.0.0'):
+            transpile(_make_circuit(), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_pass_manager_not_cached(self):
+        """Circuits transpiled with a pass manager are not cached."""
+        cache = MemoryTranspileCache()
+        transpile(_make_circuit(), pass_manager=PassManager(), cache=cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_size(self):
+        """Caches raise on invalid sizes."""
+        self.assertRaises(TranspilerError, MemoryTranspileCache, max_entries=0)
+        self.assertRaises(TranspilerError, MemoryTranspileCache, max_size=0)
+        self.assertRaises(TranspilerError, DiskTranspileCache, 'unused', max_size=0)
+
+    def test_abstract_base_class(self):
+        """The base class cannot be instantiated."""
+        self.assertRaises(TypeError, TranspileCache)
+
+
+class TestDiskTranspileCache(QiskitTestCase):
+    """Test the on-disk cache of transpiled circuits."""
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.backend = FakeMelbourne()
+
+    def test_disk_cache_hit(self):
+        """A circuit is read back from the disk cache by another cache instance."""
+        first = transpile(_make_circuit(), self.backend, seed_transpiler=42,
+                          cache=DiskTranspileCache(self.directory))
+        with patch.object(TRANSPILE_MODULE, 'parallel_map') as mock_map:
+            second = transpile(_make_circuit(), self.backend, seed_transpiler=42,
+                               cache=DiskTranspileCache(self.directory))
+        mock_map.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_disk_cache_eviction(self):
+        """Files are evicted when the cache is over its size."""
+        cache = DiskTranspileCache(self.directory)
+        transpile(_make_circuit(), self.backend, seed_transpiler=42, cache=cache)
+        file_size = sum(os.path.getsize(os.path.join(self.directory, name))
+                        for name in os.listdir(self.directory))
+
+        cache = DiskTranspileCache(self.directory, max_size=int(file_size * 1.5))
+        transpile(_make_circuit(0.25), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_disk_cache_clear(self):
+        """clear() removes the cache files."""
+        cache = DiskTranspileCache(self.directory)
+        transpile(_make_circuit(), self.backend, seed_transpiler=42, cache=cache)
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
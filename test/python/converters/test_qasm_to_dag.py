@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the streaming OpenQASM converter."""
+
+import io
+import mmap
+import sys
+import unittest
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+from qiskit.converters import ast_to_dag, dag_to_circuit, qasm_to_dag
+from qiskit.qasm import Qasm, QasmError
+from qiskit.test import QiskitTestCase, Path
+
+# qiskit.converters.qasm_to_dag is shadowed by the qasm_to_dag function
+QASM_TO_DAG_MODULE = sys.modules['qiskit.converters.qasm_to_dag']
+
+
+class TestQasmToDag(QiskitTestCase):
+    """Test OpenQASM to DAG."""
+
+    def test_same_as_ast_to_dag(self):
+        """Test the DAGs are the same as through the AST."""
+        for name in ['example.qasm', 'example_if.qasm', 'random_n5_d5.qasm',
+                     'move_measurements.qasm']:
+            path = self._get_resource_path(name, Path.QASMS)
+            expected = ast_to_dag(Qasm(filename=path).parse())
+            with open(path) as file:
+                self.assertEqual(qasm_to_dag(file), expected)
+            with open(path, 'rb') as file:
+                self.assertEqual(qasm_to_dag(file), expected)
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    self.assertEqual(qasm_to_dag(buffer, path), expected)
+            with open(path) as file:
+                self.assertEqual(qasm_to_dag(file.read()), expected)
+
+    def test_chunks(self):
+        """Test programs read in pieces smaller than their lines."""
+        path = self._get_resource_path('example.qasm', Path.QASMS)
+        expected = ast_to_dag(Qasm(filename=path).parse())
+        with patch.object(QASM_TO_DAG_MODULE, '_CHUNK_SIZE', 7):
+            with open(path, 'rb') as file:
+                self.assertEqual(qasm_to_dag(file), expected)
+
+    def test_custom_gates(self):
+        """Test calls to custom gates are expanded into their definitions."""
+        program = io.StringIO("""OPENQASM 2.0;
+include "qelib1.inc";
+gate inner(a, b) x, y { rz(a/2) x; cx x, y; u3(-a, b^2, pi) y; }
+gate outer(t) p, q, r { inner(t, 2*t) r, p; barrier p, q; inner(sin(t), 0.5) q, r; }
+qreg q[3];
+creg c[3];
+outer(0.3) q[0], q[1], q[2];
+if(c==1) inner(1, 0) q[1], q[2];
+""")
+        expected = QuantumCircuit.from_qasm_str("""OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[3];
+creg c[3];
+rz(0.3/2) q[2]; cx q[2], q[0]; u3(-0.3, (2*0.3)^2, pi) q[0];
+barrier q[0], q[1];
+rz(sin(0.3)/2) q[1]; cx q[1], q[2]; u3(-sin(0.3), 0.5^2, pi) q[2];
+if(c==1) rz(1/2) q[1];
+if(c==1) cx q[1], q[2];
+if(c==1) u3(-1, 0^2, pi) q[2];
+""")
+        self.assertEqual(dag_to_circuit(qasm_to_dag(program)), expected)
+
+    def test_broadcast(self):
+        """Test gates on registers are applied to each of their qubits."""
+        dag = qasm_to_dag("""OPENQASM 2.0;
+include "qelib1.inc";
+qreg a[3];
+qreg b[3];
+creg c[3];
+cx a, b;
+cx a[0], b;
+u1(0.5) a;
+measure b -> c;
+""")
+        self.assertEqual(dag.count_ops(), {'cx': 6, 'u1': 3, 'measure': 3})
+
+    def test_include_cache(self):
+        """Test the definitions of qelib1.inc are not read again."""
+        program = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\nh q[0];\n'
+        qasm_to_dag(program)
+        with patch.object(QASM_TO_DAG_MODULE, 'open', create=True) as mock_open:
+            dag = qasm_to_dag(program)
+        mock_open.assert_not_called()
+        self.assertEqual(dag.count_ops(), {'h': 1})
+
+    def test_errors(self):
+        """Test invalid programs raise QasmError."""
+        for program in ['OPENQASM 2.0;\nqreg q[2];\nh q[0];\n',
+                        'OPENQASM 2.0;\nqreg q[2];\nU(0, 0) q[0];\n',
+                        'OPENQASM 2.0;\nqreg q[2];\nCX q[0], q[2];\n',
+                        'OPENQASM 2.0;\nqreg q[2];\nCX q[0], q[0];\n',
+                        'OPENQASM 2.0;\nqreg q[2];\nqreg r[3];\nCX q, r;\n',
+                        'OPENQASM 2.0;\nqreg q[2];\ncreg q[2];\n',
+                        'OPENQASM 2.0;\nqreg q[2];\nU(0, 0, a) q[0];\n',
+                        'OPENQASM 2.0;\ngate g a { U(0, 0, 0) b; }\n',
+                        'OPENQASM 2.0;\nqreg q[2];\nreset q[0]\n',
+                        'OPENQASM 3.0;\n']:
+            with self.subTest(program=program):
+                self.assertRaises(QasmError, qasm_to_dag, program)
+
+        path = self._get_resource_path('example_fail.qasm', Path.QASMS)
+        with open(path) as file:
+            self.assertRaisesRegex(QasmError, "Perhaps there is a missing", qasm_to_dag, file)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Columnar qobj experiment tests."""
+
+import copy
+import pickle
+
+from qiskit import BasicAer, QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import assemble, transpile
+from qiskit.qobj import (ColumnarQasmQobjExperiment, QasmQobjExperiment,
+                         QasmQobjInstruction, QobjExperimentHeader, QasmQobj)
+from qiskit.qobj import validate_qobj_against_schema
+from qiskit.validation import ModelValidationError
+from qiskit.test import QiskitTestCase
+
+
+def _make_circuit():
+    qr = QuantumRegister(2, 'qr')
+    cr1 = ClassicalRegister(1, 'cr1')
+    cr2 = ClassicalRegister(1, 'cr2')
+    circuit = QuantumCircuit(qr, cr1, cr2, name='circuit')
+    circuit.h(qr[0])
+    circuit.measure(qr[0], cr1[0])
+    circuit.x(qr[1]).c_if(cr1, 1)
+    circuit.u3(0.1, 0.2, 0.3, qr[1])
+    circuit.barrier(qr)
+    circuit.measure(qr[1], cr2[0])
+    return circuit
+
+
+class TestColumnarQasmQobjExperiment(QiskitTestCase):
+    """Tests for ColumnarQasmQobjExperiment."""
+
+    def setUp(self):
+        self.experiment = QasmQobjExperiment(
+            instructions=[QasmQobjInstruction(name='u1', qubits=[1], params=[0.4]),
+                          QasmQobjInstruction(name='cx', qubits=[0, 1]),
+                          QasmQobjInstruction(name='bfunc', mask='0x1', relation='==',
+                                              val='0x1', register=2),
+                          QasmQobjInstruction(name='measure', qubits=[0], memory=[0],
+                                              conditional=2),
+                          QasmQobjInstruction(name='u1', qubits=[0], params=[0.2])],
+            header=QobjExperimentHeader(name='test'))
+
+    def test_same_dict(self):
+        """Test a columnar experiment serializes like the experiment it is made from."""
+        columnar = ColumnarQasmQobjExperiment.from_experiment(self.experiment)
+        self.assertEqual(columnar.to_dict(), self.experiment.to_dict())
+        self.assertEqual(columnar, self.experiment)
+        self.assertEqual(columnar.instruction_names, ['u1', 'cx', 'bfunc', 'measure', 'u1'])
+
+    def test_instructions(self):
+        """Test the instructions are built from the columns."""
+        columnar = ColumnarQasmQobjExperiment.from_experiment(self.experiment)
+        self.assertEqual(columnar.instructions, self.experiment.instructions)
+        self.assertIsInstance(columnar.instruction(3), QasmQobjInstruction)
+        self.assertEqual(columnar.instruction(3).conditional, 2)
+
+        columnar.instructions = self.experiment.instructions[:2]
+        self.assertEqual(columnar.instruction_names, ['u1', 'cx'])
+
+    def test_copy_with_params(self):
+        """Test copying an experiment with new parameters."""
+        columnar = ColumnarQasmQobjExperiment.from_experiment(self.experiment)
+        new = columnar.copy_with_params({columnar.param_index(4, 0): 0.5})
+        self.assertEqual(new.instruction(4).params, [0.5])
+        self.assertEqual(columnar.instruction(4).params, [0.2])
+        self.assertEqual(new.instruction(0).params, [0.4])
+
+    def test_pickle(self):
+        """Test columnar experiments can be pickled and copied."""
+        columnar = ColumnarQasmQobjExperiment.from_experiment(self.experiment)
+        self.assertEqual(pickle.loads(pickle.dumps(columnar)), columnar)
+        self.assertEqual(copy.deepcopy(columnar), columnar)
+
+    def test_validate(self):
+        """Test columnar experiments are only validated on demand."""
+        columnar = ColumnarQasmQobjExperiment(instructions=[{'name': 'u1', 'qubits': [-1]}])
+        with self.assertRaises(ModelValidationError):
+            columnar.validate()
+
+        columnar = ColumnarQasmQobjExperiment(instructions=[{'name': 'u1', 'conditional': 'a'}])
+        with self.assertRaises(ModelValidationError):
+            columnar.to_experiment()
+
+        columnar = ColumnarQasmQobjExperiment.from_experiment(self.experiment)
+        columnar.validate()
+        self.assertEqual(columnar.to_experiment(), self.experiment)
+
+
+class TestAssembleColumnar(QiskitTestCase):
+    """Tests for assembling circuits into columnar experiments."""
+
+    def test_assemble_columnar(self):
+        """Test a columnar qobj serializes like the qobj of the same circuits."""
+        circuit = _make_circuit()
+        qobj = assemble(circuit, qobj_id='test')
+        columnar_qobj = assemble(circuit, qobj_id='test', columnar=True)
+        self.assertIsInstance(columnar_qobj.experiments[0], ColumnarQasmQobjExperiment)
+        self.assertEqual(columnar_qobj.to_dict(), qobj.to_dict())
+        self.assertEqual(QasmQobj.from_dict(columnar_qobj.to_dict()), qobj)
+        validate_qobj_against_schema(columnar_qobj)
+
+    def test_assemble_columnar_binds(self):
+        """Test binding parameters into columnar experiments."""
+        theta = Parameter('theta')
+        circuit = QuantumCircuit(1, 1)
+        circuit.rz(theta, 0)
+        circuit.u3(theta, 2 * theta, 0.5, 0)
+        circuit.measure(0, 0)
+
+        binds = [{theta: 0.1}, {theta: 0.2}]
+        qobj = assemble(circuit, parameter_binds=binds, qobj_id='test')
+        columnar_qobj = assemble(circuit, parameter_binds=binds, qobj_id='test', columnar=True)
+        self.assertEqual(columnar_qobj.to_dict(), qobj.to_dict())
+        self.assertEqual(columnar_qobj.experiments[1].instruction(1).params, [0.2, 0.4, 0.5])
+
+    def test_run_columnar(self):
+        """Test BasicAer runs columnar experiments."""
+        backend = BasicAer.get_backend('qasm_simulator')
+        circuit = transpile(_make_circuit(), backend)
+        counts = backend.run(assemble(circuit, seed_simulator=42)).result().get_counts()
+        columnar_counts = backend.run(assemble(circuit, seed_simulator=42, columnar=True)
+                                      ).result().get_counts()
+        self.assertEqual(columnar_counts, counts)
@@ -15,6 +15,7 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
 
 import networkx as nx
@@ -129,7 +130,7 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(h_node.condition, h_gate.control)
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.in_edges(h_node, data=True)),
+            sorted(self.dag.in_edges(h_node)),
             sorted([
                 (self.dag.input_map[self.qubit2], h_node,
                  {'wire': Qubit(*self.qubit2), 'name': 'qr[2]'}),
@@ -140,7 +141,7 @@ class TestDagOperations(QiskitTestCase):
             ]))
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.out_edges(h_node, data=True)),
+            sorted(self.dag.out_edges(h_node)),
             sorted([
                 (h_node, self.dag.output_map[self.qubit2],
                  {'wire': Qubit(*self.qubit2), 'name': 'qr[2]'}),
@@ -150,7 +151,7 @@ class TestDagOperations(QiskitTestCase):
                  {'wire': Clbit(*self.clbit1), 'name': 'cr[1]'}),
             ]))
 
-        self.assertTrue(nx.is_directed_acyclic_graph(self.dag._multi_graph))
+        self.assertTrue(nx.is_directed_acyclic_graph(self.dag.to_networkx()))
 
     def test_apply_operation_back_conditional_measure(self):
         """Test consistency of apply_operation_back for conditional measure."""
@@ -171,7 +172,7 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(meas_node.condition, meas_gate.control)
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.in_edges(meas_node, data=True)),
+            sorted(self.dag.in_edges(meas_node)),
             sorted([
                 (self.dag.input_map[self.qubit0], meas_node,
                  {'wire': Qubit(*self.qubit0), 'name': 'qr[0]'}),
@@ -182,7 +183,7 @@ class TestDagOperations(QiskitTestCase):
             ]))
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.out_edges(meas_node, data=True)),
+            sorted(self.dag.out_edges(meas_node)),
             sorted([
                 (meas_node, self.dag.output_map[self.qubit0],
                  {'wire': Qubit(*self.qubit0), 'name': 'qr[0]'}),
@@ -192,7 +193,7 @@ class TestDagOperations(QiskitTestCase):
                  {'wire': Clbit(new_creg, 0), 'name': 'cr2[0]'}),
             ]))
 
-        self.assertTrue(nx.is_directed_acyclic_graph(self.dag._multi_graph))
+        self.assertTrue(nx.is_directed_acyclic_graph(self.dag.to_networkx()))
 
     def test_apply_operation_back_conditional_measure_to_self(self):
         """Test consistency of apply_operation_back for measure onto conditioning bit."""
@@ -210,7 +211,7 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(meas_node.condition, meas_gate.control)
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.in_edges(meas_node, data=True)),
+            sorted(self.dag.in_edges(meas_node)),
             sorted([
                 (self.dag.input_map[self.qubit1], meas_node,
                  {'wire': Qubit(*self.qubit1), 'name': 'qr[1]'}),
@@ -221,7 +222,7 @@ class TestDagOperations(QiskitTestCase):
             ]))
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.out_edges(meas_node, data=True)),
+            sorted(self.dag.out_edges(meas_node)),
             sorted([
                 (meas_node, self.dag.output_map[self.qubit1],
                  {'wire': Qubit(*self.qubit1), 'name': 'qr[1]'}),
@@ -231,7 +232,7 @@ class TestDagOperations(QiskitTestCase):
                  {'wire': Clbit(*self.clbit1), 'name': 'cr[1]'}),
             ]))
 
-        self.assertTrue(nx.is_directed_acyclic_graph(self.dag._multi_graph))
+        self.assertTrue(nx.is_directed_acyclic_graph(self.dag.to_networkx()))
 
     def test_apply_operation_front(self):
         """The apply_operation_front() method"""
@@ -405,6 +406,31 @@ class TestDagOperations(QiskitTestCase):
                     ('h', [self.qubit2])]
         self.assertEqual(expected, [(i.name, i.qargs) for i in named_nodes])
 
+    def test_topological_order_after_mutations(self):
+        """The cached topological order is updated by mutations of the dag."""
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        h_node = self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit2, self.qubit1], [])
+        list(self.dag.topological_nodes())
+
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit2], [])
+        self.dag.remove_op_node(h_node)
+        self.dag.apply_operation_front(XGate(), [self.qubit2], [])
+        self.dag.apply_operation_back(HGate(), [self.qubit2], [])
+
+        uncached = copy.deepcopy(self.dag)
+        uncached._topological_order = None
+
+        self.assertEqual([nd._node_id for nd in uncached.topological_nodes()],
+                         [nd._node_id for nd in self.dag.topological_nodes()])
+        expected = [('cx', [self.qubit0, self.qubit1]),
+                    ('x', [self.qubit2]),
+                    ('cx', [self.qubit2, self.qubit1]),
+                    ('cx', [self.qubit0, self.qubit2]),
+                    ('h', [self.qubit2])]
+        self.assertEqual(expected,
+                         [(i.name, i.qargs) for i in self.dag.topological_op_nodes()])
+
     def test_dag_nodes_on_wire(self):
         """Test that listing the gates on a qubit/classical bit gets the correct gates"""
         self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
@@ -478,6 +504,31 @@ class TestDagOperations(QiskitTestCase):
         in_node = next(self.dag.topological_nodes())
         self.assertRaises(DAGCircuitError, self.dag.remove_op_node, in_node)
 
+    def test_remove_op_node_keeps_node_ids(self):
+        """Removing a node leaves the ids of the other nodes and the wire links intact."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        cx_node = self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1])
+        x_node = self.dag.apply_operation_back(XGate(), [self.qubit1])
+
+        self.dag.remove_op_node(cx_node)
+
+        self.assertIs(self.dag.node(x_node._node_id), x_node)
+        self.assertIsNone(self.dag.node(cx_node._node_id))
+        # An input and an output node per wire, and the h and x nodes
+        self.assertEqual(self.dag.node_counter, 2 * len(self.dag.wires) + 2)
+        self.assertEqual([self.dag.input_map[self.qubit1]], list(self.dag.predecessors(x_node)))
+        self.assertEqual(['h'], [nd.name for nd in
+                                 self.dag.nodes_on_wire(self.qubit0, only_ops=True)])
+
+    def test_remove_node_from_other_dag(self):
+        """Nodes that do not belong to the dag are rejected instead of aliased by id."""
+        other = DAGCircuit()
+        other.add_qreg(QuantumRegister(3, 'qr'))
+        other_node = other.apply_operation_back(HGate(), [self.qubit0])
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+
+        self.assertRaises(DAGCircuitError, self.dag.remove_op_node, other_node)
+
     def test_dag_collect_runs(self):
         """Test the collect_runs method with 3 different gates."""
         self.dag.apply_operation_back(U1Gate(3.14), [self.qubit0])
@@ -595,6 +646,55 @@ class TestDagLayers(QiskitTestCase):
             comp = [(nd.type, nd.name, nd._node_id) for nd in d1.topological_nodes()]
             self.assertEqual(comp, truth)
 
+    def test_op_node_layers(self):
+        """op_node_layers() returns the op nodes and partitions of layers()."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(2, 'cr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.add_creg(creg)
+        dag.apply_operation_back(HGate(), [qreg[0]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[1], qreg[2]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+        dag.apply_operation_back(Barrier(3), [qreg[0], qreg[1], qreg[2]], [])
+        dag.apply_operation_back(Measure(), [qreg[0]], [creg[0]])
+        dag.apply_operation_back(XGate(), [qreg[2]], [], condition=(creg, 1))
+
+        op_node_layers = list(dag.op_node_layers())
+        layers = list(dag.layers())
+        self.assertEqual(len(op_node_layers), len(layers))
+        for op_node_layer, layer in zip(op_node_layers, layers):
+            self.assertEqual(op_node_layer['partition'], layer['partition'])
+            self.assertEqual([node.name for node in op_node_layer['nodes']],
+                             [node.name for node in layer['graph'].op_nodes()])
+            for node in op_node_layer['nodes']:
+                self.assertIs(dag.node(node._node_id), node)
+
+        self.assertEqual([['h', 'cx'], ['cx'], ['barrier'], ['measure'], ['x']],
+                         [[node.name for node in op_node_layer['nodes']]
+                          for op_node_layer in op_node_layers])
+        self.assertEqual([], op_node_layers[2]['partition'])
+
+        topological_ids = [node._node_id for node in dag.topological_op_nodes()]
+        for op_node_layer in op_node_layers:
+            layer_ids = [node._node_id for node in op_node_layer['nodes']]
+            self.assertEqual(layer_ids, sorted(layer_ids, key=topological_ids.index))
+
+    def test_serial_op_node_layers(self):
+        """serial_op_node_layers() returns one op node of the dag per layer."""
+        qreg = QuantumRegister(2, 'qr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.apply_operation_back(HGate(), [qreg[0]], [])
+        dag.apply_operation_back(Barrier(2), [qreg[0], qreg[1]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+
+        layers = list(dag.serial_op_node_layers())
+        self.assertEqual([layer['nodes'] for layer in layers],
+                         [[node] for node in dag.topological_op_nodes()])
+        self.assertEqual([layer['partition'] for layer in layers],
+                         [layer['partition'] for layer in dag.serial_layers()])
+
 
 class TestCircuitProperties(QiskitTestCase):
     """DAGCircuit properties test."""
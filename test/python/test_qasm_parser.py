@@ -15,10 +15,13 @@
 """Test for the QASM parser"""
 
 import unittest
+from unittest.mock import patch
+
 import ply
 
 from qiskit.qasm import Qasm, QasmError
 from qiskit.qasm.node.node import Node
+from qiskit.qasm.qasmparser import QasmParser
 from qiskit.test import QiskitTestCase, Path
 
 
@@ -82,6 +85,22 @@ class TestParser(QiskitTestCase):
         for token in qasm.get_tokens():
             self.assertTrue(isinstance(token, ply.lex.LexToken))
 
+    def test_parse_tables_cached(self):
+        """Test the parse tables are not generated again for new parsers."""
+        QasmParser(None)
+        with patch.object(ply.yacc, 'LRGeneratedTable') as mock_table:
+            res = parse(self.qasm_file_path)
+        mock_table.assert_not_called()
+        self.assertEqual(len(res), 1563)
+
+    def test_parsers_independent(self):
+        """Test parsers built from the cached tables do not share state."""
+        self.assertRaises(QasmError, parse, file_path=self.qasm_file_path_fail)
+        qasm = Qasm(data='OPENQASM 2.0;\nqreg q[1];\nU(0,0,0) q[0];\n')
+        self.assertEqual(qasm.parse().qasm(),
+                         'OPENQASM 2.0;\nqreg q[1];\nU(0,0,0) q[0];\n')
+        self.assertEqual(parse(self.qasm_file_path), parse(self.qasm_file_path))
+
 
 if __name__ == '__main__':
     unittest.main()
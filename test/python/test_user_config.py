@@ -88,12 +88,68 @@ class TestUserConfig(QiskitTestCase):
             self.assertEqual({'transpile_optimization_level': 1},
                              config.settings)
 
+    def test_invalid_parallel_executor(self):
+        test_config = """
+        [default]
+        parallel_executor = gpu
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, 'w') as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            self.assertRaises(exceptions.QiskitUserConfigError,
+                              config.read_config_file)
+
+    def test_parallel_executor_valid(self):
+        test_config = """
+        [default]
+        parallel_executor = thread
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, 'w') as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            config.read_config_file()
+            self.assertEqual({'parallel_executor': 'thread'},
+                             config.settings)
+
+    def test_invalid_validation_policy(self):
+        test_config = """
+        [default]
+        validation_policy = never
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, 'w') as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            self.assertRaises(exceptions.QiskitUserConfigError,
+                              config.read_config_file)
+
+    def test_validation_policy_valid(self):
+        test_config = """
+        [default]
+        validation_policy = lazy
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, 'w') as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            config.read_config_file()
+            self.assertEqual({'validation_policy': 'lazy'},
+                             config.settings)
+
     def test_all_options_valid(self):
         test_config = """
         [default]
         circuit_drawer = latex
         circuit_mpl_style = default
         transpile_optimization_level = 3
+        parallel_executor = serial
+        validation_policy = off
         """
         self.addCleanup(os.remove, self.file_path)
         with open(self.file_path, 'w') as file:
@@ -103,4 +159,6 @@ class TestUserConfig(QiskitTestCase):
             config.read_config_file()
             self.assertEqual({'circuit_drawer': 'latex',
                               'circuit_mpl_style': 'default',
-                              'transpile_optimization_level': 3}, config.settings)
+                              'transpile_optimization_level': 3,
+                              'parallel_executor': 'serial',
+                              'validation_policy': 'off'}, config.settings)
@@ -13,11 +13,17 @@
 # that they have been altered from the originals.
 
 """Tests for qiskit/tools/parallel"""
+import math
 import os
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
 
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools import parallel
+from qiskit.tools.parallel import parallel_map, parallel_imap
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
@@ -28,6 +34,60 @@ def _parfunc(x):
     return x
 
 
+def _add(x, y, z=0):
+    """Function with extra arguments for testing parallel_map
+    """
+    return x + y + z
+
+
+def _raise_on_three(x):
+    """Function that fails for one value
+    """
+    if x == 3:
+        raise ValueError('three')
+    return x
+
+
+def _nested(x):
+    """Function calling parallel_map for testing nested calls
+    """
+    return parallel_map(_add, list(range(x)), task_args=(x,), num_processes=2)
+
+
+def _executor_name(_):
+    """Function returning the executor of nested parallel_map calls
+    """
+    return parallel._resolve_executor(None)  # pylint: disable=protected-access
+
+
+def _nested_pids(_):
+    """Function returning the processes running a nested parallel_map call
+    """
+    return parallel_map(_pid, list(range(4)), num_processes=2)
+
+
+def _pid(_):
+    """Function returning the process it runs in
+    """
+    return os.getpid()
+
+
+def _fail_in_worker(parent_pid):
+    """Function that fails when it is called in another process
+    """
+    if os.getpid() != parent_pid:
+        raise ValueError('not the parent process')
+    return parent_pid
+
+
+class _FailsToUnpickle:
+    """Value that cannot be unpickled by worker processes
+    """
+
+    def __reduce__(self):
+        return _fail_in_worker, (os.getpid(),)
+
+
 def _build_simple(_):
     qreg = QuantumRegister(2)
     creg = ClassicalRegister(2)
@@ -53,3 +113,109 @@ class TestParallel(QiskitTestCase):
         out_circs = parallel_map(_build_simple, list(range(10)))
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
+
+    def test_parallel_chunksize_and_args(self):
+        """Verify results keep their order with chunks and extra arguments"""
+        ans = parallel_map(_add, list(range(100)), task_args=(1,),
+                           task_kwargs={'z': 2}, num_processes=2, chunksize=7)
+        self.assertEqual(ans, [x + 3 for x in range(100)])
+
+    def test_parallel_imap(self):
+        """Verify parallel_imap yields the results in order"""
+        results = parallel_imap(_add, list(range(20)), task_args=(5,), num_processes=2)
+        self.assertEqual(list(results), [x + 5 for x in range(20)])
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_parallel_pool_is_reused(self):
+        """Verify the worker pool is kept between calls"""
+        parallel_map(_add, [1, 2, 3], task_args=(1,), num_processes=2)
+        pool = parallel._POOL  # pylint: disable=protected-access
+        parallel_map(_add, [1, 2, 3], task_args=(1,), num_processes=2)
+        self.assertIsNotNone(pool)
+        self.assertIs(parallel._POOL, pool)  # pylint: disable=protected-access
+
+    def test_parallel_main_class_defined_after_pool(self):
+        """Verify values of a class defined in __main__ after the pool started"""
+        parallel_map(math.sqrt, list(range(4)), num_processes=2)
+        main = sys.modules['__main__']
+        payload = type('Payload', (), {'__module__': '__main__',
+                                       '__repr__': lambda self: 'payload'})
+        setattr(main, 'Payload', payload)
+        self.addCleanup(delattr, main, 'Payload')
+        ans = parallel_map(repr, [payload(), payload()], num_processes=2)
+        self.assertEqual(ans, ['payload', 'payload'])
+
+    def test_parallel_unpickling_error(self):
+        """Verify values that the workers cannot unpickle raise"""
+        with self.assertRaises(ValueError):
+            parallel_map(_add, [_FailsToUnpickle(), 1, 2], task_args=(1,), num_processes=2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_parallel_task_error(self):
+        """Verify errors in the task are raised and the pool stays usable"""
+        with self.assertRaises(ValueError):
+            parallel_map(_raise_on_three, list(range(10)), num_processes=2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+        ans = parallel_map(_raise_on_three, [0, 1, 2], num_processes=2)
+        self.assertEqual(ans, [0, 1, 2])
+
+    def test_parallel_thread_executor(self):
+        """Verify the thread executor"""
+        ans = parallel_map(_add, list(range(50)), task_args=(1,),
+                           num_processes=2, executor='thread')
+        self.assertEqual(ans, [x + 1 for x in range(50)])
+
+    def test_parallel_serial_executor(self):
+        """Verify the serial executor"""
+        ans = parallel_map(_add, list(range(10)), task_args=(1,), executor='serial')
+        self.assertEqual(ans, [x + 1 for x in range(10)])
+
+    def test_parallel_futures_executor(self):
+        """Verify a concurrent.futures executor passed by the caller"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ans = parallel_map(_add, list(range(10)), task_args=(1,),
+                               chunksize=3, executor=executor)
+        self.assertEqual(ans, [x + 1 for x in range(10)])
+
+    def test_parallel_nested_calls_share_executor(self):
+        """Verify nested calls run on the executor of the outer call"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            names = parallel_map(_executor_name, list(range(4)), executor=executor)
+            self.assertEqual(names, [executor] * 4)
+            # Nested calls must not deadlock when all the workers are busy
+            ans = parallel_map(_nested, list(range(2, 8)), executor=executor)
+        self.assertEqual(ans, [[x + y for y in range(x)] for x in range(2, 8)])
+
+    def test_parallel_nested_calls_in_process_run_serially(self):
+        """Verify nested calls in a worker process run serially"""
+        names = parallel_map(_executor_name, list(range(4)), num_processes=2,
+                             executor='process')
+        self.assertEqual(names, ['serial'] * 4)
+
+    def test_parallel_nested_calls_in_process_executor_run_serially(self):
+        """Verify nested calls in a worker of a process executor run serially"""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            names = parallel_map(_executor_name, list(range(4)), executor=executor)
+            pids = parallel_map(_nested_pids, list(range(4)), chunksize=1, executor=executor)
+        self.assertEqual(names, ['serial'] * 4)
+        for nested_pids in pids:
+            self.assertEqual(len(set(nested_pids)), 1)
+            self.assertNotEqual(nested_pids[0], os.getpid())
+
+    def test_parallel_executor_env(self):
+        """Verify the executor can be selected with an env var"""
+        with mock.patch.dict(os.environ, {'QISKIT_PARALLEL_EXECUTOR': 'thread'}):
+            self.assertEqual(
+                parallel._resolve_executor(None), 'thread')  # pylint: disable=protected-access
+
+    def test_parallel_executor_user_config(self):
+        """Verify the executor can be selected in the user config"""
+        with mock.patch('qiskit.user_config.get_config',
+                        return_value={'parallel_executor': 'serial'}):
+            self.assertEqual(
+                parallel._resolve_executor(None), 'serial')  # pylint: disable=protected-access
+
+    def test_parallel_invalid_executor(self):
+        """Verify an invalid executor raises"""
+        with self.assertRaises(QiskitError):
+            parallel_map(_add, [1, 2], task_args=(1,), executor='gpu')
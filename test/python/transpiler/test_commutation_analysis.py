@@ -16,10 +16,15 @@
 """Commutation analysis and transformation pass testing"""
 
 import unittest
+from unittest.mock import patch
+
+import numpy as np
 
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.quantum_info import Operator
 from qiskit.transpiler import PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis
+from qiskit.transpiler.passes import commutation_analysis
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 
@@ -286,6 +291,59 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[9], [13, 16, 19], [10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_pauli_types(self):
+        """Test the gates commuting by rules commute with their Pauli operators"""
+        paulis = {'X': np.array([[0, 1], [1, 0]]),
+                  'Y': np.array([[0, -1j], [1j, 0]]),
+                  'Z': np.array([[1, 0], [0, -1]])}
+        for gate_class, pauli_types in commutation_analysis._PAULI_TYPES.items():
+            num_params = gate_class.__init__.__code__.co_argcount - 1
+            gate = gate_class(*[0.3] * num_params)
+            for qubit, pauli_type in enumerate(pauli_types):
+                pauli = Operator(np.eye(2 ** len(pauli_types))).compose(paulis[pauli_type],
+                                                                        qargs=[qubit])
+                with self.subTest(gate=gate.name, qubit=qubit):
+                    self.assertEqual(Operator(gate).compose(pauli),
+                                     pauli.compose(Operator(gate)))
+
+    def test_cache(self):
+        """Test the commutation of gates checked by matrices is cached across runs"""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[0])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+        expected = self.pset['commutation_set']['qr[0]']
+        self.assertEqual(len(self.pass_.cache), 4)
+
+        with patch.object(commutation_analysis, '_commute_by_matrices') as mock_matrices:
+            self.pass_.run(dag)
+        mock_matrices.assert_not_called()
+        self.assertEqual(self.pset['commutation_set']['qr[0]'], expected)
+
+    def test_cache_size(self):
+        """Test the cache is cleared when it is full"""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        for i in range(10):
+            circuit.cx(qr[0], qr[1])
+            circuit.u3(0.1 * i, 0.2, 0.3, qr[0])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+        expected = self.pset['commutation_set']['qr[0]']
+        with patch.object(commutation_analysis, '_CACHE_SIZE', 3):
+            self.pass_.cache.clear()
+            self.pass_.run(dag)
+        self.assertLessEqual(len(self.pass_.cache), 3)
+        self.assertEqual(self.pset['commutation_set']['qr[0]'], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,8 @@
 
 # pylint: disable=missing-docstring
 
+import pickle
+
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.exceptions import CouplingError
 from qiskit.test.mock import FakeRueschlikon
@@ -69,6 +71,50 @@ class CouplingTest(QiskitTestCase):
         graph.add_physical_qubit(1)
         self.assertRaises(CouplingError, graph.distance, 0, 1)
 
+    def test_shortest_undirected_path(self):
+        coupling = CouplingMap([[0, 1], [2, 1], [2, 3], [0, 4], [4, 3]])
+        self.assertEqual([1, 2], coupling.shortest_undirected_path(1, 2))
+        self.assertEqual([3, 2, 1], coupling.shortest_undirected_path(3, 1))
+        self.assertEqual([1], coupling.shortest_undirected_path(1, 1))
+
+    def test_shortest_undirected_path_error(self):
+        """Test shortest path between unconnected physical_qubits."""
+        coupling = CouplingMap([[0, 1]])
+        coupling.add_physical_qubit(2)
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 2)
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 3)
+        # The distances are still checked for connectivity after a path
+        self.assertRaises(CouplingError, coupling.distance, 0, 2)
+        self.assertRaises(CouplingError, coupling.distance, 0, 1)
+
+    def test_distance_matrix(self):
+        coupling = CouplingMap([[0, 1], [1, 2], [3, 2]])
+        self.assertEqual(coupling.distance_matrix.tolist(),
+                         [[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]])
+
+    def test_distance_matrix_shared(self):
+        """Test coupling maps with the same edges share their distance matrix."""
+        coupling1 = CouplingMap([[0, 1], [1, 2]])
+        coupling2 = CouplingMap([[2, 1], [1, 0]])
+        self.assertIs(coupling1.distance_matrix, coupling2.distance_matrix)
+        self.assertIs(coupling1.next_hop_matrix, coupling2.next_hop_matrix)
+
+    def test_distance_matrix_add_edge(self):
+        """Test adding an edge updates the distance matrix."""
+        coupling = CouplingMap([[0, 1], [1, 2]])
+        self.assertEqual(2, coupling.distance(0, 2))
+        coupling.add_edge(2, 0)
+        self.assertEqual(1, coupling.distance(0, 2))
+        self.assertEqual([0, 2], coupling.shortest_undirected_path(0, 2))
+
+    def test_pickle(self):
+        coupling = CouplingMap(FakeRueschlikon().configuration().coupling_map)
+        coupling.distance(0, 1)
+        unpickled = pickle.loads(pickle.dumps(coupling))
+        self.assertEqual(coupling.get_edges(), unpickled.get_edges())
+        self.assertEqual(coupling.physical_qubits, unpickled.physical_qubits)
+        self.assertEqual(coupling.distance(0, 8), unpickled.distance(0, 8))
+
     def test_init_with_couplinglist(self):
         coupling_list = [[0, 1], [1, 2]]
         coupling = CouplingMap(coupling_list)
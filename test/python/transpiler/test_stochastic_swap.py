@@ -14,8 +14,12 @@
 
 """Test the Stochastic Swap pass"""
 
+from functools import partial
 import unittest
+from unittest.mock import patch
+
 from qiskit.transpiler.passes import StochasticSwap
+from qiskit.transpiler.passes.mapping import stochastic_swap
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
@@ -511,6 +515,45 @@ class TestStochasticSwap(QiskitTestCase):
         with self.assertRaises(TranspilerError):
             _ = pass_.run(dag)
 
+    @staticmethod
+    def _ring_problem():
+        """Return a 5-qubit ring and a DAG of cx between its non-adjacent qubits."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [4, 0]])
+        qr = QuantumRegister(5, 'q')
+        circuit = QuantumCircuit(qr)
+        for i in range(5):
+            circuit.cx(qr[i], qr[(i + 2) % 5])
+            circuit.cx(qr[i], qr[(i + 3) % 5])
+        return coupling, circuit_to_dag(circuit)
+
+    def test_num_seeds(self):
+        """Test the best of the mappings with several seeds is returned."""
+        coupling, dag = self._ring_problem()
+
+        with patch.object(stochastic_swap, 'parallel_map',
+                          wraps=stochastic_swap.parallel_map) as mock_map:
+            after = StochasticSwap(coupling, 20, 13, num_seeds=4).run(dag)
+        seeds = mock_map.call_args[0][1]
+        self.assertEqual(len(seeds), 4)
+        self.assertEqual(seeds[0], 13)
+
+        mapped = [StochasticSwap(coupling, 20, seed).run(dag) for seed in seeds]
+        best = min(mapped, key=lambda mapped_dag: (mapped_dag.depth(), mapped_dag.size()))
+        self.assertEqual(after, best)
+
+    def test_num_seeds_in_processes(self):
+        """Test the mappings with several seeds in worker processes give the serial result."""
+        coupling, dag = self._ring_problem()
+
+        with patch.object(stochastic_swap, 'parallel_map',
+                          partial(stochastic_swap.parallel_map, executor='serial')):
+            expected = StochasticSwap(coupling, 20, 13, num_seeds=4).run(dag)
+        with patch.object(stochastic_swap, 'parallel_map',
+                          partial(stochastic_swap.parallel_map, num_processes=2,
+                                  executor='process')):
+            after = StochasticSwap(coupling, 20, 13, num_seeds=4).run(dag)
+        self.assertEqual(after, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
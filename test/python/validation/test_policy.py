@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Validation policy tests."""
+
+from unittest.mock import patch
+
+import numpy as np
+from marshmallow.validate import Range
+
+from qiskit import BasicAer, QuantumCircuit, execute
+from qiskit.compiler import assemble
+from qiskit.exceptions import QiskitError
+from qiskit.providers.models import BackendConfiguration, BackendProperties
+from qiskit.qobj import QasmQobj, QasmQobjInstruction, validate_qobj_against_schema
+from qiskit.qobj import utils as qobj_utils
+from qiskit.validation import (fields, get_validation_policy, set_validation_policy,
+                               validation_policy)
+from qiskit.validation.base import BaseModel, BaseSchema, bind_schema
+from qiskit.validation.exceptions import ModelValidationError
+from qiskit.validation.policy import fingerprint, is_validated, mark_validated
+from qiskit.result import Result
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeTokyo
+
+
+class PersonSchema(BaseSchema):
+    """Example Person schema."""
+    name = fields.String(required=True)
+    age = fields.Integer(validate=Range(min=0))
+
+
+class BookSchema(BaseSchema):
+    """Example Book schema."""
+    title = fields.String(required=True)
+    authors = fields.List(fields.Nested(PersonSchema), required=True)
+
+
+@bind_schema(PersonSchema)
+class Person(BaseModel):
+    """Example Person model."""
+    pass
+
+
+@bind_schema(BookSchema)
+class Book(BaseModel):
+    """Example Book model."""
+    pass
+
+
+class TestValidationPolicy(QiskitTestCase):
+    """Tests for the validation policies."""
+
+    def test_context_manager(self):
+        """Test the policy is set for the block and restored after it."""
+        policy = get_validation_policy()
+        with validation_policy('off'):
+            self.assertEqual(get_validation_policy(), 'off')
+            with validation_policy('lazy'):
+                self.assertEqual(get_validation_policy(), 'lazy')
+            self.assertEqual(get_validation_policy(), 'off')
+        self.assertEqual(get_validation_policy(), policy)
+
+    def test_set_policy(self):
+        """Test setting the policy of the process."""
+        policy = get_validation_policy()
+        self.addCleanup(set_validation_policy, policy)
+        set_validation_policy('lazy')
+        self.assertEqual(get_validation_policy(), 'lazy')
+        with patch.dict('os.environ', {'QISKIT_VALIDATION_POLICY': 'off'}):
+            set_validation_policy(None)
+        self.assertEqual(get_validation_policy(), 'off')
+
+    def test_invalid_policy(self):
+        """Test invalid policies raise."""
+        with self.assertRaises(QiskitError):
+            with validation_policy('never'):
+                pass
+        self.assertRaises(QiskitError, set_validation_policy, 'never')
+
+    def test_eager(self):
+        """Test models are validated on creation with the eager policy."""
+        with validation_policy('eager'):
+            self.assertRaises(ModelValidationError, Person, name=1)
+            self.assertRaises(ModelValidationError, Person.from_dict,
+                              {'name': 'Foo', 'age': -1})
+
+    def test_lazy(self):
+        """Test models are validated on serialization with the lazy policy."""
+        with validation_policy('lazy'):
+            person = Person(name=1)
+            self.assertRaises(ModelValidationError, person.to_dict)
+            book = Book(title='Foo', authors=[Person(name=1)])
+            self.assertRaises(ModelValidationError, book.to_dict)
+            person = Person.from_dict({'name': 'Foo', 'age': -1})
+            self.assertRaises(ModelValidationError, person.to_dict)
+
+    def test_off(self):
+        """Test models are not validated with the off policy."""
+        with validation_policy('off'):
+            person = Person(name='Foo', age=-1)
+            self.assertEqual(person.to_dict(), {'name': 'Foo', 'age': -1})
+            person = Person.from_dict({'name': 'Foo', 'age': -1})
+            self.assertEqual(person.age, -1)
+
+    def test_from_dict_without_validation(self):
+        """Test loading without validation builds the same models."""
+        data = {'title': 'Foo', 'authors': [{'name': 'Bar', 'age': 42}], 'extra': [1]}
+        book = Book.from_dict(data)
+        for policy in ('lazy', 'off'):
+            with validation_policy(policy):
+                loaded = Book.from_dict(data)
+                self.assertEqual(loaded, book)
+                self.assertIsInstance(loaded.authors[0], Person)
+                self.assertEqual(loaded.to_dict(), data)
+
+    def test_from_dict_without_validation_models(self):
+        """Test loading the Qiskit models without validation round-trips them."""
+        backend = FakeTokyo()
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+        result = execute(circuit, BasicAer.get_backend('qasm_simulator'), shots=16).result()
+        models = [(BackendProperties, backend.properties()),
+                  (BackendConfiguration, backend.configuration()),
+                  (Result, result),
+                  (QasmQobj, assemble(circuit, backend))]
+        for model_cls, model in models:
+            data = model.to_dict()
+            for policy in ('lazy', 'off'):
+                with self.subTest(model=model_cls.__name__, policy=policy):
+                    with validation_policy(policy):
+                        loaded = model_cls.from_dict(data)
+                    self.assertIsInstance(loaded, model_cls)
+                    self.assertEqual(loaded.to_dict(), data)
+
+
+class TestValidationMemo(QiskitTestCase):
+    """Tests for the memo of validated objects."""
+
+    def test_memo(self):
+        """Test objects are validated until they are modified."""
+        book = Book(title='Foo', authors=[Person(name='Bar')])
+        self.assertFalse(is_validated(book, 'schema'))
+        mark_validated(book, 'schema')
+        self.assertTrue(is_validated(book, 'schema'))
+        self.assertFalse(is_validated(book, 'jsonschema'))
+
+        book.authors[0].name = 'Baz'
+        self.assertFalse(is_validated(book, 'schema'))
+
+    def test_fingerprint(self):
+        """Test the fingerprint follows the contents of models."""
+        self.assertEqual(fingerprint(Person(name='Foo', age=1)),
+                         fingerprint(Person(name='Foo', age=1)))
+        self.assertNotEqual(fingerprint(Person(name='Foo', age=1)),
+                            fingerprint(Person(name='Foo', age=2)))
+        self.assertNotEqual(fingerprint([1, [2]]), fingerprint([[1], 2]))
+        self.assertNotEqual(fingerprint(np.zeros(2, dtype=np.int32)),
+                            fingerprint(np.zeros(1, dtype=np.int64)))
+        self.assertNotEqual(fingerprint(np.zeros((2, 3))), fingerprint(np.zeros((3, 2))))
+
+    def test_lazy_memo(self):
+        """Test a model is not validated again on serialization."""
+        with validation_policy('lazy'):
+            book = Book(title='Foo', authors=[Person(name='Bar')])
+            book.to_dict()
+            with patch.object(Book.schema, 'validate') as mock_validate:
+                book.to_dict()
+                mock_validate.assert_not_called()
+                book.authors[0].name = 'Baz'
+                book.to_dict()
+                mock_validate.assert_called_once()
+
+    def test_qobj_memo(self):
+        """Test a qobj is not validated against the JSON schema again."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        qobj = assemble(circuit)
+        validate_qobj_against_schema(qobj)
+        with patch.object(qobj_utils, 'validate_json_against_schema') as mock_validate:
+            validate_qobj_against_schema(qobj)
+            mock_validate.assert_not_called()
+            qobj.experiments[0].instructions.append(QasmQobjInstruction(name='barrier'))
+            validate_qobj_against_schema(qobj)
+            mock_validate.assert_called_once()
+            with validation_policy('off'):
+                qobj.experiments[0].instructions.pop()
+                validate_qobj_against_schema(qobj)
+            mock_validate.assert_called_once()